@@ -4,18 +4,33 @@ Ez a fájl automatikusan betöltődik minden test futtatáskor
 """
 
 import pytest
-import allure
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
 import json
 import os
+import time
 from datetime import datetime
 
+from utils.command_counter import instrument_driver
+
+# A böngésző-specifikus Selenium / webdriver_manager modulok és az allure csak a
+# használat helyén töltődnek be, hogy a gyűjtés (pl. --collect-only, -k) gyors maradjon.
+
+
+# Saját pytest pluginok (a collection_profile az első, hogy a többi plugin importja is mérődjön)
+pytest_plugins = [
+    "utils.collection_profile",
+    "utils.perf_history",
+    "utils.cassette",
+    "utils.reporting",
+    "utils.allure_writer",
+    "utils.nav_metrics",
+    "utils.event_wait",
+    "utils.locator_profiler",
+    "utils.site_proxy",
+    "utils.impact",
+    "utils.smart_retry",
+    "utils.pairwise",
+]
+
 
 # ===== PYTEST CONFIGURATION =====
 
@@ -36,6 +51,13 @@ def pytest_addoption(parser):
         default=False,
         help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--backend",
+        action="store",
+        default="real",
+        choices=("real", "fake"),
+        help="WebDriver backend: real browser or in-process fake (no browser process)"
+    )
     parser.addoption(
         "--base-url",
         action="store",
@@ -44,6 +66,12 @@ def pytest_addoption(parser):
     )
 
 
+def pytest_configure(config):
+    """A tesztekben használt saját markerek regisztrálása"""
+    for marker in ("smoke", "critical", "regression", "login", "ui", "fast", "medium"):
+        config.addinivalue_line("markers", marker)
+
+
 # ===== WEBDRIVER FIXTURES =====
 
 @pytest.fixture(scope="session")
@@ -55,50 +83,111 @@ def browser_config(request):
     return {
         "browser": request.config.getoption("--browser"),
         "headless": request.config.getoption("--headless"),
-        "base_url": request.config.getoption("--base-url")
+        "base_url": request.config.getoption("--base-url"),
+        "backend": request.config.getoption("--backend")
     }
 
 
+@pytest.fixture(scope="session")
+def site_proxy(request):
+    """
+    Session scope fixture - cache-elő HTTP proxy az oldal forgalmához (--site-proxy)
+    None, ha a proxy nincs bekapcsolva
+    """
+    from utils.site_proxy import start_session_proxy, stop_session_proxy
+
+    proxy = start_session_proxy(request.config)
+    yield proxy
+    if proxy is not None:
+        stop_session_proxy(proxy)
+
+
 @pytest.fixture(scope="function")
-def driver(browser_config):
+def driver(request, browser_config, site_proxy):
     """
     Function scope fixture - minden teszt függvényhez új WebDriver
     WebDriver inicializálás és teardown
     """
+    import allure
+    from utils.perf_history import driver_startup_key, command_count_key
+    from utils import cassette as cassettes
+    from utils.reporting import per_test_metadata
+    from utils.locator_profiler import profile_driver
+    from utils.smart_retry import park_driver, reuse_driver
+
     browser = browser_config["browser"].lower()
     headless = browser_config["headless"]
+    cassette_mode = request.config.getoption("--cassette-mode")
 
     driver = None
+    command_counter = None
+    commands_before = 0
+    cassette = None
+    parked = False
 
     try:
-        if browser == "chrome":
-            driver = _setup_chrome_driver(headless)
+        startup_begin = time.perf_counter()
+        # Újrapróbálásnál (--retries) az előző próbálkozás böngészője, alaphelyzetbe állítva
+        reused = reuse_driver(request)
+        if reused is not None:
+            driver = reused
+        elif cassette_mode == "replay":
+            driver = cassettes.open_replay_driver(request)
+        elif browser_config["backend"] == "fake":
+            driver = _setup_fake_driver()
+        elif browser == "chrome":
+            driver = _setup_chrome_driver(headless, site_proxy)
         elif browser == "firefox":
-            driver = _setup_firefox_driver(headless)
+            driver = _setup_firefox_driver(headless, site_proxy)
         else:
             raise ValueError(f"Nem támogatott browser: {browser}")
+        request.node.stash[driver_startup_key] = time.perf_counter() - startup_begin
+
+        # WebDriver forgalom rögzítése cassette-be (--cassette-mode=record)
+        if cassette_mode == "record":
+            cassette = cassettes.start_recording(driver)
+
+        # Locator profilozás (--profile-locators) - a számláló alá, hogy a saját parancsai ne számítsanak
+        profile_driver(driver)
+
+        # WebDriver parancsok számlálása a teljesítmény-történethez - újrahasznosított drivernél
+        # a számláló az előző próbálkozások parancsait is tartalmazza, ezért a különbség számít
+        command_counter = instrument_driver(driver)
+        commands_before = command_counter.total
 
         # WebDriver konfigurálás
         driver.maximize_window()
         driver.implicitly_wait(10)
 
-        # Allure-hoz browser info csatolása
-        allure.attach(
-            f"Browser: {browser.title()}\nHeadless: {headless}",
-            name="Browser Configuration",
-            attachment_type=allure.attachment_type.TEXT
-        )
+        # Allure-hoz browser info csatolása (full szinten; egyébként az environment.properties-ben)
+        if per_test_metadata():
+            allure.attach(
+                f"Browser: {browser.title()}\nHeadless: {headless}",
+                name="Browser Configuration",
+                attachment_type=allure.attachment_type.TEXT
+            )
 
         yield driver  # Itt adja vissza a driver-t a testnek
 
     finally:
-        # Cleanup - driver bezárása
+        if command_counter is not None:
+            request.node.stash[command_count_key] = command_counter.total - commands_before
+
+        # Cleanup - driver bezárása (kivéve, ha a teszt újrapróbálása ugyanezt a böngészőt kapja)
         if driver:
+            parked = park_driver(request, driver)
+        if driver and not parked:
             driver.quit()
+            cassettes.finish_cassette(request, driver, cassette)
+
 
+def _setup_chrome_driver(headless=False, proxy=None):
+    """Chrome WebDriver setup (opcionálisan a site proxyn keresztül)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
 
-def _setup_chrome_driver(headless=False):
-    """Chrome WebDriver setup"""
     options = Options()
 
     if headless:
@@ -110,14 +199,23 @@ def _setup_chrome_driver(headless=False):
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
 
+    if proxy is not None:
+        proxy.configure_chrome(options)
+
     # WebDriver Manager automatikus driver letöltés
     service = Service(ChromeDriverManager().install())
 
-    return webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(service=service, options=options)
+    return proxy.route(driver) if proxy is not None else driver
 
 
-def _setup_firefox_driver(headless=False):
-    """Firefox WebDriver setup"""
+def _setup_firefox_driver(headless=False, proxy=None):
+    """Firefox WebDriver setup (opcionálisan a site proxyn keresztül)"""
+    from selenium import webdriver
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    from webdriver_manager.firefox import GeckoDriverManager
+
     options = FirefoxOptions()
 
     if headless:
@@ -126,21 +224,53 @@ def _setup_firefox_driver(headless=False):
     options.add_argument("--width=1920")
     options.add_argument("--height=1080")
 
+    if proxy is not None:
+        proxy.configure_firefox(options)
+
     service = FirefoxService(GeckoDriverManager().install())
 
-    return webdriver.Firefox(service=service, options=options)
+    driver = webdriver.Firefox(service=service, options=options)
+    return proxy.route(driver) if proxy is not None else driver
+
+
+def _setup_fake_driver():
+    """In-process fake WebDriver - böngésző processz nélkül"""
+    from utils.fake_driver import FakeWebDriver
+    return FakeWebDriver()
+
+
+@pytest.fixture(scope="function")
+def fake_driver():
+    """
+    Fake WebDriver a --backend opciótól függetlenül
+    Page object unit tesztekhez
+    """
+    driver = _setup_fake_driver()
+    yield driver
+    driver.quit()
 
 
 # ===== PAGE OBJECT FIXTURES =====
 
+def _page_object(name):
+    """
+    Page object osztály lusta betöltése - csak az a modul importálódik, amit a teszt használ
+    Hiányzó page object esetén a teszt egyértelmű hibával bukik (nem ImportError a gyűjtésnél)
+    """
+    from page import PageObjectNotFound, load_page_object
+    try:
+        return load_page_object(name)
+    except PageObjectNotFound as error:
+        pytest.fail(str(error), pytrace=False)
+
+
 @pytest.fixture(scope="function")
 def login_page(driver):
     """
     Login Page Object fixture
     Automatikusan megnyitja a login oldalt
     """
-    from page.login_page import LoginPage
-    page = LoginPage(driver)
+    page = _page_object("LoginPage")(driver)
     page.open()  # Automatikusan megnyitja az oldalt
     return page
 
@@ -148,8 +278,7 @@ def login_page(driver):
 @pytest.fixture(scope="function")
 def dropdown_page(driver):
     """Dropdown Page Object fixture"""
-    from pages.dropdown_page import DropdownPage
-    page = DropdownPage(driver)
+    page = _page_object("DropdownPage")(driver)
     page.open()
     return page
 
@@ -201,7 +330,14 @@ def setup_allure_environment(request, browser_config):
     """
     Automatikusan futó fixture - minden teszthez
     Allure környezeti információk beállítása
+    Csak --report-level=full esetén; egyébként a session szintű environment.properties tartalmazza
     """
+    from utils.reporting import per_test_metadata
+    if not per_test_metadata():
+        return
+
+    import allure
+
     # Test információk Allure-hoz
     allure.dynamic.parameter("Browser", browser_config["browser"])
     allure.dynamic.parameter("Headless", browser_config["headless"])
@@ -227,6 +363,8 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
 
     if report.when == "call" and report.failed:
+        import allure
+
         # Sikertelen teszt esetén screenshot
         driver = None
 
@@ -2,25 +2,33 @@ from selenium.webdriver.support.wait import WebDriverWait
 import os
 from datetime import datetime
 from generate_driver import get_preconfigured_chrome_driver
+from utils.event_wait import WaitEngine
+from utils.impact import record_usage
+from utils.nav_metrics import record_navigation
 
 
 class GeneralPage(object):
-    def __init__(self, url, browser=None):
+    def __init__(self, url, browser=None, timeout=10):
         self.URL = url
         if browser is None:
             self.browser = get_preconfigured_chrome_driver()
         else:
             self.browser = browser
+        self.wait = WebDriverWait(self.browser, timeout)
+        self.waiter = WaitEngine(self.browser, timeout)
+        record_usage(self)
 
 
     # ===== BROWSER MANAGEMENT =====
     def get(self):
         """Navigate to page"""
         self.browser.get(self.URL)
+        record_navigation(self.browser, "navigate")
 
     def refresh_page(self):
         """Refresh current page"""
         self.browser.refresh()
+        record_navigation(self.browser, "refresh")
 
     def go_back(self):
         """Browser back button"""
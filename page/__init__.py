@@ -0,0 +1,48 @@
+"""
+page - Page Object csomag
+A page objectek lustán töltődnek be: `from page import LoginPage` csak az adott modult importálja,
+a nem létező page objectre pedig egyértelmű PageObjectNotFound hibát kapunk.
+"""
+
+import importlib
+
+
+# Page object osztály -> modul
+PAGE_OBJECTS = {
+    "BasePage": "page.base_page",
+    "LoginPage": "page.login_page",
+    "SecureAreaPage": "page.secure_area_page",
+    "DropdownPage": "page.dropdown_page",
+    "HomePage": "page.home_page",
+}
+
+
+class PageObjectNotFound(ImportError):
+    """A kért page object (vagy a modulja) nem létezik"""
+
+
+def load_page_object(name):
+    """
+    Page object osztály betöltése név alapján
+    :param name: Osztály név, pl. "LoginPage"
+    :raises PageObjectNotFound: ismeretlen név, hiányzó modul vagy osztály
+    """
+    module_name = PAGE_OBJECTS.get(name)
+    if module_name is None:
+        raise PageObjectNotFound(f"Ismeretlen page object: {name} (ismertek: {', '.join(sorted(PAGE_OBJECTS))})")
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as error:
+        if error.name != module_name:
+            raise
+        raise PageObjectNotFound(f"{name}: a {module_name} modul nem létezik") from error
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise PageObjectNotFound(f"{name} nincs definiálva a {module_name} modulban") from None
+
+
+def __getattr__(name):
+    if name in PAGE_OBJECTS:
+        return load_page_object(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
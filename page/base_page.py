@@ -4,18 +4,28 @@ Minden page object ebből örököl, közös funkcionalitásokat tartalmaz
 """
 
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import allure
 import time
 
+from utils.dropdown import read_options, select_option
+from utils.event_wait import WaitEngine
+from utils.impact import record_usage
+from utils.nav_metrics import record_navigation
+from utils.reporting import step
+from utils.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
+
 
 class BasePage:
     """
     Base page osztály - minden page object ebből örököl
     Tartalmazza a közös WebDriver műveleteket
+
+    Elem cache: a már megtalált elemek locator szerint tárolódnak, így az ismételt
+    get_text / get_attribute / type_text hívások nem keresik újra az elemet.
+    Navigáció (navigate_to, click(..., navigates=True), refresh, back) üríti a cache-t,
+    StaleElementReferenceException esetén egy automatikus újrakeresés történik.
     """
 
     def __init__(self, driver, timeout=10):
@@ -27,22 +37,93 @@ class BasePage:
         self.driver = driver
         self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
+        # Locator alapú várakozások: polling vagy MutationObserver (--wait-strategy)
+        self.waiter = WaitEngine(driver, timeout)
+
+        # Elem cache - locator -> WebElement
+        self._element_cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        record_usage(self)
+
+    # ===== ELEM CACHE =====
+
+    def invalidate_cache(self):
+        """Elem cache ürítése (navigáció után)"""
+        self._element_cache.clear()
+
+    def cache_stats(self):
+        """Elem cache találat / tévesztés számlálók"""
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._element_cache)}
+
+    def _cached(self, locator):
+        record_usage(self, locator)
+        element = self._element_cache.get(tuple(locator))
+        if element is not None:
+            self.cache_hits += 1
+        return element
+
+    def _evict_stale(self, locator):
+        """Elavult cache-elt elem eldobása - a találat visszavonódik, az újrakeresés tévesztésnek számít"""
+        self._element_cache.pop(tuple(locator), None)
+        self.cache_hits -= 1
+
+    def _remember(self, locator, element):
+        self._element_cache[tuple(locator)] = element
+        return element
 
-    @allure.step("Navigálás URL-re: {url}")
+    def _with_element(self, locator, action):
+        """
+        Művelet egy (cache-elt) elemen - stale elem esetén egyszer újrakeresi
+        :param action: callable(WebElement)
+        """
+        element = self.find_element(locator)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self._evict_stale(locator)
+            return action(self.find_element(locator))
+
+    # ===== NAVIGÁCIÓ =====
+
+    @step("Navigálás URL-re: {url}")
     def navigate_to(self, url):
         """Navigálás megadott URL-re"""
+        self.invalidate_cache()
         self.driver.get(url)
+        record_navigation(self.driver, "navigate")
+        return self
+
+    @step("Oldal frissítése")
+    def refresh(self):
+        """Oldal újratöltése"""
+        self.invalidate_cache()
+        self.driver.refresh()
+        record_navigation(self.driver, "refresh")
         return self
 
-    @allure.step("Elem keresése: {locator}")
+    @step("Vissza navigálás")
+    def go_back(self):
+        """Böngésző vissza gomb"""
+        self.invalidate_cache()
+        self.driver.back()
+        record_navigation(self.driver, "back")
+        return self
+
+    @step("Elem keresése: {locator}")
     def find_element(self, locator):
         """
-        Elem keresése
+        Elem keresése - a cache-ből, ha már megtaláltuk ezen az oldalon
         :param locator: Tuple (By.ID, "element_id") formátumban
         :return: WebElement
         """
+        element = self._cached(locator)
+        if element is not None:
+            return element
+
+        self.cache_misses += 1
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self._remember(locator, self.waiter.until("present", locator))
         except TimeoutException:
             allure.attach(
                 self.driver.get_screenshot_as_png(),
@@ -51,19 +132,34 @@ class BasePage:
             )
             raise TimeoutException(f"Element {locator} nem található {self.timeout} másodperc alatt")
 
-    @allure.step("Elemek keresése: {locator}")
+    @step("Elemek keresése: {locator}")
     def find_elements(self, locator):
         """Több elem keresése"""
+        record_usage(self, locator)
         return self.driver.find_elements(*locator)
 
-    @allure.step("Klikkelés elemre: {locator}")
-    def click(self, locator):
+    @step("Klikkelés elemre: {locator}")
+    def click(self, locator, navigates=False):
         """
         Klikk egy elemre - megvárja hogy klikkelhető legyen
+        :param navigates: True, ha a klikk új oldalt tölt be (form submit, link) - az elem cache ürül.
+            Jelzés nélküli navigáció után a stale elemeket az automatikus újrakeresés kezeli.
         """
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.click()
+            element = self._cached(locator)
+            clicked = False
+            if element is not None:
+                try:
+                    self.waiter.until("clickable", locator, element).click()
+                    clicked = True
+                except StaleElementReferenceException:
+                    self._evict_stale(locator)
+            if not clicked:
+                self.cache_misses += 1
+                self._remember(locator, self.waiter.until("clickable", locator)).click()
+
+            if navigates:
+                self.invalidate_cache()
             return self
         except TimeoutException:
             allure.attach(
@@ -73,7 +169,7 @@ class BasePage:
             )
             raise TimeoutException(f"Nem lehet klikkelni az elemre: {locator}")
 
-    @allure.step("Szöveg beírása: '{text}' -> {locator}")
+    @step("Szöveg beírása: '{text}' -> {locator}")
     def type_text(self, locator, text, clear_first=True):
         """
         Szöveg beírása egy input mezőbe
@@ -81,70 +177,93 @@ class BasePage:
         :param text: Beírandó szöveg
         :param clear_first: Törli-e előbb a mező tartalmát
         """
-        element = self.find_element(locator)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def type_into(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+
+        self._with_element(locator, type_into)
         return self
 
-    @allure.step("Szöveg lekérése elemből: {locator}")
+    @step("Szöveg lekérése elemből: {locator}")
     def get_text(self, locator):
         """Element szövegének lekérése"""
-        element = self.find_element(locator)
-        return element.text
+        return self._with_element(locator, lambda element: element.text)
 
-    @allure.step("Attribútum lekérése: {attribute} -> {locator}")
+    @step("Attribútum lekérése: {attribute} -> {locator}")
     def get_attribute(self, locator, attribute):
         """Element attribútumának lekérése"""
-        element = self.find_element(locator)
-        return element.get_attribute(attribute)
+        return self._with_element(locator, lambda element: element.get_attribute(attribute))
 
-    @allure.step("Elem látható-e: {locator}")
+    @step("Elem látható-e: {locator}")
     def is_element_visible(self, locator):
         """
         Ellenőrzi, hogy egy elem látható-e
         """
+        element = self._cached(locator)
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            if element is not None:
+                try:
+                    self.waiter.until("visible", locator, element)
+                    return True
+                except StaleElementReferenceException:
+                    self._evict_stale(locator)
+            self.cache_misses += 1
+            self._remember(locator, self.waiter.until("visible", locator))
             return True
         except TimeoutException:
             return False
 
-    @allure.step("Elem jelenléte: {locator}")
+    @step("Elem jelenléte: {locator}")
     def is_element_present(self, locator):
         """Ellenőrzi, hogy elem jelen van-e a DOM-ban"""
+        record_usage(self, locator)
         try:
-            self.driver.find_element(*locator)
+            self._remember(locator, self.driver.find_element(*locator))
             return True
         except NoSuchElementException:
             return False
 
-    @allure.step("Várakozás elem eltűnésére: {locator}")
+    @step("Várakozás elem eltűnésére: {locator}")
     def wait_for_element_to_disappear(self, locator):
         """Megvárja hogy egy elem eltűnjön"""
+        record_usage(self, locator)
+        self._element_cache.pop(tuple(locator), None)
         try:
-            self.wait.until(EC.invisibility_of_element_located(locator))
+            self.waiter.until("invisible", locator)
             return True
         except TimeoutException:
             return False
 
-    @allure.step("Dropdown kiválasztás: '{option_text}' -> {locator}")
+    # ===== DROPDOWN (egy szkript hívás műveletenként, az opciók számától függetlenül) =====
+
+    @step("Dropdown kiválasztás: '{option_text}' -> {locator}")
     def select_dropdown_by_text(self, locator, option_text):
         """Dropdown option kiválasztása szöveg alapján"""
-        dropdown_element = self.find_element(locator)
-        select = Select(dropdown_element)
-        select.select_by_visible_text(option_text)
+        self._with_element(locator, lambda element: select_option(self.driver, element, "text", option_text))
         return self
 
-    @allure.step("Dropdown kiválasztás index alapján: {index} -> {locator}")
+    @step("Dropdown kiválasztás érték alapján: '{value}' -> {locator}")
+    def select_dropdown_by_value(self, locator, value):
+        """Dropdown option kiválasztása value attribútum alapján"""
+        self._with_element(locator, lambda element: select_option(self.driver, element, "value", value))
+        return self
+
+    @step("Dropdown kiválasztás index alapján: {index} -> {locator}")
     def select_dropdown_by_index(self, locator, index):
         """Dropdown option kiválasztása index alapján"""
-        dropdown_element = self.find_element(locator)
-        select = Select(dropdown_element)
-        select.select_by_index(index)
+        self._with_element(locator, lambda element: select_option(self.driver, element, "index", index))
         return self
 
-    @allure.step("Screenshot készítése")
+    @step("Dropdown opciók lekérése: {locator}")
+    def get_options(self, locator):
+        """
+        Az összes option egy lekérésben
+        :return: [{"index", "text", "value", "selected", "disabled"}, ...]
+        """
+        return self._with_element(locator, lambda element: read_options(self.driver, element))
+
+    @step("Screenshot készítése")
     def take_screenshot(self, name="screenshot"):
         """Screenshot készítése és csatolása az Allure riporthoz"""
         allure.attach(
@@ -153,19 +272,29 @@ class BasePage:
             attachment_type=allure.attachment_type.PNG
         )
 
-    @allure.step("Scroll elemhez: {locator}")
+    @step("Scroll elemhez: {locator}")
     def scroll_to_element(self, locator):
         """Görgetés egy elemhez"""
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView();", element)
+        self._with_element(locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView();", element))
         return self
 
-    @allure.step("Oldal címének lekérése")
+    @step("Oldal pillanatkép készítése")
+    def snapshot(self):
+        """
+        Oldal pillanatkép egyetlen round-trippel (outerHTML + számolt láthatóság)
+        Csak olvasó ellenőrzésekhez: a PageSnapshot-on futó is_element_present,
+        is_element_visible, get_text, get_attribute már lokálisan értékelődik ki
+        :return: PageSnapshot
+        """
+        result = self.driver.execute_script(SNAPSHOT_SCRIPT)
+        return PageSnapshot.from_script_result(result)
+
+    @step("Oldal címének lekérése")
     def get_page_title(self):
         """Oldal title-jének lekérése"""
         return self.driver.title
 
-    @allure.step("Aktuális URL lekérése")
+    @step("Aktuális URL lekérése")
     def get_current_url(self):
         """Aktuális URL lekérése"""
         return self.driver.current_url
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Dropdown Page Object - the-internet.herokuapp.com dropdown oldal
+"""
+
+from selenium.webdriver.common.by import By
+from page.base_page import BasePage
+from utils.reporting import step
+
+
+class DropdownPage(BasePage):
+    """
+    Dropdown Page Object
+    URL: https://the-internet.herokuapp.com/dropdown
+    """
+
+    # ===== LOCATORS =====
+
+    DROPDOWN = (By.ID, "dropdown")
+    PAGE_HEADING = (By.TAG_NAME, "h3")
+    PLACEHOLDER_TEXT = "Please select an option"
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = "https://the-internet.herokuapp.com/dropdown"
+
+    # ===== PAGE ACTIONS =====
+
+    @step("Dropdown oldal megnyitása")
+    def open(self):
+        """Dropdown oldal megnyitása"""
+        self.navigate_to(self.url)
+        return self
+
+    def select_by_text(self, text):
+        """Option kiválasztása a látható szöveg alapján"""
+        return self.select_dropdown_by_text(self.DROPDOWN, text)
+
+    def select_by_value(self, value):
+        """Option kiválasztása a value attribútum alapján"""
+        return self.select_dropdown_by_value(self.DROPDOWN, value)
+
+    def select_by_index(self, index):
+        """Option kiválasztása index alapján (a placeholder a 0. option)"""
+        return self.select_dropdown_by_index(self.DROPDOWN, index)
+
+    # ===== VERIFICATIONS =====
+
+    def get_dropdown_options(self):
+        """Az összes option (szöveg, érték, kijelölt, tiltott) egy lekérésben"""
+        return self.get_options(self.DROPDOWN)
+
+    def get_option_texts(self):
+        """A választható (nem tiltott) option-ök szövegei"""
+        return [option["text"] for option in self.get_dropdown_options() if not option["disabled"]]
+
+    def get_selected_option(self):
+        """
+        Kijelölt option szövege
+        :return: A szöveg, vagy None, ha csak a placeholder van kijelölve
+        """
+        selected = [option["text"] for option in self.get_dropdown_options() if option["selected"]]
+        if not selected or selected[0] == self.PLACEHOLDER_TEXT:
+            return None
+        return selected[0]
+
+    def get_heading(self):
+        """Oldal címsor szövege"""
+        return self.get_text(self.PAGE_HEADING)
@@ -1,46 +1,74 @@
 import os
 import sys
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from general_page import GeneralPage
+from utils.impact import record_usage
+from utils.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
 
 class HomePage(GeneralPage):
-    def __init__(self):
+
+    # ===== LOCATORS =====
+    # Egy helyen, hogy a locator profiler / advisor statikusan is lássa őket
+
+    LINK_AB = (By.XPATH, '//a[@href="/abtest"]')
+    LINK_ADD_REMOVE_ELEMENTS = (By.XPATH, '//a[@href="/add_remove_elements/"]')
+    LINK_BASIC_AUTH = (By.XPATH, '//a[@href="/basic_auth"]')
+    LINK_BROKEN_IMAGES = (By.XPATH, '//a[@href="/broken_images"]')
+    LINK_CHALLENGING_DOM = (By.XPATH, '//a[@href="/challenging_dom"]')
+    LINK_CHECKBOXES = (By.XPATH, '//a[@href="/checkboxes"]')
+    LINK_CONTEXT_MENU = (By.XPATH, '//a[@href="/context_menu" and text()="Context Menu"]')
+    LINK_DIGEST_AUTH = (By.XPATH, '//a[@href="/digest_auth" and text()="Digest Authentication"]')
+    LINK_DISAPPEARING_ELEMENTS = (By.XPATH, '//a[@href="/disappearing_elements" and text()="Disappearing Elements"]')
+    LINK_DRAG_AND_DROP = (By.XPATH, '//a[@href="/drag_and_drop" and text()="Drag and Drop"]')
+    EXAMPLE_LINKS = (By.CSS_SELECTOR, "#content ul li a")
+
+    def __init__(self, browser=None):
         self.URL = 'https://the-internet.herokuapp.com/'
-        super().__init__(self.URL)
+        super().__init__(self.URL, browser)
+
+    def _clickable(self, locator):
+        record_usage(self, locator)
+        return self.waiter.until("clickable", locator)
 
     def link_ab(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/abtest"]')))
+        return self._clickable(self.LINK_AB)
 
     def link_add_remove_elements(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/add_remove_elements/"]')))
+        return self._clickable(self.LINK_ADD_REMOVE_ELEMENTS)
 
     def link_basic_auth(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/basic_auth"]')))
+        return self._clickable(self.LINK_BASIC_AUTH)
 
     def link_broken_images(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/broken_images"]')))
+        return self._clickable(self.LINK_BROKEN_IMAGES)
 
     def link_challenging_dom(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/challenging_dom"]')))
+        return self._clickable(self.LINK_CHALLENGING_DOM)
 
     def link_checkboxes(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/checkboxes"]')))
+        return self._clickable(self.LINK_CHECKBOXES)
 
     def link_context_menu(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/context_menu" and text()="Context Menu"]')))
+        return self._clickable(self.LINK_CONTEXT_MENU)
 
     def link_digest_auth(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/digest_auth" and text()="Digest Authentication"]')))
+        return self._clickable(self.LINK_DIGEST_AUTH)
 
     def link_disappearing_elements(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/disappearing_elements" and text()="Disappearing Elements"]')))
+        return self._clickable(self.LINK_DISAPPEARING_ELEMENTS)
 
     def link_drag_and_drop(self):
-        return self.wait.until(EC.element_to_be_clickable((By.XPATH, '//a[@href="/drag_and_drop" and text()="Drag and Drop"]')))
+        return self._clickable(self.LINK_DRAG_AND_DROP)
 
+    def link_inventory(self, base_url=None):
+        """
+        Az összes példa link abszolút URL-je egyetlen DOM olvasással (link ellenőrzéshez)
+        :param base_url: Más origin (pl. helyi stand-in szerver) alá illesztve; alapból az oldal URL-je
+        """
+        record_usage(self, self.EXAMPLE_LINKS)
+        snapshot = PageSnapshot.from_script_result(self.browser.execute_script(SNAPSHOT_SCRIPT))
+        base_url = base_url or snapshot.url or self.URL
+        return [urljoin(base_url, element.get_attribute("href")) for element in snapshot.find_elements(self.EXAMPLE_LINKS)]
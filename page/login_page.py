@@ -4,8 +4,8 @@ POM implementáció példa
 """
 
 from selenium.webdriver.common.by import By
-import allure
 from page.base_page import BasePage
+from utils.reporting import step
 
 
 class LoginPage(BasePage):
@@ -37,14 +37,14 @@ class LoginPage(BasePage):
 
     # ===== PAGE ACTIONS (Oldal műveletek) =====
 
-    @allure.step("Login oldal megnyitása")
+    @step("Login oldal megnyitása")
     def open(self):
         """Login oldal megnyitása"""
         self.navigate_to(self.url)
         self._verify_page_loaded()
         return self
 
-    @allure.step("Felhasználónév beírása: {username}")
+    @step("Felhasználónév beírása: {username}")
     def enter_username(self, username):
         """
         Felhasználónév beírása
@@ -53,7 +53,7 @@ class LoginPage(BasePage):
         self.type_text(self.USERNAME_INPUT, username)
         return self
 
-    @allure.step("Jelszó beírása")
+    @step("Jelszó beírása")
     def enter_password(self, password):
         """
         Jelszó beírása (nem logoljuk a jelszót biztonsági okokból)
@@ -62,13 +62,13 @@ class LoginPage(BasePage):
         self.type_text(self.PASSWORD_INPUT, password)
         return self
 
-    @allure.step("Login gombra klikkelés")
+    @step("Login gombra klikkelés")
     def click_login_button(self):
         """Login gomb megnyomása"""
-        self.click(self.LOGIN_BUTTON)
+        self.click(self.LOGIN_BUTTON, navigates=True)
         return self
 
-    @allure.step("Teljes bejelentkezési folyamat: {username}")
+    @step("Teljes bejelentkezési folyamat: {username}")
     def login(self, username, password):
         """
         Teljes login folyamat egy lépésben
@@ -82,7 +82,7 @@ class LoginPage(BasePage):
 
         # Ha sikeres a login, SecureAreaPage-re navigálunk
         if self.is_login_successful():
-            from pages.secure_area_page import SecureAreaPage
+            from page.secure_area_page import SecureAreaPage
             return SecureAreaPage(self.driver)
 
         # Ha sikertelen, maradunk a LoginPage-en
@@ -90,7 +90,7 @@ class LoginPage(BasePage):
 
     # ===== VERIFICATIONS (Ellenőrzések) =====
 
-    @allure.step("Login sikerességének ellenőrzése")
+    @step("Login sikerességének ellenőrzése")
     def is_login_successful(self):
         """
         Ellenőrzi, hogy sikeres volt-e a bejelentkezés
@@ -102,7 +102,7 @@ class LoginPage(BasePage):
         except:
             return False
 
-    @allure.step("Hibaüzenet ellenőrzése")
+    @step("Hibaüzenet ellenőrzése")
     def get_error_message(self):
         """
         Hibaüzenet szövegének lekérése
@@ -113,7 +113,7 @@ class LoginPage(BasePage):
         except:
             return None
 
-    @allure.step("Érvénytelen bejelentkezési adatok ellenőrzése")
+    @step("Érvénytelen bejelentkezési adatok ellenőrzése")
     def is_invalid_credentials_displayed(self):
         """
         Ellenőrzi, hogy megjelent-e az érvénytelen adatok hibaüzenete
@@ -124,18 +124,18 @@ class LoginPage(BasePage):
         except:
             return False
 
-    @allure.step("Login form jelenléte")
+    @step("Login form jelenléte")
     def is_login_form_displayed(self):
         """Ellenőrzi, hogy a login form látható-e"""
         return self.is_element_visible(self.LOGIN_FORM)
 
-    @allure.step("Felhasználónév mező ürességének ellenőrzése")
+    @step("Felhasználónév mező ürességének ellenőrzése")
     def is_username_field_empty(self):
         """Ellenőrzi, hogy a felhasználónév mező üres-e"""
         username_value = self.get_attribute(self.USERNAME_INPUT, "value")
         return username_value == ""
 
-    @allure.step("Jelszó mező ürességének ellenőrzése")
+    @step("Jelszó mező ürességének ellenőrzése")
     def is_password_field_empty(self):
         """Ellenőrzi, hogy a jelszó mező üres-e"""
         password_value = self.get_attribute(self.PASSWORD_INPUT, "value")
@@ -143,7 +143,7 @@ class LoginPage(BasePage):
 
     # ===== PRIVATE METHODS (Belső metódusok) =====
 
-    @allure.step("Oldal betöltésének ellenőrzése")
+    @step("Oldal betöltésének ellenőrzése")
     def _verify_page_loaded(self):
         """
         Privát metódus - ellenőrzi hogy az oldal teljesen betöltött-e
@@ -0,0 +1,62 @@
+"""
+Secure Area Page Object - the-internet.herokuapp.com sikeres login utáni oldal
+"""
+
+from selenium.webdriver.common.by import By
+from page.base_page import BasePage
+from utils.reporting import step
+
+
+class SecureAreaPage(BasePage):
+    """
+    Secure Area Page Object
+    URL: https://the-internet.herokuapp.com/secure
+    """
+
+    # ===== LOCATORS =====
+
+    FLASH_MESSAGE = (By.ID, "flash")
+    SUCCESS_MESSAGE_TEXT = "You logged into a secure area!"
+    PAGE_HEADING = (By.TAG_NAME, "h2")
+    LOGOUT_BUTTON = (By.CSS_SELECTOR, "a[href='/logout']")
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.url = "https://the-internet.herokuapp.com/secure"
+
+    # ===== PAGE ACTIONS =====
+
+    @step("Secure Area oldal megnyitása")
+    def open(self):
+        """Secure Area megnyitása (bejelentkezett session kell hozzá)"""
+        self.navigate_to(self.url)
+        return self
+
+    @step("Kijelentkezés")
+    def logout(self):
+        """
+        Logout gomb megnyomása
+        :return: LoginPage
+        """
+        from page.login_page import LoginPage
+        self.click(self.LOGOUT_BUTTON, navigates=True)
+        return LoginPage(self.driver)
+
+    # ===== VERIFICATIONS =====
+
+    @step("Sikeres bejelentkezés üzenet ellenőrzése")
+    def is_success_message_displayed(self):
+        """Ellenőrzi, hogy megjelent-e a sikeres bejelentkezés üzenete"""
+        try:
+            return self.SUCCESS_MESSAGE_TEXT in self.get_text(self.FLASH_MESSAGE)
+        except Exception:
+            return False
+
+    @step("Logout gomb láthatóságának ellenőrzése")
+    def is_logout_button_displayed(self):
+        """Ellenőrzi, hogy a logout gomb látható-e"""
+        return self.is_element_visible(self.LOGOUT_BUTTON)
+
+    def get_heading(self):
+        """Oldal címsor szövege"""
+        return self.get_text(self.PAGE_HEADING)
@@ -0,0 +1,108 @@
+"""
+test_allure_writer.py - Kötegelt Allure író, attachment pool és archívum tesztjei
+"""
+
+import io
+import json
+import os
+import tarfile
+import uuid
+
+import allure
+import pytest
+from allure_commons import model2
+
+from utils.allure_writer import (
+    BatchedResultsWriter, DirectorySink, PackSink, WriterStats, expand_pack, main,
+)
+
+
+def _report_two_results(writer):
+    """Két teszt eredmény, ugyanazzal a csatolmány tartalommal"""
+    names = []
+    for _ in range(2):
+        file_name = f"{uuid.uuid4()}-attachment.txt"
+        writer.report_attached_data(body="Browser: Chrome\nHeadless: True", file_name=file_name)
+        step = model2.TestStepResult(
+            name="lépés",
+            attachments=[model2.Attachment(name="config", source=file_name, type="text/plain")]
+        )
+        writer.report_result(result=model2.TestResult(uuid=str(uuid.uuid4()), name="teszt", steps=[step]))
+        names.append(file_name)
+    return names
+
+
+def _results(directory):
+    return [json.load(open(os.path.join(directory, name), encoding="utf-8"))
+            for name in os.listdir(directory) if name.endswith("-result.json")]
+
+
+@allure.epic("Tooling")
+@allure.feature("Allure Writer")
+class TestBatchedResultsWriter:
+
+    def test_identical_attachments_are_pooled(self, tmp_path):
+        writer = BatchedResultsWriter(DirectorySink(str(tmp_path), WriterStats()))
+        original_names = _report_two_results(writer)
+        writer.close()
+
+        attachments = [name for name in os.listdir(tmp_path) if "-attachment" in name]
+        assert len(attachments) == 1
+        assert not set(original_names) & set(attachments)
+
+        sources = {result["steps"][0]["attachments"][0]["source"] for result in _results(str(tmp_path))}
+        assert sources == set(attachments)
+        assert writer.stats.pooled == 1
+
+    def test_stats_count_items_and_writes(self, tmp_path):
+        writer = BatchedResultsWriter(DirectorySink(str(tmp_path), WriterStats()))
+        _report_two_results(writer)
+        writer.flush()
+
+        stats = writer.stats.as_dict()
+        assert stats["items"] == 4
+        assert stats["files"] == 3
+        assert stats["write_calls"] >= stats["files"]
+        writer.close()
+
+    def test_packed_archive_expands_to_standard_layout(self, tmp_path):
+        pack_path = str(tmp_path / "allure-results.tar")
+        stats = WriterStats()
+        writer = BatchedResultsWriter(PackSink(pack_path, stats))
+        _report_two_results(writer)
+        writer.close()
+
+        assert stats.write_calls < stats.files
+        destination = str(tmp_path / "expanded")
+        assert main(["expand", pack_path, destination]) == 0
+        assert len(os.listdir(destination)) == 3
+        assert len(_results(destination)) == 2
+
+    def test_expand_defaults_to_archive_directory(self, tmp_path):
+        pack_path = str(tmp_path / "allure-results.tar")
+        writer = BatchedResultsWriter(PackSink(pack_path, WriterStats()))
+        _report_two_results(writer)
+        writer.close()
+
+        assert expand_pack(pack_path) == 3
+        assert len(_results(str(tmp_path))) == 2
+
+    @pytest.mark.parametrize("data_filter", [True, False])
+    def test_expand_rejects_paths_outside_destination(self, tmp_path, monkeypatch, data_filter):
+        if not data_filter:
+            # Python < 3.10.12: nincs tarfile.data_filter, a tagok kézi ellenőrzése fut
+            monkeypatch.delattr(tarfile, "data_filter", raising=False)
+        good_pack = str(tmp_path / "allure-results.tar")
+        writer = BatchedResultsWriter(PackSink(good_pack, WriterStats()))
+        _report_two_results(writer)
+        writer.close()
+        assert expand_pack(good_pack, str(tmp_path / "expanded")) == 3
+
+        evil_pack = str(tmp_path / "evil.tar")
+        with tarfile.open(evil_pack, "w") as archive:
+            member = tarfile.TarInfo("../escaped.txt")
+            member.size = 4
+            archive.addfile(member, io.BytesIO(b"evil"))
+        with pytest.raises(tarfile.TarError):
+            expand_pack(evil_pack, str(tmp_path / "expanded"))
+        assert not (tmp_path / "escaped.txt").exists()
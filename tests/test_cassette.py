@@ -0,0 +1,68 @@
+"""
+test_cassette.py - WebDriver forgalom rögzítés / visszajátszás tesztjei
+A felvétel a fake backenden készül, a lejátszás böngésző nélkül fut
+"""
+
+import allure
+import pytest
+
+from page.login_page import LoginPage
+from utils.cassette import Cassette, CassetteMismatchError, ReplayWebDriver, start_recording
+
+
+def _login_flow(driver):
+    page = LoginPage(driver).open()
+    page.login("invalid_user", "wrong_password")
+    assert page.is_invalid_credentials_displayed()
+    return page
+
+
+@pytest.fixture
+def recorded(fake_driver, tmp_path):
+    """Egy login folyamat felvétele cassette fájlba"""
+    cassette = start_recording(fake_driver)
+    _login_flow(fake_driver)
+    fake_driver.quit()
+    path = str(tmp_path / "login.json.gz")
+    cassette.save(path)
+    return path
+
+
+@allure.epic("Tooling")
+@allure.feature("WebDriver Cassettes")
+class TestCassette:
+
+    def test_replay_serves_identical_sequence(self, recorded):
+        driver = ReplayWebDriver(recorded)
+        _login_flow(driver)
+        driver.quit()
+
+        summary = driver.command_executor.summary()
+        assert summary["served"] == summary["recorded"]
+        assert summary["divergences"] == []
+
+    def test_replay_flags_added_round_trip(self, recorded):
+        driver = ReplayWebDriver(recorded)
+        page = _login_flow(driver)
+        page.get_page_title()  # már felvett lekérdezés, újra kiadva
+        driver.quit()
+
+        assert driver.command_executor.summary()["added"] == 1
+
+    def test_replay_flags_removed_round_trips(self, recorded):
+        driver = ReplayWebDriver(recorded)
+        LoginPage(driver).open()
+        driver.quit()
+
+        assert driver.command_executor.summary()["removed"] > 0
+
+    def test_unknown_command_raises(self, recorded):
+        driver = ReplayWebDriver(recorded)
+        with pytest.raises(CassetteMismatchError):
+            driver.get("https://the-internet.herokuapp.com/dropdown")
+
+    def test_long_scripts_are_stored_once(self, recorded):
+        cassette = Cassette.load(recorded)
+        scripts = [item["params"]["script"] for item in cassette.interactions
+                   if item["command"].startswith("w3cExecuteScript")]
+        assert scripts and all(isinstance(script, str) for script in scripts)
@@ -0,0 +1,89 @@
+"""
+test_collection_profile.py - Import idő profiler tesztjei
+"""
+
+import json
+import subprocess
+import sys
+
+import allure
+
+from utils.collection_profile import ImportProfiler
+
+
+# A conftest pluginjainak importja ezeket nem töltheti be (a használat helyén töltődnek)
+DEFERRED_MODULES = ("selenium.webdriver", "selenium.webdriver.chrome.webdriver", "tarfile", "http.server")
+
+PLUGIN_LOAD_SCRIPT = """
+import importlib, json, sys
+import conftest
+for name in conftest.pytest_plugins:
+    importlib.import_module(name)
+print(json.dumps(sorted(name for name in %r if name in sys.modules)))
+"""
+
+
+@allure.epic("Tooling")
+@allure.feature("Collection Profile")
+class TestImportProfiler:
+
+    def test_nested_imports_split_self_and_cumulative(self, tmp_path, monkeypatch):
+        (tmp_path / "profiled_outer.py").write_text("import time\ntime.sleep(0.01)\nimport profiled_inner\n")
+        (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            profiler.uninstall()
+            sys.modules.pop("profiled_outer", None)
+            sys.modules.pop("profiled_inner", None)
+
+        outer_self, outer_total = profiler.timings["profiled_outer"]
+        inner_self, inner_total = profiler.timings["profiled_inner"]
+        assert inner_self >= 0.02
+        assert 0.01 <= outer_self < outer_total
+        assert outer_total >= inner_total
+        assert profiler.top(1)[0][0] == "profiled_outer"
+
+    def test_module_keeps_original_loader(self, tmp_path, monkeypatch):
+        (tmp_path / "profiled_plain.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = ImportProfiler()
+        profiler.install()
+        try:
+            import profiled_plain
+        finally:
+            profiler.uninstall()
+            sys.modules.pop("profiled_plain", None)
+
+        assert type(profiled_plain.__loader__).__name__ == "SourceFileLoader"
+        assert profiler not in sys.meta_path
+
+
+@allure.epic("Tooling")
+@allure.feature("Collection Profile")
+class TestLazyPluginImports:
+
+    def test_plugin_load_defers_heavy_modules(self, request):
+        # Friss interpreter: a futó session már mindent betöltött
+        output = subprocess.run(
+            [sys.executable, "-c", PLUGIN_LOAD_SCRIPT % (DEFERRED_MODULES,)],
+            cwd=str(request.config.rootpath), capture_output=True, text=True, check=True,
+        ).stdout
+        assert json.loads(output) == []
+
+    def test_report_includes_plugin_imports(self, request):
+        # A finder a plugin importjakor települ - a conftest többi pluginja is a riportban van
+        output = subprocess.run(
+            [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+             "--profile-collection", "tests/test_pairwise.py"],
+            cwd=str(request.config.rootpath), capture_output=True, text=True,
+        ).stdout
+        from conftest import pytest_plugins
+
+        imported = output.split("imported module", 1)[1].split()
+        assert any(plugin in imported for plugin in pytest_plugins[1:]), output
@@ -0,0 +1,131 @@
+"""
+test_dropdown.py - Dropdown oldal és az egy round-trippes Select műveletek tesztjei
+"""
+
+import time
+
+import allure
+import pytest
+from selenium.common.exceptions import (
+    ElementNotInteractableException, NoSuchElementException, UnexpectedTagNameException,
+)
+from selenium.webdriver.support.ui import Select
+
+from page.dropdown_page import DropdownPage
+from utils.command_counter import instrument_driver
+from utils.dom import find_all
+from utils.fake_driver import FakeWebDriver
+from utils.fake_site import FakeSite
+
+
+OPTION_COUNT = 3000
+
+
+@pytest.fixture
+def large_dropdown():
+    """Dropdown oldal több ezer optionnel a fake backenden"""
+    options = [(f"v{n}", f"Option  {n}") for n in range(1, OPTION_COUNT + 1)]
+    driver = FakeWebDriver(FakeSite(dropdown_options=options))
+    page = DropdownPage(driver).open()
+    yield page
+    driver.quit()
+
+
+def _round_trips(page, action):
+    counter = instrument_driver(page.driver)
+    before = counter.total
+    begin = time.perf_counter()
+    result = action()
+    return result, counter.total - before, time.perf_counter() - begin
+
+
+@allure.epic("Page Objects")
+@allure.feature("Dropdown")
+class TestDropdown:
+
+    @pytest.mark.smoke
+    def test_select_by_text_value_and_index(self, dropdown_page):
+        assert dropdown_page.get_selected_option() is None
+        assert dropdown_page.get_option_texts() == ["Option 1", "Option 2"]
+
+        assert dropdown_page.select_by_text("Option 2").get_selected_option() == "Option 2"
+        assert dropdown_page.select_by_value("1").get_selected_option() == "Option 1"
+        assert dropdown_page.select_by_index(2).get_selected_option() == "Option 2"
+
+    def test_options_in_one_call(self, dropdown_page):
+        options = dropdown_page.get_dropdown_options()
+        assert options[0] == {"index": 0, "text": "Please select an option", "value": "",
+                              "selected": True, "disabled": True}
+        assert options[1] == {"index": 1, "text": "Option 1", "value": "1", "selected": False, "disabled": False}
+
+    def test_errors_match_selenium_select(self, dropdown_page):
+        with pytest.raises(NoSuchElementException, match="visible text: Option 9"):
+            dropdown_page.select_by_text("Option 9")
+        with pytest.raises(NoSuchElementException, match="index: 5"):
+            dropdown_page.select_by_index(5)
+        with pytest.raises(NotImplementedError):
+            dropdown_page.select_by_index(0)  # a placeholder tiltott
+        with pytest.raises(UnexpectedTagNameException):
+            dropdown_page.get_options(DropdownPage.PAGE_HEADING)
+
+    @pytest.mark.parametrize("attribute, value, error", [
+        ("disabled", "", NotImplementedError),
+        ("style", "display: none", ElementNotInteractableException),
+        ("hidden", "", ElementNotInteractableException),
+    ])
+    def test_inoperable_select_is_not_changed(self, dropdown_page, attribute, value, error):
+        # Amit a felhasználó nem tud kezelni, azon a teszt se menjen át
+        select = find_all(dropdown_page.driver.fake.document, *DropdownPage.DROPDOWN)[0]
+        select.attrs[attribute] = value
+        with pytest.raises(error):
+            dropdown_page.select_by_text("Option 1")
+        assert dropdown_page.get_dropdown_options()[1]["selected"] is False
+
+    def test_text_match_is_whitespace_normalized(self, large_dropdown):
+        large_dropdown.select_by_text("Option 42")
+        assert large_dropdown.get_selected_option() == "Option 42"
+
+    def test_operations_are_single_round_trips(self, large_dropdown):
+        large_dropdown.find_element(large_dropdown.DROPDOWN)  # elem a cache-ben
+        for action in (lambda: large_dropdown.select_by_text(f"Option {OPTION_COUNT}"),
+                       lambda: large_dropdown.select_by_value("v7"),
+                       lambda: large_dropdown.select_by_index(OPTION_COUNT),
+                       large_dropdown.get_dropdown_options):
+            assert _round_trips(large_dropdown, action)[1] == 1
+
+
+@allure.epic("Page Objects")
+@allure.feature("Dropdown")
+class TestDropdownBenchmark:
+
+    def test_bulk_read_and_select_beat_selenium_select(self, large_dropdown):
+        element = large_dropdown.find_element(large_dropdown.DROPDOWN)
+        select = Select(element)
+
+        def selenium_options():
+            return [(option.text, option.get_attribute("value"), option.is_selected()) for option in select.options]
+
+        legacy_rows, legacy_trips, legacy_s = _round_trips(large_dropdown, selenium_options)
+        options, bulk_trips, bulk_s = _round_trips(large_dropdown, large_dropdown.get_dropdown_options)
+        assert [(option["text"], option["value"], option["selected"]) for option in options] == legacy_rows
+
+        _, legacy_select_trips, legacy_select_s = _round_trips(
+            large_dropdown, lambda: select.select_by_index(OPTION_COUNT))
+        _, select_trips, select_s = _round_trips(
+            large_dropdown, lambda: large_dropdown.select_by_index(OPTION_COUNT - 1))
+
+        allure.attach(
+            f"{OPTION_COUNT} options\n"
+            f"read options:     Select {legacy_trips} round-trips {legacy_s * 1000:.1f} ms, "
+            f"get_options {bulk_trips} round-trip {bulk_s * 1000:.1f} ms\n"
+            f"select by index:  Select {legacy_select_trips} round-trips {legacy_select_s * 1000:.1f} ms, "
+            f"one-shot {select_trips} round-trip {select_s * 1000:.1f} ms",
+            name="Dropdown benchmark", attachment_type=allure.attachment_type.TEXT,
+        )
+        assert (bulk_trips, select_trips) == (1, 1)
+        assert legacy_trips > 3 * OPTION_COUNT
+        assert legacy_select_trips > OPTION_COUNT
+        # In-process backenden egy round-trip mikroszekundum, valódi böngészőnél ms nagyságrend -
+        # itt már a kisebb szorzó is a lineáris round-trip szám elhagyását méri
+        assert bulk_s * 2 < legacy_s
+        assert select_s * 2 < legacy_select_s
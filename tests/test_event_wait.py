@@ -0,0 +1,131 @@
+"""
+test_event_wait.py - MutationObserver alapú wait engine tesztjei a fake backenden
+"""
+
+import json
+import shutil
+import subprocess
+import time
+
+import allure
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from utils.event_wait import EVENT_WAIT_SCRIPT, WaitEngine, WaitStats, script_locator, wait_stats
+
+
+LOGIN_URL = "https://the-internet.herokuapp.com/login"
+
+# Minimális böngésző környezet node-hoz: az elem stílusa mutáció (MutationObserver jelzés) nélkül
+# válik láthatóvá, mint egy stylesheet betöltésnél vagy CSS transition végén
+STYLE_CHANGE_HARNESS = """
+var element = {style: {display: 'none', visibility: 'visible'}, disabled: false,
+               getClientRects: function () { return this.style.display === 'none' ? [] : [{}]; }};
+global.document = {documentElement: {}, querySelector: function () { return element; }};
+global.window = {getComputedStyle: function (el) { return el.style; },
+                 addEventListener: function () {}, removeEventListener: function () {}};
+global.MutationObserver = function () { this.observe = function () {}; this.disconnect = function () {}; };
+setTimeout(function () { element.style.display = 'block'; }, %(change_after)d);
+var begin = Date.now();
+(function () { %(script)s }).apply(null, ['css', '#late', 'visible', %(timeout)d, function (result) {
+  console.log(JSON.stringify({status: result.status, elapsed: Date.now() - begin}));
+}]);
+"""
+
+
+@pytest.fixture
+def login_driver(fake_driver):
+    fake_driver.get(LOGIN_URL)
+    return fake_driver
+
+
+@allure.epic("Tooling")
+@allure.feature("Event Waits")
+class TestWaitEngine:
+
+    @pytest.mark.parametrize("locator,expected", [
+        ((By.ID, "username"), ("css", '[id="username"]')),
+        ((By.NAME, 'a"b'), ("css", '[name="a\\"b"]')),
+        ((By.CLASS_NAME, "radius"), ("css", ".radius")),
+        ((By.XPATH, "//h2"), ("xpath", "//h2")),
+        ((By.LINK_TEXT, "Elemental Selenium"), ("link", "Elemental Selenium")),
+    ])
+    def test_locator_translation(self, locator, expected):
+        assert script_locator(locator) == expected
+
+    def test_event_wait_is_one_round_trip(self, login_driver):
+        stats = WaitStats()
+        engine = WaitEngine(login_driver, timeout=5, strategy="event", stats=stats)
+        engine.until("present", (By.ID, "username"))  # script timeout beállítása
+
+        element = engine.until("clickable", (By.CSS_SELECTOR, "button[type='submit']"))
+
+        assert element.tag_name == "button"
+        assert stats.records[-1]["commands"] == 1
+        assert stats.records[-1]["latency"] is not None
+
+    def test_invisible_condition(self, login_driver):
+        engine = WaitEngine(login_driver, timeout=5, strategy="event", stats=WaitStats())
+        assert engine.until("invisible", (By.ID, "missing")) is True
+
+    def test_event_timeout_does_not_poll(self, login_driver):
+        stats = WaitStats()
+        engine = WaitEngine(login_driver, timeout=5, strategy="event", stats=stats)
+        begin = time.perf_counter()
+
+        with pytest.raises(TimeoutException):
+            engine.until("present", (By.ID, "missing"))
+
+        assert time.perf_counter() - begin < 1
+        assert stats.summary()["event"]["timeouts"] == 1
+
+    def test_navigation_falls_back_to_polling(self, login_driver, monkeypatch):
+        def unloaded(*args):
+            raise JavascriptException("document unloaded while waiting for result")
+
+        monkeypatch.setattr(login_driver, "execute_async_script", unloaded)
+        stats = WaitStats()
+        engine = WaitEngine(login_driver, timeout=5, strategy="event", stats=stats)
+
+        assert engine.until("visible", (By.ID, "login")).tag_name == "form"
+        assert stats.records[-1]["fallback"]
+
+    def test_poll_and_event_return_same_element(self, login_driver):
+        locator = (By.XPATH, "//form[@id='login']//input[@type='password']")
+        polled = WaitEngine(login_driver, strategy="poll", stats=WaitStats()).until("visible", locator)
+        evented = WaitEngine(login_driver, strategy="event", stats=WaitStats()).until("visible", locator)
+
+        assert polled == evented
+
+    def test_shared_stats_record_only_when_enabled(self, login_driver, monkeypatch):
+        monkeypatch.setattr(wait_stats, "records", [])
+        monkeypatch.setattr(wait_stats, "enabled", False)
+        engine = WaitEngine(login_driver, strategy="poll")
+        engine.until("present", (By.ID, "username"))
+        assert wait_stats.records == []
+
+        wait_stats.enabled = True
+        engine.until("present", (By.ID, "username"))
+        assert len(wait_stats.records) == 1
+
+
+@allure.epic("Tooling")
+@allure.feature("Event Waits")
+@pytest.mark.skipif(shutil.which("node") is None, reason="node szükséges a szkript futtatásához")
+class TestEventWaitScript:
+
+    @staticmethod
+    def _run(change_after, timeout):
+        source = STYLE_CHANGE_HARNESS % {"change_after": change_after, "timeout": timeout, "script": EVENT_WAIT_SCRIPT}
+        output = subprocess.run(["node", "-e", source], capture_output=True, text=True, check=True, timeout=10).stdout
+        return json.loads(output)
+
+    def test_change_without_mutation_is_caught_by_fallback_check(self):
+        result = self._run(change_after=150, timeout=3000)
+        assert result["status"] == "ok"
+        assert result["elapsed"] < 1000
+
+    def test_condition_is_evaluated_once_more_before_timeout(self):
+        result = self._run(change_after=20, timeout=60)  # a tartalék ellenőrzés előtt jár le
+        assert result["status"] == "ok"
@@ -0,0 +1,134 @@
+"""
+test_impact.py - Változás alapú teszt kiválasztás tesztjei (ideiglenes projekt fán, git nélkül)
+"""
+
+import textwrap
+
+import allure
+import pytest
+
+from utils.impact import ImpactRecorder, file_fingerprints, project_imports, select_tests
+
+
+PAGE_SOURCE = '''
+from selenium.webdriver.common.by import By
+
+
+class ShopPage:
+    """Bolt oldal"""
+
+    BASKET = (By.ID, "basket")
+    CHECKOUT = (By.CSS_SELECTOR, "button.checkout")
+    TITLE_TEXT = "Shop"
+
+    def checkout(self):
+        return self.CHECKOUT
+'''
+
+
+def _write(root, path, source):
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(textwrap.dedent(source), encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write(tmp_path, "page/shop_page.py", PAGE_SOURCE)
+    _write(tmp_path, "utils/helpers.py", "def helper():\n    return 1\n")
+    _write(tmp_path, "tests/test_shop.py", "from page.shop_page import ShopPage\nfrom utils.helpers import helper\n")
+    return tmp_path
+
+
+def _recorded_map(project):
+    keys = file_fingerprints(str(project), "page/shop_page.py")
+    keys.update(file_fingerprints(str(project), "utils/helpers.py", fine_grained=False))
+    return {
+        "version": 1,
+        "fingerprints": keys,
+        "tests": {
+            "tests/test_shop.py::test_basket": [
+                "page/shop_page.py", "page/shop_page.py::ShopPage", "page/shop_page.py::ShopPage::BASKET",
+            ],
+            "tests/test_shop.py::test_checkout": [
+                "page/shop_page.py", "page/shop_page.py::ShopPage", "page/shop_page.py::ShopPage::CHECKOUT",
+            ],
+            "tests/test_other.py::test_helper": ["utils/helpers.py"],
+        },
+    }
+
+
+@allure.epic("Tooling")
+@allure.feature("Impact Selection")
+class TestImpactSelection:
+
+    def test_locator_change_selects_only_its_users(self, project):
+        impact_map = _recorded_map(project)
+        _write(project, "page/shop_page.py", PAGE_SOURCE.replace('"basket"', '"cart"'))
+        selection = select_tests(impact_map, ["page/shop_page.py"], str(project))
+        assert selection.nodeids == {"tests/test_shop.py::test_basket"}
+        assert selection.changed_keys == ["page/shop_page.py::ShopPage::BASKET"]
+
+    def test_method_change_selects_class_users(self, project):
+        impact_map = _recorded_map(project)
+        _write(project, "page/shop_page.py", PAGE_SOURCE.replace("return self.CHECKOUT", "return None"))
+        selection = select_tests(impact_map, ["page/shop_page.py"], str(project))
+        assert selection.nodeids == {"tests/test_shop.py::test_basket", "tests/test_shop.py::test_checkout"}
+
+    def test_docstring_and_formatting_changes_select_nothing(self, project):
+        impact_map = _recorded_map(project)
+        edited = PAGE_SOURCE.replace('"""Bolt oldal"""', '"""Bolt oldal - kosár"""').replace(
+            'BASKET = (By.ID, "basket")', 'BASKET = (By.ID,   "basket")  # kosár')
+        _write(project, "page/shop_page.py", edited)
+        assert select_tests(impact_map, ["page/shop_page.py"], str(project)).nodeids == set()
+
+    def test_changed_test_file_and_imported_module(self, project):
+        impact_map = _recorded_map(project)
+        _write(project, "utils/helpers.py", "def helper():\n    return 2\n")
+        selection = select_tests(impact_map, ["utils/helpers.py", "tests/test_shop.py"], str(project))
+        assert selection.nodeids == set(impact_map["tests"])
+
+    @pytest.mark.parametrize("path", ["conftest.py", "page/base_page.py", "utils/unknown.py"])
+    def test_full_run_fallbacks(self, project, path):
+        assert select_tests(_recorded_map(project), [path], str(project)).full_run
+        assert select_tests(None, [], str(project)).full_run
+
+    @pytest.mark.parametrize("path", ["utils/waits.py", "utils/dom.py", "utils/plugin.py"])
+    def test_page_and_plugin_dependencies_force_full_run(self, project, path):
+        # Teszt fájl nem importálja őket közvetlenül, csak a page object / a conftest plugin lánc
+        _write(project, "page/shop_page.py", "from utils.waits import wait\n" + PAGE_SOURCE)
+        _write(project, "utils/waits.py", "from utils.dom import parse\n\ndef wait():\n    return parse()\n")
+        _write(project, "utils/dom.py", "def parse():\n    return 1\n")
+        _write(project, "utils/plugin.py", "def pytest_configure(config):\n    pass\n")
+        _write(project, "conftest.py", 'pytest_plugins = [\n    "utils.plugin",\n]\n')
+        impact_map = _recorded_map(project)
+        impact_map["fingerprints"].update(file_fingerprints(str(project), path, fine_grained=False))
+
+        selection = select_tests(impact_map, [path], str(project))
+        assert selection.full_run
+        assert path in selection.reason
+
+    def test_docs_and_new_page_objects_are_ignored(self, project):
+        selection = select_tests(_recorded_map(project), ["README.md", "page/new_page.py"], str(project))
+        assert selection.nodeids == set()
+
+
+@allure.epic("Tooling")
+@allure.feature("Impact Selection")
+class TestImpactRecorder:
+
+    def test_usages_resolve_to_locator_keys(self, fake_driver, request):
+        from page.login_page import LoginPage
+
+        recorder = ImpactRecorder(str(request.config.rootpath))
+        recorder.start_test("t")
+        page = LoginPage(fake_driver)
+        recorder.record(page)
+        recorder.record(page, LoginPage.USERNAME_INPUT)
+        keys = recorder.dependencies(recorder.usages["t"])
+        assert "page/login_page.py::LoginPage::USERNAME_INPUT" in keys
+        assert "page/base_page.py::BasePage" in keys
+        assert not any(key.endswith("::PASSWORD_INPUT") for key in keys)
+
+    def test_project_imports_skip_page_modules(self, project):
+        assert project_imports("tests/test_shop.py", str(project)) == ["utils/helpers.py"]
@@ -0,0 +1,111 @@
+"""
+test_link_health.py - Párhuzamos link ellenőrzés tesztjei a helyi stand-in szerveren
+"""
+
+import time
+
+import allure
+import pytest
+
+from page.home_page import HomePage
+from utils.command_counter import instrument_driver
+from utils.fake_site import EXAMPLE_LINKS, FakeSiteServer
+from utils.link_health import LinkHealthChecker, attach_results, broken, extract_links, summarize
+
+
+LATENCY = 0.1
+
+
+@pytest.fixture
+def stand_in():
+    with FakeSiteServer(latency=LATENCY) as server:
+        yield server
+
+
+@pytest.fixture
+def home_links(fake_driver, stand_in):
+    homepage = HomePage(fake_driver)
+    homepage.get()
+    return homepage.link_inventory(base_url=stand_in.origin)
+
+
+@allure.epic("Homepage Testing")
+@allure.feature("Link Health")
+class TestLinkHealth:
+
+    def test_inventory_is_one_dom_read(self, fake_driver, stand_in):
+        homepage = HomePage(fake_driver)
+        homepage.get()
+        counter = instrument_driver(fake_driver)
+        before = counter.total
+        links = homepage.link_inventory(base_url=stand_in.origin)
+        assert counter.total - before == 1
+        assert len(links) == len(EXAMPLE_LINKS)
+        assert links[0] == stand_in.origin + "/abtest"
+
+    @pytest.mark.smoke
+    def test_home_links_respond_concurrently(self, home_links, stand_in):
+        checker = LinkHealthChecker(concurrency=len(home_links), per_host=len(home_links))
+        begin = time.perf_counter()
+        results = checker.run(home_links)
+        wall = time.perf_counter() - begin
+
+        summary = summarize(results, wall)
+        attach_results(results, summary)
+        assert broken(results) == []
+        assert [result["url"] for result in results] == home_links
+        # Párhuzamosan: a teljes idő a soros összeg töredéke
+        assert summary["wall_ms"] < summary["sum_ms"] / 4
+        assert stand_in.max_in_flight > 1
+
+    def test_per_host_limit(self, home_links, stand_in):
+        checker = LinkHealthChecker(concurrency=20, per_host=3)
+        checker.run(home_links[:12])
+        assert stand_in.max_in_flight <= 3
+
+    def test_rate_limit_spaces_requests(self, stand_in):
+        stand_in.latency = 0
+        urls = [f"{stand_in.origin}/login?n={n}" for n in range(5)]
+        begin = time.perf_counter()
+        LinkHealthChecker(rate=20).run(urls)
+        assert time.perf_counter() - begin >= 4 / 20 * 0.9
+
+    def test_rate_limited_host_does_not_hold_global_slots(self, stand_in):
+        stand_in.latency = 0
+        slow_host = [f"{stand_in.origin}/login?n={n}" for n in range(6)]
+        other_host = stand_in.origin.replace("127.0.0.1", "localhost") + "/login"
+        finished = {}
+
+        class Checker(LinkHealthChecker):
+            def _fetch(self, url):
+                result = super()._fetch(url)
+                finished[url] = time.perf_counter()
+                return result
+
+        begin = time.perf_counter()
+        Checker(concurrency=2, rate=10).run(slow_host + [other_host])
+        # A rate limitre váró kérések nem foglalnak globális slotot - a másik host nem vár rájuk
+        assert finished[other_host] - begin < 0.1
+        assert finished[slow_host[-1]] - begin >= 0.5 * 0.9
+
+    def test_depth_finds_broken_links_and_redirects(self, stand_in):
+        stand_in.latency = 0
+        results = LinkHealthChecker(depth=1).run([stand_in.origin + "/redirect"])
+        by_url = {result["url"]: result for result in results}
+
+        redirect = by_url[stand_in.origin + "/redirect"]
+        assert redirect["redirects"][0][0] == 302
+        assert redirect["final_url"] == stand_in.origin + "/status_codes"
+        assert by_url[stand_in.origin + "/status_codes/301"]["redirects"][0][0] == 301
+        assert {result["status"] for result in broken(results)} == {404, 500}
+        assert all(result["level"] == 1 for result in results[1:])
+
+    def test_connection_errors_are_results(self):
+        results = LinkHealthChecker(timeout=1).run(["http://127.0.0.1:9/unreachable"])
+        assert results[0]["status"] is None
+        assert results[0]["error"]
+        assert broken(results) == results
+
+    def test_extract_links(self):
+        html = '<a href="/a">A</a><a href="b#top">B</a><a href="mailto:x@y">M</a><a href="/a">A2</a>'
+        assert extract_links(html, "http://site/dir/page") == ["http://site/a", "http://site/dir/b"]
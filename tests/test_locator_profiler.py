@@ -0,0 +1,115 @@
+"""
+test_locator_profiler.py - Locator profiler és CSS/ID átírási javaslatok tesztjei a fake backenden
+"""
+
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from page.home_page import HomePage
+from utils import locator_profiler
+from utils.locator_profiler import (
+    LocatorProfiler, locator_cost, normalize, page_object_locator, selenium_form, suggest
+)
+from utils.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
+
+
+HOME_URL = "https://the-internet.herokuapp.com/"
+LOGIN_URL = "https://the-internet.herokuapp.com/login"
+
+
+def _snapshot(driver, url):
+    driver.get(url)
+    return PageSnapshot.from_script_result(driver.execute_script(SNAPSHOT_SCRIPT))
+
+
+@allure.epic("Tooling")
+@allure.feature("Locator Profiler")
+class TestLocatorProfiler:
+
+    @pytest.mark.parametrize("locator", [
+        (By.ID, "username"),
+        (By.NAME, "password"),
+        (By.CLASS_NAME, "radius"),
+        (By.TAG_NAME, "h2"),
+        (By.XPATH, "//h2"),
+    ])
+    def test_selenium_form_round_trip(self, locator):
+        assert page_object_locator(*selenium_form(locator)) == locator
+
+    def test_normalize_merges_equivalent_forms(self):
+        assert normalize((By.CSS_SELECTOR, '[id="username"]')) == (By.ID, "username")
+        assert normalize((By.CSS_SELECTOR, "h2")) == (By.TAG_NAME, "h2")
+
+    def test_cost_ordering(self):
+        assert locator_cost((By.ID, "flash")) < locator_cost((By.CSS_SELECTOR, "a[href='/logout']"))
+        assert locator_cost((By.CSS_SELECTOR, "#login button")) < locator_cost((By.XPATH, "//button"))
+        assert locator_cost((By.XPATH, "//a")) < locator_cost((By.XPATH, '//a[text()="x"]'))
+
+    def test_suggests_equivalent_css_for_home_links(self, fake_driver):
+        snapshot = _snapshot(fake_driver, HOME_URL)
+        suggestion, matches = suggest(snapshot, HomePage.LINK_AB)
+        assert suggestion == (By.CSS_SELECTOR, 'a[href="/abtest"]')
+        assert matches == 1
+        assert snapshot.nodes(suggestion) == snapshot.nodes(HomePage.LINK_AB)
+
+    def test_suggests_id_for_xpath(self, fake_driver):
+        snapshot = _snapshot(fake_driver, LOGIN_URL)
+        suggestion, _ = suggest(snapshot, (By.XPATH, "//form[@id='login']//input[@type='password']"))
+        assert suggestion == (By.ID, "password")
+
+    def test_positional_xpath_is_not_rewritten_to_first_match(self):
+        html = ('<html><body><div id="content"><ul><li><a href="/abtest">A/B</a></li>'
+                '<li><a href="/basic_auth">Auth</a></li></ul></div></body></html>')
+        snapshot = PageSnapshot(html)
+        locator = (By.XPATH, "//div[@id='content']//a[1]")
+        suggestion, matches = suggest(snapshot, locator)
+        assert matches == 2
+        assert suggestion != (By.CSS_SELECTOR, 'a[href="/abtest"]')
+        assert suggestion is None or snapshot.nodes(suggestion) == snapshot.nodes(locator)
+
+    def test_suggestion_dropped_when_browser_disagrees(self, fake_driver, monkeypatch):
+        # A pillanatkép szerinti javaslat, amelyre a böngésző más elemeket ad vissza
+        monkeypatch.setattr(locator_profiler, "suggest",
+                            lambda snapshot, locator: ((By.CSS_SELECTOR, "input"), 1))
+        profiler = LocatorProfiler(repeat=1)
+        profiler.attach(fake_driver)
+        fake_driver.get(LOGIN_URL)
+        fake_driver.find_element(By.XPATH, "//input[@id='password']")
+        row = profiler.report()[0]
+        assert row["suggestion"] is None
+        assert row["suggestion_timing_ms"] is None
+
+    def test_no_suggestion_for_cheapest_locator(self, fake_driver):
+        snapshot = _snapshot(fake_driver, LOGIN_URL)
+        assert suggest(snapshot, (By.ID, "username")) == (None, 1)
+        assert suggest(snapshot, (By.ID, "missing")) == (None, 0)
+
+    def test_profiler_records_finds_and_misses(self, fake_driver):
+        profiler = LocatorProfiler(repeat=1)
+        profiler.attach(fake_driver)
+        fake_driver.get(LOGIN_URL)
+        fake_driver.find_element(By.XPATH, "//form[@id='login']//input[@type='password']")
+        fake_driver.find_element(By.ID, "username")
+        fake_driver.find_element(By.ID, "username")
+        assert fake_driver.find_elements(By.ID, "missing") == []
+
+        rows = {row["locator"]: row for row in profiler.report()}
+        assert rows["id=username"]["finds"] == 2
+        assert rows["id=username"]["max_matches"] == 1
+        assert rows["id=missing"]["misses"] == 1
+        xpath_row = rows["xpath=//form[@id='login']//input[@type='password']"]
+        assert xpath_row["finds"] == 1  # a mérő parancsok nem számítanak bele
+        assert xpath_row["suggestion"] == "id=password"
+        assert len(xpath_row["suggestion_timing_ms"]) == 2
+
+    def test_report_merges_wait_records(self, fake_driver):
+        profiler = LocatorProfiler(measure_suggestions=False)
+        profiler.attach(fake_driver)
+        fake_driver.get(LOGIN_URL)
+        fake_driver.find_element(By.ID, "username")
+        waits = [{"locator": (By.CSS_SELECTOR, '[id="username"]'), "duration": 0.5, "outcome": "ok"}]
+        row = profiler.report(waits)[0]
+        assert row["locator"] == "id=username"
+        assert row["waits"] == 1
+        assert row["wait_total_ms"] == pytest.approx(500)
@@ -5,8 +5,9 @@ Komplett példa a POM + Pytest + Allure használatára
 
 import pytest
 import allure
+from selenium.webdriver.common.keys import Keys
 from page.login_page import LoginPage
-from pages.secure_area_page import SecureAreaPage
+from page.secure_area_page import SecureAreaPage
 
 
 @allure.epic("Authentication")
@@ -61,7 +62,7 @@ class TestLoginFunctionality:
             assert "The Internet" in page_title, f"Helytelen oldal cím: {page_title}"
 
     @allure.story("Failed Login")
-    @allure.severity(allure.severity_level.HIGH)
+    @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.regression
     @pytest.mark.login
     def test_failed_login_invalid_credentials(self, login_page, invalid_user):
@@ -119,6 +120,37 @@ class TestLoginFunctionality:
                 error_message = result_page.get_error_message()
                 assert error_message is not None, f"Hibaüzenet hiányzik - scenario: {expected_behavior}"
 
+    @allure.story("Credential Input Space")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    @pytest.mark.login
+    @pytest.mark.pairwise("login_inputs.csv")
+    def test_credential_input_space(self, login_page, valid_user, username, password, padding, submit):
+        """
+        Teszt: Hossz / unicode / whitespace / injection bemenetek pairwise lefedéssel
+
+        A paraméterek a test_data/login_inputs.csv-ből jönnek (utils.pairwise):
+        minden érték pár lefedett, a teljes szorzat töredékével
+        """
+        username = padding.replace("{}", username)
+
+        with allure.step(f"When: Login kísérlet ({submit})"):
+            if submit == "enter":
+                login_page.enter_username(username)
+                login_page.type_text(login_page.PASSWORD_INPUT, password + Keys.ENTER)
+                result_page = SecureAreaPage(login_page.driver) if login_page.is_login_successful() else login_page
+            else:
+                result_page = login_page.login(username=username, password=password)
+
+        with allure.step("Then: Csak a pontos érvényes adatokkal lehet belépni"):
+            if username == valid_user["username"] and password == valid_user["password"]:
+                assert isinstance(result_page, SecureAreaPage), "Érvényes adatokkal nem sikerült a login"
+            else:
+                assert isinstance(result_page, LoginPage), "Érvénytelen adatokkal sikerült a login"
+                expected = ("Your username is invalid!" if username != valid_user["username"]
+                            else "Your password is invalid!")
+                assert expected in result_page.get_error_message()
+
     @allure.story("Login Form Validation")
     @allure.severity(allure.severity_level.MINOR)
     @pytest.mark.ui
@@ -127,20 +159,23 @@ class TestLoginFunctionality:
         """
         Teszt: Login form elemeinek jelenléte
         """
+        # Csak olvasó ellenőrzések - egyetlen pillanatképen, egy round-trippel
+        snapshot = login_page.snapshot()
+
         with allure.step("Login form elemek ellenőrzése"):
-            assert login_page.is_login_form_displayed(), "Login form nem látható"
+            assert snapshot.is_element_visible(login_page.LOGIN_FORM), "Login form nem látható"
 
         with allure.step("Username field ellenőrzése"):
-            assert login_page.is_element_present(login_page.USERNAME_INPUT), "Username mező hiányzik"
+            assert snapshot.is_element_present(login_page.USERNAME_INPUT), "Username mező hiányzik"
 
         with allure.step("Password field ellenőrzése"):
-            assert login_page.is_element_present(login_page.PASSWORD_INPUT), "Password mező hiányzik"
+            assert snapshot.is_element_present(login_page.PASSWORD_INPUT), "Password mező hiányzik"
 
         with allure.step("Login button ellenőrzése"):
-            assert login_page.is_element_present(login_page.LOGIN_BUTTON), "Login gomb hiányzik"
+            assert snapshot.is_element_present(login_page.LOGIN_BUTTON), "Login gomb hiányzik"
 
         with allure.step("Page heading ellenőrzése"):
-            heading_text = login_page.get_text(login_page.PAGE_HEADING)
+            heading_text = snapshot.get_text(login_page.PAGE_HEADING)
             assert "Login Page" in heading_text, f"Helytelen heading: {heading_text}"
 
     @allure.story("Login Page Navigation")
@@ -0,0 +1,84 @@
+"""
+test_nav_metrics.py - Navigációs metrikák és budgetek tesztjei a fake backenden
+"""
+
+import json
+
+import allure
+import pytest
+
+from page.login_page import LoginPage
+from utils import nav_metrics
+from utils.nav_metrics import (
+    NavigationBudgetExceeded, NavigationBudgetWarning, NavigationMetricsCollector, load_budgets, parse_budget,
+)
+
+
+@pytest.fixture
+def collector():
+    """Aktív gyűjtő a teszt idejére (a --nav-metrics opciótól függetlenül)"""
+    previous = nav_metrics.active_collector()
+    collector = NavigationMetricsCollector()
+    nav_metrics.set_active_collector(collector)
+    yield collector
+    nav_metrics.set_active_collector(previous)
+
+
+@allure.epic("Tooling")
+@allure.feature("Navigation Metrics")
+class TestNavigationMetrics:
+
+    def test_page_object_navigation_is_recorded(self, fake_driver, collector):
+        page = LoginPage(fake_driver).open()
+        page.refresh()
+
+        assert [record["action"] for record in collector.records] == ["navigate", "refresh"]
+        assert collector.records[0]["path"] == "/login"
+        assert collector.records[0]["metrics"]["dom_content_loaded"] > 0
+        assert collector.summary()["/login"]["count"] == 2
+
+    def test_budget_violation_warns(self, fake_driver, collector):
+        collector.budgets = [parse_budget("/log*:dom_content_loaded=1")]
+
+        with pytest.warns(NavigationBudgetWarning, match="dom_content_loaded"):
+            LoginPage(fake_driver).open()
+
+        assert collector.records[0]["violations"]
+
+    def test_budget_violation_fails_in_fail_mode(self, fake_driver, collector):
+        collector.budgets = [parse_budget("/login:load=1")]
+        collector.mode = "fail"
+
+        with pytest.raises(NavigationBudgetExceeded):
+            LoginPage(fake_driver).open()
+
+    def test_budget_for_other_path_is_ignored(self, fake_driver, collector):
+        collector.budgets = [parse_budget("/secure:load=1")]
+        LoginPage(fake_driver).open()
+
+        assert collector.records[0]["violations"] == []
+
+    def test_disabled_collector_is_noop(self, fake_driver, collector):
+        nav_metrics.set_active_collector(None)
+        LoginPage(fake_driver).open()
+
+        assert collector.records == []
+
+    def test_budget_parsing(self, tmp_path):
+        path = tmp_path / "budgets.json"
+        path.write_text(json.dumps({"/login": {"dom_content_loaded": 800}}))
+
+        budgets = load_budgets(["*:load=2000"], str(path))
+
+        assert budgets == [("/login", {"dom_content_loaded": 800.0}), ("*", {"load": 2000.0})]
+        with pytest.raises(ValueError):
+            parse_budget("/login:paint_time=10")
+
+    def test_session_json(self, fake_driver, collector, tmp_path):
+        LoginPage(fake_driver).open()
+        path = tmp_path / "nav.json"
+        collector.save(str(path))
+
+        data = json.loads(path.read_text())
+        assert data["navigations"][0]["url"].endswith("/login")
+        assert "/login" in data["summary"]
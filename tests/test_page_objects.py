@@ -0,0 +1,215 @@
+"""
+test_page_objects.py - Page object unit tesztek a fake WebDriver backenden
+Böngésző és hálózat nélkül, milliszekundumok alatt futnak
+"""
+
+import allure
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+
+from page.home_page import HomePage
+from page.login_page import LoginPage
+from page.secure_area_page import SecureAreaPage
+from utils.command_counter import instrument_driver
+from utils.event_wait import WaitStats
+
+
+@allure.epic("Page Objects")
+@allure.feature("Fake Backend")
+class TestLoginPageObject:
+
+    @pytest.fixture
+    def login_page(self, fake_driver):
+        return LoginPage(fake_driver).open()
+
+    def test_open_verifies_page(self, login_page):
+        assert login_page.is_login_form_displayed()
+        assert login_page.get_text(login_page.PAGE_HEADING) == "Login Page"
+
+    def test_type_and_read_back_values(self, login_page):
+        login_page.enter_username("testuser123")
+        assert login_page.get_attribute(login_page.USERNAME_INPUT, "value") == "testuser123"
+
+        login_page.type_text(login_page.USERNAME_INPUT, "", clear_first=True)
+        assert login_page.is_username_field_empty()
+
+    @pytest.mark.parametrize("username,password,expected", [
+        ("invalid_user", "wrong_password", "Your username is invalid!"),
+        ("tomsmith", "wrong_password", "Your password is invalid!"),
+    ])
+    def test_invalid_login_shows_flash(self, login_page, username, password, expected):
+        result_page = login_page.login(username, password)
+
+        assert result_page is login_page
+        assert expected in login_page.get_error_message()
+        assert login_page.is_login_form_displayed()
+
+    def test_login_form_elements_present(self, login_page):
+        for locator in (login_page.USERNAME_INPUT, login_page.PASSWORD_INPUT, login_page.LOGIN_BUTTON):
+            assert login_page.is_element_present(locator)
+        assert not login_page.is_element_present((By.ID, "missing"))
+
+
+@allure.epic("Page Objects")
+@allure.feature("Fake Backend")
+class TestHomePageObject:
+
+    def test_links_are_clickable(self, fake_driver):
+        homepage = HomePage(fake_driver)
+        homepage.get()
+
+        assert homepage.link_ab().is_displayed()
+        assert homepage.link_context_menu().text == "Context Menu"
+        assert homepage.get_page_title() == "The Internet"
+
+
+@allure.epic("Page Objects")
+@allure.feature("Fake Backend")
+class TestFakeBackend:
+
+    def test_navigation_makes_elements_stale(self, fake_driver):
+        fake_driver.get("https://the-internet.herokuapp.com/login")
+        heading = fake_driver.find_element(By.TAG_NAME, "h2")
+        fake_driver.refresh()
+
+        with pytest.raises(StaleElementReferenceException):
+            heading.text
+
+    def test_secure_area_requires_login(self, fake_driver):
+        fake_driver.get("https://the-internet.herokuapp.com/secure")
+
+        assert fake_driver.current_url.endswith("/login")
+        assert "You must login" in fake_driver.find_element(By.ID, "flash").text
+
+    def test_selenium_select_works_on_fake_dom(self, fake_driver):
+        fake_driver.get("https://the-internet.herokuapp.com/dropdown")
+        select = Select(fake_driver.find_element(By.ID, "dropdown"))
+
+        select.select_by_visible_text("Option 2")
+        assert select.first_selected_option.get_attribute("value") == "2"
+
+        select.select_by_index(1)
+        assert select.first_selected_option.text == "Option 1"
+
+    def test_screenshot_is_png(self, fake_driver):
+        assert fake_driver.get_screenshot_as_png().startswith(b"\x89PNG")
+
+
+@allure.epic("Page Objects")
+@allure.feature("Element Cache")
+class TestElementCache:
+
+    @pytest.fixture
+    def login_page(self, fake_driver):
+        return LoginPage(fake_driver).open()
+
+    def test_repeated_lookups_hit_cache(self, login_page):
+        counter = instrument_driver(login_page.driver)
+        counter.reset()
+
+        login_page.enter_username("testuser123")
+        login_page.get_attribute(login_page.USERNAME_INPUT, "value")
+        login_page.type_text(login_page.USERNAME_INPUT, "", clear_first=True)
+
+        assert login_page.cache_stats()["hits"] >= 2
+        # Egy keresés: findElement (poll) vagy egy async wait szkript (--wait-strategy=event)
+        assert counter.by_command["findElement"] + counter.by_command["w3cExecuteScriptAsync"] == 1
+
+    def test_navigation_invalidates_cache(self, login_page):
+        login_page.get_text(login_page.PAGE_HEADING)
+        login_page.navigate_to(login_page.url)
+
+        assert login_page.cache_stats()["size"] == 0
+
+    def test_stale_element_is_looked_up_again(self, login_page):
+        login_page.get_text(login_page.PAGE_HEADING)
+        login_page.driver.refresh()  # a page object tudta nélkül - a cache-elt elem stale lesz
+        hits, misses = login_page.cache_hits, login_page.cache_misses
+
+        assert login_page.get_text(login_page.PAGE_HEADING) == "Login Page"
+        assert (login_page.cache_hits, login_page.cache_misses) == (hits, misses + 1)
+
+    @pytest.mark.parametrize("strategy", ["poll", "event"])
+    def test_cached_element_waits_use_wait_engine(self, login_page, strategy):
+        login_page.waiter.strategy = strategy
+        login_page.waiter.stats = stats = WaitStats()
+        login_page.find_element(login_page.USERNAME_INPUT)
+
+        login_page.click(login_page.USERNAME_INPUT)
+        assert login_page.is_element_visible(login_page.USERNAME_INPUT)
+
+        assert login_page.cache_stats()["hits"] == 2
+        assert [(record["strategy"], record["condition"], record["locator"]) for record in stats.records[1:]] == [
+            (strategy, "clickable", login_page.USERNAME_INPUT),
+            (strategy, "visible", login_page.USERNAME_INPUT),
+        ]
+
+    def test_cached_click_has_no_url_round_trips(self, login_page):
+        login_page.find_element(login_page.USERNAME_INPUT)
+        counter = instrument_driver(login_page.driver)
+        counter.reset()
+
+        login_page.click(login_page.USERNAME_INPUT)
+
+        assert counter.by_command["getCurrentUrl"] == 0
+        # Klikkelhetőség (isDisplayed + isEnabled, vagy egy wait szkript) + a klikk - keresés nélkül
+        assert counter.by_command["findElement"] == 0
+        assert counter.total <= 3
+
+    def test_navigating_click_invalidates_cache(self, login_page):
+        login_page.get_text(login_page.PAGE_HEADING)
+        secure_page = login_page.login("tomsmith", "SuperSecretPassword!")
+
+        assert isinstance(secure_page, SecureAreaPage)
+        assert tuple(login_page.PAGE_HEADING) not in login_page._element_cache
+
+    @pytest.mark.parametrize("strategy", ["poll", "event"])
+    def test_stale_cached_element_click_recovers(self, login_page, strategy):
+        login_page.waiter.strategy = strategy
+        login_page.find_element(login_page.USERNAME_INPUT)
+        login_page.driver.refresh()
+        hits, misses = login_page.cache_hits, login_page.cache_misses
+
+        login_page.click(login_page.USERNAME_INPUT)
+        assert (login_page.cache_hits, login_page.cache_misses) == (hits, misses + 1)
+
+    def test_form_submit_on_same_url_recovers(self, login_page):
+        login_page.login("invalid_user", "wrong_password")
+
+        assert login_page.is_login_form_displayed()
+        assert login_page.is_invalid_credentials_displayed()
+
+
+@allure.epic("Page Objects")
+@allure.feature("Fake Backend")
+class TestSecureAreaPageObject:
+
+    def test_login_returns_secure_area(self, fake_driver):
+        secure_page = LoginPage(fake_driver).open().login("tomsmith", "SuperSecretPassword!")
+
+        assert isinstance(secure_page, SecureAreaPage)
+        assert secure_page.is_success_message_displayed()
+        assert secure_page.is_logout_button_displayed()
+
+    def test_logout_returns_to_login(self, fake_driver):
+        secure_page = LoginPage(fake_driver).open().login("tomsmith", "SuperSecretPassword!")
+        login_page = secure_page.logout()
+
+        assert login_page.is_login_form_displayed()
+        assert "logged out" in login_page.get_error_message()
+
+
+@allure.epic("Page Objects")
+@allure.feature("Lazy Loading")
+class TestPageObjectRegistry:
+
+    def test_lazy_attribute_access(self):
+        import page
+        assert page.LoginPage is LoginPage
+
+    def test_missing_page_object_is_reported(self):
+        from page import PageObjectNotFound, load_page_object
+        with pytest.raises(PageObjectNotFound, match="NoSuchPage"):
+            load_page_object("NoSuchPage")
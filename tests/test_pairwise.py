@@ -0,0 +1,155 @@
+"""
+test_pairwise.py - Folyam olvasás és n-wise lefedő halmaz generálás tesztjei
+"""
+
+import json
+
+import allure
+import pytest
+
+from utils.pairwise import (
+    covering_cases, full_product_size, iter_json_records, load_factors, reduction, uncovered_tuples,
+)
+
+
+pytest_plugins = ["pytester"]
+
+GOOD_TESTS = """
+import pytest
+
+
+@pytest.mark.pairwise("inputs.csv")
+def test_inputs(username, submit):
+    assert username and submit
+"""
+
+BAD_TESTS = """
+import pytest
+
+
+@pytest.mark.pairwise("inputs.csv")
+def test_unknown_factor(password):
+    pass
+"""
+
+INPUTS = "factor,label,value\nusername,a,alice\nusername,b,bob\nsubmit,click,click\nsubmit,enter,enter\n"
+
+RECORDS = [
+    {"factor": "username", "label": "valid", "value": "tomsmith"},
+    {"factor": "username", "label": "unicode", "value": "tömsmíth_用户"},
+    {"factor": "username", "label": "long", "value": "a", "repeat": 300},
+    {"factor": "size", "label": "big", "value": 12345678901234567890},
+    {"factor": "size", "label": "small", "value": 1},
+]
+
+
+def _space(*sizes):
+    return {f"f{index}": [(f"v{value}", value) for value in range(size)] for index, size in enumerate(sizes)}
+
+
+@allure.epic("Tooling")
+@allure.feature("Pairwise Data")
+class TestStreamingReaders:
+
+    @pytest.mark.parametrize("layout", ["array", "lines"])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_json_records_across_chunk_boundaries(self, tmp_path, layout, chunk_size):
+        path = tmp_path / "data.json"
+        if layout == "array":
+            path.write_text(json.dumps(RECORDS, ensure_ascii=False, indent=2), encoding="utf-8")
+        else:
+            path.write_text("\n".join(json.dumps(record) for record in RECORDS) + "\n", encoding="utf-8")
+        assert list(iter_json_records(str(path), chunk_size=chunk_size)) == RECORDS
+
+    def test_json_records_are_lazy(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_text(json.dumps(RECORDS[0]) + "\n{broken", encoding="utf-8")
+        records = iter_json_records(str(path), chunk_size=16)
+        assert next(records) == RECORDS[0]
+        with pytest.raises(json.JSONDecodeError):
+            next(records)
+
+    def test_csv_and_json_give_same_factors(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text(
+            "factor,label,value,repeat\n"
+            "username,valid,tomsmith,\n"
+            "username,unicode,tömsmíth_用户,\n"
+            "username,long,a,300\n"
+            'password,padded,"  pw  ",\n',
+            encoding="utf-8",
+        )
+        json_path = tmp_path / "data.json"
+        json_path.write_text(json.dumps(RECORDS[:3] + [{"factor": "password", "label": "padded", "value": "  pw  "}]),
+                             encoding="utf-8")
+
+        factors = load_factors(str(csv_path))
+        assert factors == load_factors(str(json_path))
+        assert factors["username"][2] == ("long", "a" * 300)
+        assert factors["password"] == [("padded", "  pw  ")]
+
+    def test_login_inputs_data_file(self, request):
+        factors = load_factors(str(request.config.rootpath / "test_data" / "login_inputs.csv"))
+        assert list(factors) == ["username", "password", "padding", "submit"]
+        assert all("{}" in value for _, value in factors["padding"])
+
+
+@allure.epic("Tooling")
+@allure.feature("Pairwise Data")
+class TestCoveringCases:
+
+    @pytest.mark.parametrize("sizes, strength", [((6, 6, 4, 2), 2), ((3, 3, 3, 3, 3, 3, 3), 2), ((4, 3, 3, 2, 2), 3)])
+    def test_every_tuple_is_covered(self, sizes, strength):
+        factors = _space(*sizes)
+        cases = covering_cases(factors, strength=strength)
+        assert uncovered_tuples(factors, cases, strength) == []
+        assert len(cases) < full_product_size(factors)
+
+    def test_pairwise_is_near_optimal(self):
+        # 6 x 6 érték pár alsó korlát: 36 eset
+        cases = covering_cases(_space(6, 6, 4, 2))
+        assert 36 <= len(cases) <= 40
+        # 3^13 -> az ismert optimum 15, a mohó algoritmus ennek közelében marad
+        assert len(covering_cases(_space(*[3] * 13))) <= 25
+
+    def test_fixed_seed_is_reproducible(self):
+        factors = _space(5, 4, 4, 3, 2)
+        assert covering_cases(factors, seed=7) == covering_cases(factors, seed=7)
+        assert covering_cases(factors, seed=7) != covering_cases(factors, seed=8)
+
+    def test_strength_at_factor_count_is_full_product(self):
+        factors = _space(3, 2)
+        assert len(covering_cases(factors, strength=2)) == 6
+        assert covering_cases({}) == []
+
+    def test_reduction_summary(self):
+        factors = _space(6, 6, 4, 2)
+        summary = reduction(factors, covering_cases(factors))
+        assert summary["full"] == 288
+        assert summary["reduction"] > 0.85
+
+
+@allure.epic("Tooling")
+@allure.feature("Pairwise Data")
+class TestPairwisePlugin:
+
+    @pytest.fixture
+    def project(self, pytester):
+        pytester.mkdir("test_data")
+        (pytester.path / "test_data" / "inputs.csv").write_text(INPUTS, encoding="utf-8")
+        pytester.makepyfile(test_good=GOOD_TESTS, test_bad=BAD_TESTS)
+        return pytester
+
+    def test_bad_data_is_a_collection_error_of_that_test(self, project):
+        result = project.runpytest("-p", "utils.pairwise", "--continue-on-collection-errors")
+        result.assert_outcomes(passed=4, errors=1)
+        result.stdout.fnmatch_lines(["*test_bad.py::test_unknown_factor: a inputs.csv faktorai*"])
+
+    def test_in_process_sessions_keep_separate_state(self, project, request):
+        outer = request.config.pluginmanager.get_plugin("pairwise")
+        before = dict(outer.summaries)
+        for _ in range(2):
+            result = project.runpytest("-p", "utils.pairwise", "test_good.py")
+            summary = result.stdout.str().split("Pairwise data", 1)[1]
+            assert summary.count("cases instead of") == 1
+        assert outer.summaries == before
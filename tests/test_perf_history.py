@@ -0,0 +1,150 @@
+"""
+test_perf_history.py - A teljesítmény-történet tároló és lekérdezések tesztjei
+Böngésző nélkül futnak
+"""
+
+import sqlite3
+
+import allure
+import pytest
+
+from utils.command_counter import instrument_driver
+from utils.perf_history import PerfHistory, load_historical_durations, main
+
+
+pytest_plugins = ["pytester"]
+
+# Kis suite a projekt driver fixture-ével (fake backend) - a PerfRecorder alapból be van kapcsolva
+SMALL_SUITE = """
+import pytest
+
+
+def test_login_page(driver):
+    driver.get("https://the-internet.herokuapp.com/login")
+    assert driver.title
+
+
+def test_without_driver():
+    pass
+
+
+def test_failing(driver):
+    driver.get("https://the-internet.herokuapp.com/")
+    assert False
+"""
+
+
+def _run(history, durations):
+    """Egy futás rögzítése {nodeid: call_s} alapján"""
+    return history.record_run(
+        [{"nodeid": nodeid, "outcome": "passed", "call_s": value} for nodeid, value in durations.items()],
+        git_revision="abc123"
+    )
+
+
+@pytest.fixture
+def history(tmp_path):
+    store = PerfHistory(str(tmp_path / "perf.sqlite"))
+    yield store
+    store.close()
+
+
+@allure.epic("Tooling")
+@allure.feature("Performance History")
+class TestPerfHistory:
+
+    def test_record_run_single_transaction(self, history):
+        """Egy futás összes rekordja egy run azonosító alá kerül"""
+        run_id = _run(history, {"t::a": 1.0, "t::b": 2.0})
+        rows = history.connection.execute(
+            "SELECT nodeid, git_revision FROM test_results JOIN runs ON runs.id = run_id WHERE run_id = ?",
+            (run_id,)
+        ).fetchall()
+        assert sorted(rows) == [("t::a", "abc123"), ("t::b", "abc123")]
+
+    def test_slowest_orders_by_median(self, history):
+        for _ in range(3):
+            _run(history, {"t::fast": 0.1, "t::slow": 3.0, "t::medium": 1.0})
+        assert [row[0] for row in history.slowest(limit=2)] == ["t::slow", "t::medium"]
+
+    def test_trending_detects_slowdown(self, history):
+        for step in range(6):
+            _run(history, {"t::stable": 1.0, "t::growing": 1.0 + step * 0.5})
+        trending = history.trending(runs=6)
+        assert [row[0] for row in trending] == ["t::growing"]
+
+    def test_outliers_flags_latest_spike(self, history):
+        for value in (1.0, 1.1, 0.9, 1.05, 1.0, 0.95):
+            _run(history, {"t::spiky": value, "t::calm": value})
+        _run(history, {"t::spiky": 9.0, "t::calm": 1.0})
+        assert [row[0] for row in history.outliers()] == ["t::spiky"]
+
+    def test_historical_durations_for_schedulers(self, history, tmp_path):
+        _run(history, {"t::a": 1.0})
+        _run(history, {"t::a": 3.0})
+        _run(history, {"t::a": 2.0})
+        assert load_historical_durations(history.db_path) == {"t::a": 2.0}
+        assert load_historical_durations(str(tmp_path / "missing.sqlite")) == {}
+
+    def test_cli_slowest(self, history, capsys):
+        _run(history, {"t::a": 1.5})
+        assert main(["--db", history.db_path, "slowest"]) == 0
+        assert "t::a" in capsys.readouterr().out
+
+
+@allure.epic("Tooling")
+@allure.feature("Performance History")
+class TestCommandCounter:
+
+    def test_counts_every_execute_call(self):
+        class Driver:
+            def execute(self, driver_command, params=None):
+                return {"value": None}
+
+        driver = Driver()
+        counter = instrument_driver(driver)
+        driver.execute("get", {"url": "x"})
+        driver.execute("findElement")
+        driver.execute("findElement")
+
+        assert counter.total == 3
+        assert counter.by_command["findElement"] == 2
+        assert instrument_driver(driver) is counter
+
+
+@allure.epic("Tooling")
+@allure.feature("Performance History")
+class TestPerfRecorder:
+
+    def test_suite_run_is_recorded(self, pytester, monkeypatch, request):
+        root = request.config.rootpath
+        pytester.makeconftest((root / "conftest.py").read_text(encoding="utf-8"))
+        pytester.makepyfile(test_suite=SMALL_SUITE)
+        monkeypatch.setenv("PYTHONPATH", str(root))
+
+        for _ in range(2):
+            result = pytester.runpytest_subprocess("-p", "no:cacheprovider", "--backend=fake",
+                                                   "--perf-db=perf.sqlite")
+            result.assert_outcomes(passed=2, failed=1)
+
+        connection = sqlite3.connect(pytester.path / "perf.sqlite")
+        try:
+            assert connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+            rows = {
+                row[0]: row[1:] for row in connection.execute(
+                    "SELECT nodeid, outcome, setup_s, call_s, teardown_s, driver_startup_s, command_count "
+                    "FROM test_results WHERE run_id = (SELECT MAX(id) FROM runs)"
+                )
+            }
+        finally:
+            connection.close()
+
+        outcome, setup_s, call_s, teardown_s, startup_s, commands = rows["test_suite.py::test_login_page"]
+        assert outcome == "passed"
+        assert min(setup_s, call_s, teardown_s) >= 0
+        assert 0 < startup_s <= setup_s
+        # maximize_window + implicitly_wait + get + getTitle
+        assert commands == 4
+        assert rows["test_suite.py::test_without_driver"][-2:] == (None, None)
+        assert rows["test_suite.py::test_failing"][0] == "failed"
+        assert rows["test_suite.py::test_failing"][-1] >= 3  # + a hiba utáni screenshot / diagnosztika
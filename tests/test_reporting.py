@@ -0,0 +1,82 @@
+"""
+test_reporting.py - --report-level lépés pufferelés és környezeti adatok tesztjei
+"""
+
+import allure
+import pytest
+
+from utils import reporting
+from utils.reporting import buffered_steps, reset_step_buffer, step, write_environment
+
+
+class _Page:
+
+    @step("Külső lépés: {name}")
+    def outer(self, name):
+        return self.inner(name.upper())
+
+    @step("Belső lépés: {value}")
+    def inner(self, value):
+        return value
+
+    @step("Hibás lépés")
+    def broken(self):
+        raise ValueError("boom")
+
+    @step("Hibás külső lépés")
+    def outer_broken(self):
+        self.broken()
+
+
+@pytest.fixture
+def report_level():
+    original = reporting.report_level()
+    reset_step_buffer()
+
+    def set_level(level):
+        reporting.set_report_level(level)
+
+    yield set_level
+    reporting.set_report_level(original)
+    reset_step_buffer()
+
+
+@allure.epic("Tooling")
+@allure.feature("Report Level")
+class TestReportLevel:
+
+    def test_minimal_buffers_nested_steps_only(self, report_level):
+        report_level("minimal")
+
+        assert _Page().outer("login") == "LOGIN"
+
+        steps = buffered_steps()
+        assert [entry.format_title() for entry in steps] == ["Belső lépés: LOGIN"]
+        assert steps[0].depth == 1
+
+    def test_full_does_not_buffer(self, report_level):
+        report_level("full")
+
+        _Page().outer("login")
+
+        assert buffered_steps() == []
+
+    def test_failed_nested_step_is_marked(self, report_level):
+        report_level("minimal")
+
+        with pytest.raises(ValueError):
+            _Page().outer_broken()
+
+        assert "FAILED (ValueError)" in buffered_steps()[0].format()
+
+    def test_unknown_level_is_rejected(self):
+        with pytest.raises(ValueError):
+            reporting.set_report_level("verbose")
+
+    def test_environment_properties_written_once(self, tmp_path):
+        path = write_environment(str(tmp_path), {"Browser": "chrome", "Base.URL": "https://example.org"})
+
+        assert open(path, encoding="utf-8").read().splitlines() == [
+            "Browser=chrome",
+            "Base.URL=https://example.org",
+        ]
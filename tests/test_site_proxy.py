@@ -0,0 +1,237 @@
+"""
+test_site_proxy.py - Cache-elő site proxy tesztjei egy helyi upstream szerverrel
+"""
+
+import http.client
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils.site_proxy import CachingProxy, ContentCache
+
+
+class _Upstream(BaseHTTPRequestHandler):
+    """Helyi upstream: útvonalanként számolja a kéréseket"""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, headers=()):
+        self.server.hits[self.path] = self.server.hits.get(self.path, 0) + 1
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/session":
+            self._send(200, b"personal", [("Set-Cookie", "rack.session=abc")])
+        elif self.path == "/old":
+            self._send(301, b"", [("Location", f"http://{self.headers['Host']}/new")])
+        else:
+            self._send(200, f"page {self.path}".encode(), [("Content-Type", "text/html")])
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self._send(303, b"posted " + self.rfile.read(length), [("Location", "/secure")])
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Upstream)
+    server.hits = {}
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ContentCache(str(tmp_path / "cache"), max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def dropping_upstream():
+    """Upstream, amely minden kérést beolvas, majd válasz nélkül bontja a kapcsolatot -> (origin, metódusok)"""
+    listener = socket.create_server(("127.0.0.1", 0))
+    requests = []
+
+    def serve():
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            with connection:
+                requests.append(connection.recv(65536).split(b" ", 1)[0].decode())
+
+    threading.Thread(target=serve, daemon=True).start()
+    yield "http://%s:%d" % listener.getsockname()[:2], requests
+    listener.close()
+
+
+def _origin(server):
+    return "http://%s:%d" % server.server_address[:2]
+
+
+def _fetch(proxy, path, method="GET", body=None):
+    """Kérés a proxyn keresztül (abszolút URL = forward proxy, relatív = gateway)"""
+    connection = http.client.HTTPConnection(proxy.address, timeout=5)
+    try:
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def start_proxy():
+    proxies = []
+
+    def start(cache, **kwargs):
+        proxy = CachingProxy(cache, **kwargs).start()
+        proxies.append(proxy)
+        return proxy
+
+    yield start
+    for proxy in proxies:
+        proxy.stop()
+
+
+@allure.epic("Tooling")
+@allure.feature("Site Proxy")
+class TestSiteProxy:
+
+    def test_second_request_is_served_from_cache(self, upstream, cache, start_proxy):
+        proxy = start_proxy(cache, mode="cache")
+        url = _origin(upstream) + "/login"
+        first = _fetch(proxy, url)
+        second = _fetch(proxy, url)
+        assert first[2] == second[2] == b"page /login"
+        assert upstream.hits["/login"] == 1
+        assert proxy.stats.counts["hits"] == 1
+        assert proxy.stats.counts["misses"] == 1
+
+    def test_head_miss_stores_full_body_for_get(self, upstream, cache, start_proxy):
+        proxy = start_proxy(cache, mode="cache")
+        url = _origin(upstream) + "/x"
+        status, headers, body = _fetch(proxy, url, method="HEAD")
+        assert (status, body) == (200, b"")
+        assert headers["Content-Length"] == str(len(b"page /x"))
+        assert _fetch(proxy, url)[2] == b"page /x"
+        assert upstream.hits["/x"] == 1
+
+    def test_session_responses_are_not_cached(self, upstream, cache, start_proxy):
+        proxy = start_proxy(cache, mode="cache")
+        url = _origin(upstream) + "/session"
+        _fetch(proxy, url)
+        _fetch(proxy, url)
+        assert upstream.hits["/session"] == 2
+        assert proxy.stats.counts["stored"] == 0
+
+    def test_record_then_offline(self, upstream, cache, start_proxy):
+        recorder = start_proxy(cache, mode="record")
+        url = _origin(upstream)
+        _fetch(recorder, url + "/session")
+        _fetch(recorder, url + "/authenticate", method="POST", body=b"username=tomsmith")
+        recorder.stop()
+        upstream.shutdown()
+
+        offline = start_proxy(cache, mode="offline")
+        assert _fetch(offline, url + "/session")[2] == b"personal"
+        status, headers, body = _fetch(offline, url + "/authenticate", method="POST", body=b"username=tomsmith")
+        assert (status, headers["Location"], body) == (303, "/secure", b"posted username=tomsmith")
+        assert _fetch(offline, url + "/never-recorded")[0] == 504
+        assert offline.stats.counts["offline_misses"] == 1
+
+    @pytest.mark.parametrize("method, attempts", [("GET", 2), ("POST", 1)])
+    def test_only_idempotent_requests_are_resent(self, dropping_upstream, cache, start_proxy, method, attempts):
+        origin, requests = dropping_upstream
+        proxy = start_proxy(cache, mode="record")
+        assert _fetch(proxy, origin + "/authenticate", method=method, body=b"username=tomsmith")[0] == 502
+        assert requests == [method] * attempts
+
+    def test_gateway_rewrites_redirects(self, upstream, cache, start_proxy):
+        proxy = start_proxy(cache, mode="cache", upstream=_origin(upstream))
+        status, headers, _ = _fetch(proxy, "/old")
+        assert status == 301
+        assert headers["Location"] == proxy.origin + "/new"
+        assert _fetch(proxy, "/new")[2] == b"page /new"
+
+    def test_cached_redirect_follows_restarted_proxy(self, upstream, tmp_path, start_proxy):
+        # A cache-elt Location nem köthető az előző futás (ephemeral) portjához
+        first_cache = ContentCache(str(tmp_path / "cache"))
+        recorder = start_proxy(first_cache, mode="record", upstream=_origin(upstream))
+        _fetch(recorder, "/old")
+        _fetch(recorder, "/new")
+        recorder.stop()
+        first_cache.close()
+        upstream.shutdown()
+
+        cache = ContentCache(str(tmp_path / "cache"))
+        try:
+            offline = start_proxy(cache, mode="offline", upstream=_origin(upstream))
+            assert offline.origin != recorder.origin
+            status, headers, _ = _fetch(offline, "/old")
+            assert (status, headers["Location"]) == (301, offline.origin + "/new")
+            assert _fetch(offline, headers["Location"][len(offline.origin):])[2] == b"page /new"
+        finally:
+            cache.close()
+
+    def test_route_rewrites_driver_urls(self, cache, start_proxy):
+        proxy = start_proxy(cache, mode="cache", upstream="https://the-internet.herokuapp.com")
+        sent = []
+
+        class Driver:
+            def execute(self, command, params=None):
+                sent.append((command, params))
+                return {"value": proxy.origin + "/secure"}
+
+        driver = proxy.route(Driver())
+        driver.execute("get", {"url": "https://the-internet.herokuapp.com/login"})
+        assert sent[0][1]["url"] == proxy.origin + "/login"
+        assert driver.execute("getCurrentUrl")["value"] == "https://the-internet.herokuapp.com/secure"
+
+
+@allure.epic("Tooling")
+@allure.feature("Site Proxy")
+class TestContentCache:
+
+    def test_identical_bodies_are_stored_once(self, cache):
+        for path in ("/a", "/b"):
+            cache.put(cache.key("GET", path), "GET", path, 200, "OK", [], b"same body")
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == len(b"same body")
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ContentCache(str(tmp_path / "small"), max_bytes=25)
+        try:
+            keys = {path: cache.key("GET", path) for path in ("/a", "/b", "/c")}
+            cache.put(keys["/a"], "GET", "/a", 200, "OK", [], b"a" * 10)
+            cache.put(keys["/b"], "GET", "/b", 200, "OK", [], b"b" * 10)
+            assert cache.get(keys["/a"]) is not None  # /a frissebb, mint /b
+            cache.put(keys["/c"], "GET", "/c", 200, "OK", [], b"c" * 10)
+            assert cache.get(keys["/b"]) is None
+            assert cache.get(keys["/a"]).body == b"a" * 10
+            assert cache.stats()["bytes"] <= 25
+        finally:
+            cache.close()
+
+    def test_head_uses_get_entry(self, cache):
+        assert cache.key("HEAD", "/x") == cache.key("GET", "/x")
+        assert cache.key("POST", "/x", b"1") != cache.key("POST", "/x", b"2")
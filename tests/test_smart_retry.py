@@ -0,0 +1,237 @@
+"""
+test_smart_retry.py - Átmeneti hibák újrapróbálásának tesztjei (külön pytest processzben, fake driverrel)
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+from types import SimpleNamespace
+
+import allure
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException, WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError
+
+from utils import smart_retry
+from utils.smart_retry import SmartRetryPlugin, is_transient, parse_budget, park_driver, retry_pending_key, reuse_driver
+
+
+INNER_CONFTEST = '''
+import pytest
+from utils.fake_driver import FakeWebDriver
+from utils.smart_retry import park_driver, reuse_driver
+
+LAUNCHES = []
+
+
+@pytest.fixture
+def driver(request):
+    driver = reuse_driver(request)
+    if driver is None:
+        driver = FakeWebDriver()
+        LAUNCHES.append(driver)
+    yield driver
+    if not park_driver(request, driver):
+        driver.quit()
+
+
+@pytest.fixture
+def launches():
+    return LAUNCHES
+'''
+
+INNER_TESTS = '''
+import itertools
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+CALLS = {name: itertools.count(1) for name in ("flaky", "broken", "hard")}
+
+
+def test_flaky(driver, launches):
+    driver.add_cookie({"name": "attempt", "value": "x"})
+    if next(CALLS["flaky"]) == 1:
+        raise TimeoutException("element not clickable yet")
+    assert len(launches) == 1  # ugyanaz a böngésző
+    assert driver.current_url == "about:blank"
+    assert driver.get_cookies() == [{"name": "attempt", "value": "x"}]  # csak ez a próbálkozás sütije
+
+
+def test_broken(driver):
+    next(CALLS["broken"])
+    raise TimeoutException("never loads")
+
+
+def test_hard_failure(driver):
+    assert next(CALLS["hard"]) == 1
+    raise NoSuchElementException("wrong locator")
+'''
+
+
+# A projekt driver fixture-ével (a gyökér conftest másolatával) futó tesztek
+PROJECT_TESTS = '''
+import itertools
+from selenium.common.exceptions import TimeoutException
+
+CALLS = itertools.count(1)
+
+
+def _visit(driver):
+    driver.get("https://the-internet.herokuapp.com/login")
+    return driver.title
+
+
+def test_steady(driver):
+    _visit(driver)
+
+
+def test_flaky(driver):
+    _visit(driver)
+    if next(CALLS) == 1:
+        raise TimeoutException("element not clickable yet")
+'''
+
+
+def _run_inner(tmp_path, *args):
+    (tmp_path / "conftest.py").write_text(textwrap.dedent(INNER_CONFTEST), encoding="utf-8")
+    (tmp_path / "test_inner.py").write_text(textwrap.dedent(INNER_TESTS), encoding="utf-8")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    command = [sys.executable, "-m", "pytest", "-p", "utils.smart_retry", "-p", "no:cacheprovider",
+               *args]
+    return subprocess.run(command, cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120)
+
+
+@pytest.fixture
+def cassette_option():
+    """Config helyettes a park_driver-hez (a futó session opcióit nem módosítjuk)"""
+    return SimpleNamespace(getoption=lambda name, default=None: "off")
+
+
+@allure.epic("Tooling")
+@allure.feature("Smart Retry")
+class TestTransientClassification:
+
+    @pytest.mark.parametrize("error", [
+        TimeoutException("timed out"),
+        StaleElementReferenceException("stale"),
+        ConnectionRefusedError("refused"),
+        MaxRetryError(None, "/session", "connection pool"),
+        WebDriverException("chrome not reachable"),
+        WebDriverException("invalid session id: session deleted because of page crash"),
+    ])
+    def test_transient(self, error):
+        assert is_transient(error)
+
+    @pytest.mark.parametrize("error", [
+        NoSuchElementException("no such element"),
+        AssertionError("wrong text"),
+        WebDriverException("unknown error: element click intercepted"),
+    ])
+    def test_not_transient(self, error):
+        assert not is_transient(error)
+
+    def test_cause_chain(self):
+        try:
+            try:
+                raise StaleElementReferenceException("stale")
+            except StaleElementReferenceException as stale:
+                raise AssertionError("page not ready") from stale
+        except AssertionError as error:
+            assert is_transient(error)
+
+    @pytest.mark.parametrize("spec, count, expected", [("5", 100, 5), ("10%", 114, 11), ("10%", 3, 1), ("0", 10, 0)])
+    def test_budget(self, spec, count, expected):
+        assert parse_budget(spec, count) == expected
+
+
+@allure.epic("Tooling")
+@allure.feature("Smart Retry")
+class TestBrowserReuse:
+
+    def test_parked_driver_is_reset_and_reused(self, fake_driver, monkeypatch, cassette_option):
+        plugin = SmartRetryPlugin(1, "1", "unused.json")
+        monkeypatch.setattr(smart_retry, "_plugin", plugin)
+        node = SimpleNamespace(nodeid="t::x", stash=pytest.Stash())
+        request = SimpleNamespace(node=node, config=cassette_option)
+
+        fake_driver.add_cookie({"name": "session", "value": "1"})
+        assert not park_driver(request, fake_driver)  # nincs függő újrapróbálás
+        node.stash[retry_pending_key] = True
+        assert park_driver(request, fake_driver)
+
+        assert reuse_driver(request) is fake_driver
+        assert fake_driver.get_cookies() == []
+        assert fake_driver.current_url == "about:blank"
+        assert reuse_driver(request) is None
+        assert plugin.reused == 1
+
+    def test_dead_parked_driver_is_discarded(self, fake_driver, monkeypatch, cassette_option):
+        plugin = SmartRetryPlugin(1, "1", "unused.json")
+        plugin.parked["t::x"] = fake_driver
+        monkeypatch.setattr(smart_retry, "_plugin", plugin)
+        monkeypatch.setattr(fake_driver, "delete_all_cookies",
+                            lambda: (_ for _ in ()).throw(WebDriverException("chrome not reachable")))
+        request = SimpleNamespace(node=SimpleNamespace(nodeid="t::x"), config=cassette_option)
+        assert reuse_driver(request) is None
+        assert plugin.reused == 0
+
+
+@allure.epic("Tooling")
+@allure.feature("Smart Retry")
+class TestRetryRun:
+
+    def test_only_transient_failures_retry_within_budget(self, tmp_path):
+        result = _run_inner(tmp_path, "--retries=2", "--retry-budget=2", "--retry-stats-file=stats.json")
+        assert "2 failed, 1 passed, 2 rerun" in result.stdout, result.stdout
+        assert "Smart retry" in result.stdout
+
+        stats = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))
+        tests = stats["tests"]
+        assert [attempt["outcome"] for attempt in tests["test_inner.py::test_flaky"]] == ["failed", "passed"]
+        # A második TimeoutException után elfogy a keret
+        assert [attempt["exception"] for attempt in tests["test_inner.py::test_broken"]] == ["TimeoutException"] * 2
+        assert len(tests["test_inner.py::test_hard_failure"]) == 1
+        assert (stats["used"], stats["denied"], stats["reused_browsers"]) == (2, 1, 2)
+
+    def test_allure_shows_one_flaky_result(self, tmp_path):
+        result = _run_inner(tmp_path, "--retries=1", "--retry-budget=5", "--alluredir=allure",
+                            "-k", "flaky", "--retry-stats-file=stats.json")
+        assert "1 passed, 2 deselected, 1 rerun" in result.stdout, result.stdout
+
+        results = [json.loads(path.read_text(encoding="utf-8"))
+                   for path in (tmp_path / "allure").glob("*-result.json")]
+        assert len(results) == 1
+        test = results[0]
+        assert test["status"] == "passed"
+        assert test["statusDetails"]["flaky"] is True
+        assert test["steps"][0]["name"] == "Attempt 1: TimeoutException"
+        assert test["steps"][0]["status"] == "broken"
+        assert {"name": "Attempts", "value": "2", "excluded": True}.items() <= test["parameters"][-1].items()
+        labels = [(label["name"], label["value"]) for label in test["labels"]]
+        assert len(labels) == len(set(labels))
+
+    def test_reused_driver_counts_only_last_attempt(self, tmp_path, request):
+        # A parkolt driver számlálója az előző próbálkozás parancsait is tartalmazza
+        root = request.config.rootpath
+        (tmp_path / "conftest.py").write_text((root / "conftest.py").read_text(encoding="utf-8"), encoding="utf-8")
+        (tmp_path / "test_project.py").write_text(textwrap.dedent(PROJECT_TESTS), encoding="utf-8")
+        env = dict(os.environ, PYTHONPATH=str(root) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", "--backend=fake",
+             "--retries=1", "--perf-db=perf.sqlite", "test_project.py"],
+            cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+        )
+        assert "2 passed, 1 rerun" in result.stdout, result.stdout
+
+        connection = sqlite3.connect(tmp_path / "perf.sqlite")
+        try:
+            counts = dict(connection.execute("SELECT nodeid, command_count FROM test_results"))
+        finally:
+            connection.close()
+        assert counts["test_project.py::test_flaky"] == counts["test_project.py::test_steady"] > 0
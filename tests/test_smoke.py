@@ -1,6 +1,7 @@
 import sys
 import os
 import allure
+import pytest
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from page.home_page import HomePage
@@ -9,13 +10,12 @@ from page.home_page import HomePage
 @allure.feature("Link Verification")
 class TestSmoke(object):  # Test prefix kell pytest-hez
 
-    def setup_method(self):
-        self.homepage = HomePage()
+    @pytest.fixture(autouse=True)
+    def open_homepage(self, driver):
+        # A driver fixture kezeli a böngészőt (--browser, --backend), a teardown is ott van
+        self.homepage = HomePage(driver)
         self.homepage.get()
 
-    def teardown_method(self):
-        self.homepage.quit()
-
     @allure.story("Smoke Test - All Links Present")
     @allure.severity(allure.severity_level.CRITICAL)
     def test_smoke_all_links_displayed(self):
@@ -0,0 +1,81 @@
+"""
+test_snapshot.py - Oldal pillanatkép (BasePage.snapshot) tesztjei a fake backenden
+"""
+
+import allure
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from page.login_page import LoginPage
+from utils.command_counter import instrument_driver
+from utils.snapshot import PageSnapshot
+
+
+@pytest.fixture
+def login_page(fake_driver):
+    return LoginPage(fake_driver).open()
+
+
+@allure.epic("Page Objects")
+@allure.feature("DOM Snapshot")
+class TestPageSnapshot:
+
+    def test_snapshot_is_single_round_trip(self, login_page):
+        counter = instrument_driver(login_page.driver)
+        counter.reset()
+
+        snapshot = login_page.snapshot()
+        for locator in (login_page.USERNAME_INPUT, login_page.PASSWORD_INPUT,
+                        login_page.LOGIN_BUTTON, login_page.PAGE_HEADING):
+            assert snapshot.is_element_present(locator)
+        assert snapshot.get_text(login_page.PAGE_HEADING) == "Login Page"
+
+        assert counter.total == 1
+
+    @pytest.mark.parametrize("locator", [
+        (By.ID, "username"),
+        (By.CSS_SELECTOR, "form#login input[name='username']"),
+        (By.XPATH, '//form[@id="login"]//input[@type="text"]'),
+        (By.TAG_NAME, "input"),
+    ])
+    def test_supported_locator_types(self, login_page, locator):
+        assert login_page.snapshot().get_attribute(locator, "id") == "username"
+
+    def test_reflects_form_state_and_visibility(self, login_page):
+        login_page.enter_username("tomsmith")
+        snapshot = login_page.snapshot()
+
+        assert snapshot.get_attribute(login_page.USERNAME_INPUT, "value") == "tomsmith"
+        assert snapshot.is_element_visible(login_page.LOGIN_FORM)
+        assert not snapshot.is_element_visible((By.TAG_NAME, "title"))
+
+    def test_snapshot_is_immutable(self, login_page):
+        snapshot = login_page.snapshot()
+        with pytest.raises(AttributeError):
+            snapshot.url = "changed"
+        with pytest.raises(NoSuchElementException):
+            snapshot.find_element((By.ID, "missing"))
+
+    def test_browser_visibility_overrides_heuristics(self):
+        html = ('<html><body><div id="shown" data-snapshot-visible="1">a</div>'
+                '<div id="gone" data-snapshot-visible="0">b</div></body></html>')
+        snapshot = PageSnapshot(html)
+
+        assert snapshot.is_element_visible((By.ID, "shown"))
+        assert not snapshot.is_element_visible((By.ID, "gone"))
+        assert snapshot.get_attribute((By.ID, "shown"), "data-snapshot-visible") is None
+
+    @pytest.mark.parametrize("xpath, expected", [
+        ("//li[1]", ["a", "c", "e"]),
+        ("//li[last()]", ["b", "d", "e"]),
+        ("//ul//li[2]", ["b", "d"]),
+        ("//div[@id='content']//li[1]", ["a", "c", "e"]),
+        ("//li[1]//li", []),
+    ])
+    def test_descendant_predicates_apply_per_parent(self, xpath, expected):
+        # A "//x[n]" a böngészőhöz hasonlóan szülőnként az n-edik, nem "(//x)[n]"
+        html = ('<html><body><div id="content"><ul><li>a</li><li>b</li></ul>'
+                '<ul><li>c</li><li>d<ul><li>e</li></ul></li></ul></div></body></html>')
+        elements = PageSnapshot(html).find_elements((By.XPATH, xpath))
+        assert [element.text.split("\n")[0] for element in elements] == expected
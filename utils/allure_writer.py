@@ -0,0 +1,411 @@
+"""
+allure_writer.py - Kötegelt Allure results író (háttérszál, attachment pool, opcionális archívum)
+
+Az allure-pytest alap loggere minden eredményt, containert és csatolmányt a teszt szálán,
+egyenként ír ki. Ez a plugin lecseréli:
+    batched - az elemek sorba kerülnek, egy háttérszál kötegekben írja őket az alluredir-be
+    packed  - ugyanígy, de egyetlen tar archívumba (reports/allure-results/allure-results.tar),
+              amely a futás végén (--allure-expand) vagy később kibontható szabványos Allure könyvtárrá
+Az azonos tartalmú csatolmányok (pl. ugyanaz a browser konfiguráció) tartalom hash alapján
+egyszer íródnak ki, az eredmények ugyanarra a fájlra hivatkoznak.
+
+Használat:
+    pytest --alluredir=reports/allure-results --allure-writer=batched
+    pytest --alluredir=reports/allure-results --allure-writer=packed
+    python -m utils.allure_writer expand reports/allure-results/allure-results.tar
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+
+import allure_commons
+import pytest
+from allure_commons.logger import AllureFileLogger
+from attr import asdict
+
+
+WRITER_MODES = ("direct", "batched", "packed")
+PACK_NAME = "allure-results.tar"
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.2  # másodperc - ennyit vár további elemekre egy köteg lezárása előtt
+PACK_BUFFER_SIZE = 1024 * 1024
+
+_STOP = object()
+
+
+def _serialize(item):
+    """Ugyanaz a JSON, mint az AllureFileLogger kimenete (üres mezők nélkül)"""
+    return asdict(item, filter=lambda _, value: value or value is False)
+
+
+def _rewrite_sources(data, aliases):
+    """Az eredmény (és lépései) attachment hivatkozásainak átírása a pool-ozott fájlnevekre"""
+    for attachment in data.get("attachments", ()):
+        attachment["source"] = aliases.get(attachment.get("source"), attachment.get("source"))
+    for key in ("steps", "befores", "afters"):
+        for child in data.get(key, ()):
+            _rewrite_sources(child, aliases)
+
+
+class WriterStats:
+    """Író statisztikák - írási syscallok, kötegek, várakozási idő a sorban"""
+
+    def __init__(self):
+        self.items = 0
+        self.batches = 0
+        self.write_calls = 0
+        self.files = 0
+        self.bytes_written = 0
+        self.pooled = 0
+        self.pooled_bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record_latency(self, seconds):
+        self.items += 1
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def as_dict(self):
+        return {
+            "items": self.items,
+            "batches": self.batches,
+            "write_calls": self.write_calls,
+            "files": self.files,
+            "bytes_written": self.bytes_written,
+            "pooled": self.pooled,
+            "pooled_bytes": self.pooled_bytes,
+            "latency_avg_ms": self.latency_total / self.items * 1000 if self.items else 0.0,
+            "latency_max_ms": self.latency_max * 1000,
+        }
+
+
+# ===== KIMENETEK =====
+
+class DirectorySink:
+    """Szabványos Allure könyvtár - fájlonként egy open/write/close"""
+
+    def __init__(self, report_dir, stats):
+        self.report_dir = report_dir
+        self.stats = stats
+        os.makedirs(report_dir, exist_ok=True)
+
+    def write(self, name, data):
+        fd = os.open(os.path.join(self.report_dir, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                self.stats.write_calls += 1
+                view = view[written:]
+        finally:
+            os.close(fd)
+        self.stats.files += 1
+        self.stats.bytes_written += len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _CountingFileIO(io.FileIO):
+
+    def __init__(self, path, mode, stats):
+        super().__init__(path, mode)
+        self.stats = stats
+
+    def write(self, data):
+        self.stats.write_calls += 1
+        return super().write(data)
+
+
+class PackSink:
+    """Egyetlen tar archívum - a köteg a pufferben gyűlik, flush-kor egy-két write syscall"""
+
+    def __init__(self, path, stats):
+        self.path = path
+        self.stats = stats
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._raw = _CountingFileIO(path, "wb", stats)
+        self._buffer = io.BufferedWriter(self._raw, buffer_size=PACK_BUFFER_SIZE)
+        import tarfile  # csak --allure-pack esetén töltődik be
+        self._tar = tarfile.open(fileobj=self._buffer, mode="w", format=tarfile.PAX_FORMAT)
+
+    def write(self, name, data):
+        info = self._tar.tarinfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+        self.stats.files += 1
+        self.stats.bytes_written += len(data)
+
+    def flush(self):
+        self._buffer.flush()
+
+    def close(self):
+        self._tar.close()
+        self._buffer.close()
+
+
+def expand_pack(pack_path, destination=None):
+    """
+    Archívum kibontása szabványos Allure results könyvtárrá
+    :return: a kibontott fájlok száma
+    """
+    destination = destination or os.path.dirname(os.path.abspath(pack_path))
+    os.makedirs(destination, exist_ok=True)
+    import tarfile
+    with tarfile.open(pack_path, "r") as archive:
+        members = [member for member in archive.getmembers() if member.isfile()]
+        if hasattr(tarfile, "data_filter"):
+            archive.extractall(destination, members=members, filter="data")
+        else:
+            # Python < 3.10.12 / 3.11.4: nincs extraction filter - a célkönyvtáron kívülre mutató
+            # útvonalak kézi elutasítása (csak sima fájlokat bontunk ki, link nem kerülhet ki)
+            for member in members:
+                _check_member(member, destination)
+            archive.extractall(destination, members=members)
+    return len(members)
+
+
+def _check_member(member, destination):
+    """A "data" filter útvonal ellenőrzése sima fájlokra: abszolút vagy kilépő név -> TarError"""
+    import tarfile
+    root = os.path.realpath(destination)
+    target = os.path.realpath(os.path.join(root, member.name))
+    if os.path.isabs(member.name) or os.path.commonpath([root, target]) != root:
+        raise tarfile.TarError(f"{member.name!r} a célkönyvtáron kívülre mutat ({destination})")
+
+
+# ===== ÍRÓ =====
+
+class BatchedResultsWriter:
+    """
+    allure_commons plugin - az AllureFileLogger helyett
+    A hookok csak sorba teszik az elemeket; a szerializálás, a pool-ozás és az írás a háttérszálon fut.
+    """
+
+    def __init__(self, sink, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.sink = sink
+        self.stats = sink.stats
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._aliases = {}   # eredeti attachment fájlnév -> pool-ozott fájlnév
+        self._pooled = set()
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="allure-writer", daemon=True)
+        self._thread.start()
+
+    # ----- allure hookok -----
+
+    @allure_commons.hookimpl
+    def report_result(self, result):
+        self._queue.put(("item", result, time.perf_counter()))
+
+    @allure_commons.hookimpl
+    def report_container(self, container):
+        self._queue.put(("item", container, time.perf_counter()))
+
+    @allure_commons.hookimpl
+    def report_attached_file(self, source, file_name):
+        with open(source, "rb") as file:
+            body = file.read()
+        self._queue.put(("attachment", (body, file_name), time.perf_counter()))
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self._queue.put(("attachment", (body, file_name), time.perf_counter()))
+
+    # ----- háttérszál -----
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.flush_interval
+            while batch[-1][0] not in ("flush", "stop") and len(batch) < self.batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    batch.append(self._queue.get(timeout=max(remaining, 0)) if remaining > 0
+                                 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        stop = False
+        try:
+            for kind, payload, queued_at in batch:
+                if kind == "item":
+                    self._write_item(payload)
+                elif kind == "attachment":
+                    self._write_attachment(*payload)
+                if kind in ("item", "attachment"):
+                    self.stats.record_latency(time.perf_counter() - queued_at)
+            self.sink.flush()
+            self.stats.batches += 1
+        except Exception as error:  # a hibát a fő szál kapja meg (flush / close)
+            self.error = error
+        for kind, payload, _ in batch:
+            if kind == "flush":
+                payload.set()
+            elif kind == "stop":
+                stop = True
+        return stop
+
+    def _write_item(self, item):
+        data = _serialize(item)
+        if self._aliases:
+            _rewrite_sources(data, self._aliases)
+        name = item.file_pattern.format(prefix=uuid.uuid4())
+        self.sink.write(name, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    def _write_attachment(self, body, file_name):
+        digest = hashlib.sha1(body).hexdigest()
+        extension = os.path.splitext(file_name)[1]
+        pooled_name = f"{digest}-attachment{extension}"
+        self._aliases[file_name] = pooled_name
+        if pooled_name in self._pooled:
+            self.stats.pooled += 1
+            self.stats.pooled_bytes += len(body)
+            return
+        self._pooled.add(pooled_name)
+        self.sink.write(pooled_name, body)
+
+    # ----- vezérlés a fő szálról -----
+
+    def flush(self, timeout=30):
+        """Megvárja, hogy minden eddig sorba tett elem kiíródjon"""
+        if not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(("flush", done, time.perf_counter()))
+        done.wait(timeout)
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(("stop", None, time.perf_counter()))
+            self._thread.join()
+        self.sink.close()
+        if self.error is not None:
+            raise self.error
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--allure-writer",
+        action="store",
+        default="direct",
+        choices=WRITER_MODES,
+        help="Allure results writer: direct (allure default), batched (background thread), packed (single tar)"
+    )
+    parser.addoption(
+        "--allure-expand",
+        action="store_true",
+        default=False,
+        help="Expand the packed Allure archive into the standard results layout at the end of the run"
+    )
+
+
+class AllureWriterPlugin:
+    """Az AllureFileLogger cseréje és visszaállítása, összesítő a futás végén"""
+
+    def __init__(self, config, file_logger, writer, pack_path=None):
+        self.config = config
+        self.file_logger = file_logger
+        self.writer = writer
+        self.pack_path = pack_path
+        self.expanded = None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        self.writer.flush()
+        stats = self.writer.stats.as_dict()
+        terminalreporter.section("Allure results writer")
+        terminalreporter.write_line(
+            f"{self.config.getoption('--allure-writer')}: {stats['items']} items in {stats['batches']} batches, "
+            f"{stats['files']} files, {stats['write_calls']} write calls, {stats['bytes_written'] / 1024:.1f} KiB"
+        )
+        terminalreporter.write_line(
+            f"pooled attachments: {stats['pooled']} ({stats['pooled_bytes'] / 1024:.1f} KiB not written)  "
+            f"queue latency: avg {stats['latency_avg_ms']:.1f} ms, max {stats['latency_max_ms']:.1f} ms"
+        )
+        if self.pack_path:
+            terminalreporter.write_line(f"archive: {self.pack_path}")
+
+    def close(self):
+        allure_commons.plugin_manager.unregister(self.writer)
+        # Az allure-pytest cleanup a saját loggerét keresi név szerint
+        allure_commons.plugin_manager.register(self.file_logger)
+        self.writer.close()
+        if self.pack_path and self.config.getoption("--allure-expand"):
+            self.expanded = expand_pack(self.pack_path)
+            os.remove(self.pack_path)
+
+
+def _find_file_logger():
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        if isinstance(plugin, AllureFileLogger):
+            return plugin
+    return None
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    mode = config.getoption("--allure-writer")
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if mode == "direct" or not report_dir or config.option.collectonly:
+        return
+    file_logger = _find_file_logger()
+    if file_logger is None:
+        return
+
+    report_dir = os.path.abspath(report_dir)
+    stats = WriterStats()
+    pack_path = os.path.join(report_dir, PACK_NAME) if mode == "packed" else None
+    sink = PackSink(pack_path, stats) if pack_path else DirectorySink(report_dir, stats)
+    writer = BatchedResultsWriter(sink)
+
+    allure_commons.plugin_manager.unregister(file_logger)
+    allure_commons.plugin_manager.register(writer)
+    plugin = AllureWriterPlugin(config, file_logger, writer, pack_path)
+    config.pluginmanager.register(plugin, "allure_writer")
+    config.add_cleanup(plugin.close)
+
+
+# ===== CLI =====
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Packed Allure results archive tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    expand = subparsers.add_parser("expand", help="Expand a packed archive into the standard Allure layout")
+    expand.add_argument("archive")
+    expand.add_argument("destination", nargs="?", default=None)
+    args = parser.parse_args(argv)
+
+    count = expand_pack(args.archive, args.destination)
+    print(f"{count} files expanded from {args.archive}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,320 @@
+"""
+cassette.py - WebDriver forgalom rögzítése és visszajátszása (command executor szinten)
+Record módban minden WebDriver kérés és válasz egy tömörített cassette fájlba kerül,
+replay módban a válaszokat a cassette szolgálja ki, böngésző indítása nélkül.
+Az eltérő parancs sorrendet (hozzáadott / elhagyott round-trip) jelzi.
+
+Használat:
+    pytest --cassette-mode=record tests/test_login.py
+    pytest --cassette-mode=replay tests/test_login.py
+"""
+
+import copy
+import functools
+import gzip
+import hashlib
+import json
+import os
+import re
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+
+CASSETTE_VERSION = 1
+DEFAULT_CASSETTE_DIR = os.path.join("tests", "cassettes")
+
+# Item stash kulcs: a teszthez tartozó replay/record összesítő
+cassette_summary_key = pytest.StashKey[dict]()
+
+
+class CassetteMismatchError(WebDriverException):
+    """A teszt olyan parancsot adott ki, amit a cassette nem tud kiszolgálni"""
+
+
+def _normalize(params):
+    """Összehasonlítható kulcs a paraméterekből (sessionId nélkül)"""
+    params = {key: value for key, value in (params or {}).items() if key != "sessionId"}
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+# ===== CASSETTE =====
+
+class Cassette:
+    """
+    Egy teszt session WebDriver forgalma
+    Fájl formátum: gzip tömörített JSON lines - fejléc + interakciónként egy sor.
+    A hosszú szkripteket (pl. Selenium atomok) a fejléc egyszer tárolja, a sorok hash-sel hivatkoznak rájuk.
+    """
+
+    INLINE_SCRIPT_LIMIT = 256
+
+    def __init__(self, session=None, interactions=None):
+        self.session = session or {}
+        self.interactions = interactions or []
+
+    def append(self, command, params, response):
+        """Interakció rögzítése - azonnal szerializálva, mert a driver később módosítja a választ"""
+        self.interactions.append({
+            "command": command,
+            "params": json.loads(_normalize(params)),
+            "response": json.loads(json.dumps(response, default=str)),
+        })
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        scripts, lines = {}, []
+        for interaction in self.interactions:
+            script = interaction["params"].get("script")
+            if isinstance(script, str) and len(script) > self.INLINE_SCRIPT_LIMIT:
+                digest = hashlib.sha1(script.encode("utf-8")).hexdigest()[:16]
+                scripts[digest] = script
+                interaction = dict(interaction, params=dict(interaction["params"], script={"$ref": digest}))
+            lines.append(json.dumps(interaction, separators=(",", ":")))
+
+        header = {"version": CASSETTE_VERSION, "session": self.session, "scripts": scripts}
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps(header) + "\n")
+            file.write("\n".join(lines) + "\n")
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Nem támogatott cassette verzió: {header.get('version')} ({path})")
+            interactions = [json.loads(line) for line in file if line.strip()]
+        scripts = header.get("scripts", {})
+        for interaction in interactions:
+            script = interaction["params"].get("script")
+            if isinstance(script, dict) and "$ref" in script:
+                interaction["params"]["script"] = scripts[script["$ref"]]
+        return cls(header.get("session"), interactions)
+
+
+# ===== RECORD =====
+
+class RecordingExecutor:
+    """Command executor wrapper - továbbítja a kéréseket és rögzíti a válaszokat"""
+
+    def __init__(self, inner, cassette):
+        self.inner = inner
+        self.cassette = cassette
+
+    def execute(self, command, params):
+        response = self.inner.execute(command, params)
+        self.cassette.append(command, params, response)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+
+def start_recording(driver):
+    """
+    Rögzítés indítása egy már elindított driveren
+    :return: Cassette - a teszt végén menteni kell (save)
+    """
+    cassette = Cassette(session={"sessionId": driver.session_id, "capabilities": driver.caps})
+    driver.command_executor = RecordingExecutor(driver.command_executor, cassette)
+    return cassette
+
+
+# ===== REPLAY =====
+
+class ReplayExecutor:
+    """
+    Command executor a cassette-ből
+    Elhagyott round-trip esetén előre szinkronizál, hozzáadott (ismételt) lekérdezést
+    egy korábbi azonos válaszból szolgál ki - mindkettőt eltérésként rögzíti
+    """
+
+    def __init__(self, cassette):
+        self.cassette = cassette
+        self.position = 0
+        self.served = 0
+        self.divergences = []
+        self._seen = {}
+
+    def _key(self, command, params):
+        return command, _normalize(params)
+
+    def _matches(self, interaction, key):
+        return self._key(interaction["command"], interaction["params"]) == key
+
+    def _serve(self, index, key):
+        response = self.cassette.interactions[index]["response"]
+        self.position = index + 1
+        self.served += 1
+        self._seen[key] = response
+        return copy.deepcopy(response)
+
+    def execute(self, command, params):
+        if command == "newSession":
+            return {"value": copy.deepcopy(self.cassette.session)}
+
+        key = self._key(command, params)
+        interactions = self.cassette.interactions
+
+        if self.position < len(interactions) and self._matches(interactions[self.position], key):
+            return self._serve(self.position, key)
+
+        if key in self._seen:
+            self.divergences.append({"kind": "added", "index": self.position, "command": command})
+            self.served += 1
+            return copy.deepcopy(self._seen[key])
+
+        for index in range(self.position + 1, len(interactions)):
+            if self._matches(interactions[index], key):
+                for skipped in interactions[self.position:index]:
+                    self.divergences.append({"kind": "removed", "index": self.position, "command": skipped["command"]})
+                return self._serve(index, key)
+
+        self.divergences.append({"kind": "unservable", "index": self.position, "command": command})
+        expected = interactions[self.position]["command"] if self.position < len(interactions) else "<end>"
+        raise CassetteMismatchError(
+            f"Cassette eltérés a(z) {self.position}. parancsnál: várt {expected}, kapott {command} {_normalize(params)}"
+        )
+
+    def close(self):
+        """A lejátszás végén a fel nem használt interakciók elhagyott round-tripnek számítanak"""
+        for skipped in self.cassette.interactions[self.position:]:
+            if skipped["command"] != "quit":
+                self.divergences.append({"kind": "removed", "index": self.position, "command": skipped["command"]})
+        self.position = len(self.cassette.interactions)
+
+    def summary(self):
+        kinds = [divergence["kind"] for divergence in self.divergences]
+        return {
+            "recorded": len(self.cassette.interactions),
+            "served": self.served,
+            "added": kinds.count("added"),
+            "removed": kinds.count("removed"),
+            "unservable": kinds.count("unservable"),
+            "divergences": list(self.divergences),
+        }
+
+
+@functools.cache
+def _replay_driver_class():
+    """
+    A selenium.webdriver csomag (Chrome / Firefox modulokkal együtt) csak az első replay
+    drivernél töltődik be - a plugin importja (gyűjtés) nem húzza be
+    """
+    from selenium.webdriver.common.options import ArgOptions
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    class ReplayWebDriver(WebDriver):
+        """Selenium WebDriver, amely a cassette-ből válaszol - böngésző nélkül"""
+
+        def __init__(self, cassette):
+            if isinstance(cassette, str):
+                cassette = Cassette.load(cassette)
+            super().__init__(command_executor=ReplayExecutor(cassette), options=ArgOptions())
+
+    return ReplayWebDriver
+
+
+def __getattr__(name):
+    # from utils.cassette import ReplayWebDriver - lustán létrehozott osztály
+    if name == "ReplayWebDriver":
+        return _replay_driver_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cassette-mode",
+        action="store",
+        default="off",
+        choices=("off", "record", "replay"),
+        help="Record WebDriver traffic into cassettes or replay it without a browser"
+    )
+    parser.addoption(
+        "--cassette-dir",
+        action="store",
+        default=DEFAULT_CASSETTE_DIR,
+        help="Directory for WebDriver cassettes"
+    )
+    parser.addoption(
+        "--cassette-strict",
+        action="store_true",
+        default=False,
+        help="Fail replayed tests whose command sequence differs from the recording"
+    )
+
+
+def cassette_path(config, nodeid):
+    """Teszt nodeid -> cassette fájl útvonal"""
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+    return os.path.join(config.getoption("--cassette-dir"), f"{name}.json.gz")
+
+
+def open_replay_driver(request):
+    """Replay driver a teszt cassette-jéből (skip, ha még nincs felvétel)"""
+    path = cassette_path(request.config, request.node.nodeid)
+    if not os.path.exists(path):
+        pytest.skip(f"Nincs cassette ehhez a teszthez: {path}")
+    return _replay_driver_class()(path)
+
+
+def finish_cassette(request, driver, cassette=None):
+    """
+    Teszt végi cassette kezelés (a driver.quit() után hívandó)
+    Record: mentés; replay: eltérések összesítése, strict módban hiba
+    """
+    if cassette is not None:
+        cassette.save(cassette_path(request.config, request.node.nodeid))
+        request.node.stash[cassette_summary_key] = {"recorded": len(cassette.interactions)}
+        return
+
+    executor = getattr(driver, "command_executor", None)
+    if not isinstance(executor, ReplayExecutor):
+        return
+    summary = executor.summary()
+    request.node.stash[cassette_summary_key] = summary
+    if request.config.getoption("--cassette-strict") and summary["divergences"]:
+        pytest.fail(
+            f"Parancs sorrend eltér a felvételtől: +{summary['added']} / -{summary['removed']} round-trip",
+            pytrace=False
+        )
+
+
+class CassetteReporter:
+    """A replay eltérések (hozzáadott / elhagyott round-tripek) összesítése a futás végén"""
+
+    def __init__(self):
+        self.summaries = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        yield
+        if call.when == "teardown" and cassette_summary_key in item.stash:
+            self.summaries[item.nodeid] = item.stash[cassette_summary_key]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.summaries:
+            return
+        terminalreporter.section("WebDriver cassettes")
+        for nodeid, summary in self.summaries.items():
+            if "served" not in summary:
+                terminalreporter.write_line(f"recorded {summary['recorded']:5d} commands  {nodeid}")
+                continue
+            delta = summary["added"] - summary["removed"]
+            marker = "" if not summary["divergences"] else f"  DIVERGED ({delta:+d} round-trips)"
+            terminalreporter.write_line(
+                f"replayed {summary['served']:5d}/{summary['recorded']:<5d} "
+                f"+{summary['added']} -{summary['removed']}{marker}  {nodeid}"
+            )
+
+
+def pytest_configure(config):
+    if config.getoption("--cassette-mode") != "off":
+        config.pluginmanager.register(CassetteReporter(), "cassette_reporter")
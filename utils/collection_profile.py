@@ -0,0 +1,187 @@
+"""
+collection_profile.py - Teszt gyűjtés (collection) idő profilozása
+Modulonként méri az import időt (saját és kumulatív, mint a `python -X importtime`),
+és teszt fájlonként a gyűjtés idejét. A riport a futás végén jelenik meg.
+
+A mérés már a plugin importjakor elindul, így a conftest utána betöltött pluginjai is
+szerepelnek; -p kapcsolóval betöltve (a conftest előtt) magának a conftestnek az importja is.
+
+Használat:
+    pytest --collect-only -q --profile-collection
+    pytest -k login --profile-collection
+    pytest -p utils.collection_profile --collect-only -q --profile-collection
+"""
+
+import sys
+import time
+
+import pytest
+
+
+DEFAULT_TOP = 15
+
+
+class _TimedLoader:
+    """Loader wrapper - az exec_module idejét méri, minden mást az eredeti loadernek továbbít"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # A modul a saját loaderét lássa (assertion rewrite, inspect, importlib.resources)
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.measure(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """
+    sys.meta_path finder, amely a többi finder által talált modulok betöltését időzíti
+    A beágyazott importok ideje a szülő kumulatív idejébe számít, a saját időbe nem.
+    """
+
+    def __init__(self):
+        self.timings = {}  # modul név -> (saját idő, kumulatív idő)
+        self._stack = []
+        self._finding = set()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self._finding:
+            return None
+        self._finding.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(name)
+
+    def measure(self, name):
+        return _Measurement(self, name)
+
+    def top(self, limit=DEFAULT_TOP):
+        """A leglassabb importok kumulatív idő szerint: [(név, saját, kumulatív)]"""
+        rows = [(name, own, total) for name, (own, total) in self.timings.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)[:limit]
+
+
+class _Measurement:
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.begin = time.perf_counter()
+        self.children = 0.0
+        self.profiler._stack.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        total = time.perf_counter() - self.begin
+        stack = self.profiler._stack
+        stack.pop()
+        if stack:
+            stack[-1].children += total
+        self.profiler.timings[self.name] = (total - self.children, total)
+        return False
+
+
+# ===== PYTEST PLUGIN =====
+
+# A plugin importjától a gyűjtés végéig mér; --profile-collection nélkül a pytest_configure leállítja
+_startup_imports = ImportProfiler()
+_startup_imports.install()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-collection",
+        action="store_true",
+        default=False,
+        help="Report per-module import time and per-file collection time"
+    )
+
+
+class CollectionProfiler:
+    """Pytest plugin - import és gyűjtési idők, riport a terminal summary-ban"""
+
+    def __init__(self, imports, top=DEFAULT_TOP):
+        self.top = top
+        self.imports = imports
+        self.files = {}
+        self.collection_time = 0.0
+        self._begin = None
+
+    def pytest_collection(self, session):
+        self._begin = time.perf_counter()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        begin = time.perf_counter()
+        yield
+        if isinstance(collector, pytest.Module):
+            self.files[collector.nodeid] = time.perf_counter() - begin
+
+    def pytest_collection_finish(self, session):
+        self.imports.uninstall()
+        if self._begin is not None:
+            self.collection_time = time.perf_counter() - self._begin
+
+    def pytest_unconfigure(self, config):
+        self.imports.uninstall()
+        self.imports.timings.clear()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.section("Collection profile")
+        terminalreporter.write_line(
+            f"collection: {self.collection_time * 1000:8.1f} ms  ({len(self.files)} test files)"
+        )
+        terminalreporter.write_line("")
+        terminalreporter.write_line(f"{'file':>8}  test module")
+        for nodeid, duration in sorted(self.files.items(), key=lambda item: item[1], reverse=True):
+            terminalreporter.write_line(f"{duration * 1000:6.1f}ms  {nodeid}")
+
+        rows = self.imports.top(self.top)
+        if rows:
+            terminalreporter.write_line("")
+            terminalreporter.write_line(f"{'self':>8}  {'cumul.':>8}  imported module")
+            for name, own, total in rows:
+                terminalreporter.write_line(f"{own * 1000:6.1f}ms  {total * 1000:6.1f}ms  {name}")
+
+
+def pytest_load_initial_conftests(early_config, parser, args):
+    # -p utils.collection_profile: a conftest importja előtt (ismételt, in-process session esetén is)
+    _startup_imports.install()
+
+
+def pytest_configure(config):
+    if config.getoption("--profile-collection"):
+        _startup_imports.install()
+        config.pluginmanager.register(CollectionProfiler(_startup_imports), "collection_profiler")
+    else:
+        _startup_imports.uninstall()
+        _startup_imports.timings.clear()
@@ -0,0 +1,56 @@
+"""
+command_counter.py - WebDriver parancsok számlálása
+Minden driver.execute hívás egy HTTP round-trip a böngésző felé
+"""
+
+from collections import Counter
+
+
+class CommandCounter:
+    """
+    WebDriver parancs számláló
+    Összesen és parancs típusonként számol
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.by_command = Counter()
+
+    def record(self, driver_command):
+        """Egy parancs rögzítése"""
+        self.total += 1
+        self.by_command[driver_command] += 1
+
+    def reset(self):
+        """Számlálók nullázása"""
+        self.total = 0
+        self.by_command.clear()
+
+
+def instrument_driver(driver):
+    """
+    A driver.execute becsomagolása parancsszámlálóval
+    Többszöri hívás esetén a meglévő számlálót adja vissza
+    :param driver: WebDriver instance
+    :return: CommandCounter
+    """
+    counter = getattr(driver, "command_counter", None)
+    if counter is not None:
+        return counter
+
+    counter = CommandCounter()
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        counter.record(driver_command)
+        return original_execute(driver_command, params)
+
+    driver.execute = execute
+    driver.command_counter = counter
+    return counter
+
+
+def command_count(driver):
+    """Eddig kiadott parancsok száma (None, ha a driver nincs instrumentálva)"""
+    counter = getattr(driver, "command_counter", None)
+    return counter.total if counter is not None else None
@@ -0,0 +1,856 @@
+"""
+dom.py - Könnyűsúlyú HTML DOM és locator kiértékelés (lxml nélkül)
+A fake WebDriver backend és a lokális ellenőrzések közös alapja.
+
+Támogatott locator típusok: ID, NAME, CLASS_NAME, TAG_NAME, LINK_TEXT,
+PARTIAL_LINK_TEXT, CSS_SELECTOR (gyakori részhalmaz) és XPATH (gyakori részhalmaz).
+"""
+
+import re
+from html import escape
+from html.parser import HTMLParser
+
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.webdriver.common.by import By
+
+
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Elemek, amelyek sosem jelennek meg a renderelt oldalon
+NON_RENDERED_ELEMENTS = {"head", "script", "style", "title", "meta", "link", "template", "noscript"}
+
+BLOCK_ELEMENTS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "option", "p", "pre", "section", "select", "table",
+    "tbody", "td", "tfoot", "th", "thead", "tr", "ul",
+}
+
+
+# ===== DOM =====
+
+class Node:
+    """
+    Egy HTML elem a fában
+    A form állapot (value, checked, selected) property-ként az attribútumoktól külön él
+    """
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.parent = parent
+        self.children = []
+        self.index = 0
+        self.option_index = 0
+        self.properties = {}
+
+    def __repr__(self):
+        return f"<Node {self.tag} {self.attrs}>"
+
+    # ----- fa bejárás -----
+
+    def elements(self):
+        """Közvetlen gyermek elemek"""
+        return [child for child in self.children if isinstance(child, Node)]
+
+    def iter_descendants(self):
+        """Leszármazott elemek dokumentum sorrendben"""
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.iter_descendants()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def is_attached(self, root):
+        return self is root or any(ancestor is root for ancestor in self.ancestors())
+
+    # ----- tartalom -----
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def text_nodes(self):
+        """Közvetlen szöveg gyermekek"""
+        return [child for child in self.children if isinstance(child, str)]
+
+    def string_value(self):
+        """XPath string-value: az összes leszármazott szöveg összefűzve"""
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.string_value())
+        return "".join(parts)
+
+    def rendered_text(self):
+        """
+        A Selenium WebElement.text közelítése:
+        csak látható szöveg, blokk elemek új sorban, összevont whitespace
+        """
+        if not self.is_displayed():
+            return ""
+        parts = []
+        self._collect_text(parts)
+        lines = (re.sub(r" +", " ", line).strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts):
+        block = self.tag in BLOCK_ELEMENTS
+        if block:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(re.sub(r"\s+", " ", child))
+            elif not child._hidden_self():
+                child._collect_text(parts)
+        if block:
+            parts.append("\n")
+
+    # ----- állapot -----
+
+    def get_property(self, name):
+        """DOM property - form állapot esetén az aktuális érték"""
+        if name in self.properties:
+            return self.properties[name]
+        if name == "value":
+            if self.tag == "option" and "value" not in self.attrs:
+                return re.sub(r"\s+", " ", self.string_value()).strip()
+            if self.tag == "textarea":
+                return self.string_value()
+            return self.attrs.get("value", "" if self.tag in ("input", "select") else None)
+        if name == "checked":
+            return "checked" in self.attrs
+        if name == "selected":
+            if self.tag == "option":
+                return self._option_selected()
+            return False
+        if name == "disabled":
+            return "disabled" in self.attrs
+        if name == "index" and self.tag == "option":
+            return self.option_index
+        return self.attrs.get(name)
+
+    def set_property(self, name, value):
+        self.properties[name] = value
+
+    def get_attribute(self, name):
+        """
+        A Selenium get_attribute szemantikája: bizonyos nevek property-ként,
+        boolean attribútumok "true"/None formában
+        """
+        if name in ("value", "index"):
+            value = self.get_property(name)
+            return None if value is None else str(value)
+        if name in ("checked", "selected", "disabled", "hidden", "multiple", "readonly", "required"):
+            present = self.get_property(name) if name in ("checked", "selected", "disabled") else name in self.attrs
+            return "true" if present else None
+        return self.attrs.get(name)
+
+    def closest(self, tag):
+        for node in (self, *self.ancestors()):
+            if node.tag == tag:
+                return node
+        return None
+
+    def options(self):
+        return [node for node in self.iter_descendants() if node.tag == "option"]
+
+    def _option_selected(self):
+        if "selected" in self.properties:
+            return self.properties["selected"]
+        return "selected" in self.attrs
+
+    def init_selection(self):
+        """Select kezdő állapota: az utolsó selected option, vagy az első engedélyezett"""
+        options = self.options()
+        explicit = [option for option in options if "selected" in option.attrs]
+        chosen = explicit[-1:] if explicit else []
+        if not chosen and "multiple" not in self.attrs:
+            chosen = [option for option in options if "disabled" not in option.attrs][:1]
+        if "multiple" in self.attrs:
+            chosen = explicit
+        for position, option in enumerate(options):
+            option.option_index = position
+            option.properties["selected"] = any(option is selected for selected in chosen)
+
+    def select_option(self, option):
+        """Option kiválasztása egy select-ben (single select esetén a többi törlődik)"""
+        if "multiple" not in self.attrs:
+            for other in self.options():
+                other.properties["selected"] = other is option
+        else:
+            option.properties["selected"] = not option.get_property("selected")
+
+    def _hidden_self(self):
+        """Saját (ősöktől független) rejtettség"""
+        if "displayed" in self.properties:
+            return not self.properties["displayed"]
+        if self.tag in NON_RENDERED_ELEMENTS or "hidden" in self.attrs:
+            return True
+        if self.tag == "input" and self.attrs.get("type", "").lower() == "hidden":
+            return True
+        style = self.attrs.get("style", "").replace(" ", "").lower()
+        return "display:none" in style or "visibility:hidden" in style
+
+    def is_displayed(self):
+        """
+        Közelítő láthatóság: hidden attribútum, inline display/visibility és nem renderelt elemek
+        A böngészőből kapott (snapshot) "displayed" property felülírja a becslést
+        """
+        if "displayed" in self.properties:
+            return self.properties["displayed"]
+        return not any(node._hidden_self() for node in (self, *self.ancestors()))
+
+    def is_enabled(self):
+        if self.tag in ("input", "button", "select", "textarea", "option", "optgroup", "fieldset"):
+            return not any("disabled" in node.attrs for node in (self, *self.ancestors())
+                           if node.tag in ("input", "button", "select", "textarea", "option", "optgroup", "fieldset"))
+        return True
+
+    # ----- szerializálás -----
+
+    def outer_html(self, attr_hook=None):
+        """
+        HTML szerializálás
+        :param attr_hook: Opcionális callable(node) -> dict, extra attribútumok elemenként (None = elhagyás)
+        """
+        attrs = dict(self.attrs)
+        if attr_hook is not None:
+            attrs.update(attr_hook(self))
+        rendered = "".join(f' {name}="{escape(str(value), quote=True)}"'
+                           for name, value in attrs.items() if value is not None)
+        if self.tag in VOID_ELEMENTS:
+            return f"<{self.tag}{rendered}>"
+        return f"<{self.tag}{rendered}>{self.inner_html(attr_hook)}</{self.tag}>"
+
+    def inner_html(self, attr_hook=None):
+        parts = []
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child if self.tag in ("script", "style") else escape(child, quote=False))
+            else:
+                parts.append(child.outer_html(attr_hook))
+        return "".join(parts)
+
+
+class Document(Node):
+    """
+    Gyökér csomópont indexekkel
+    ID, tag és class szerinti keresés index alapján, nem teljes bejárással
+    """
+
+    def __init__(self):
+        super().__init__("#document")
+        self.ids = {}
+        self.tags = {}
+        self.class_index = {}
+
+    def build_index(self):
+        """Dokumentum sorrend és ID/tag/class indexek felépítése"""
+        self.ids.clear()
+        self.tags.clear()
+        self.class_index.clear()
+        for position, node in enumerate(self.iter_descendants(), start=1):
+            node.index = position
+            node_id = node.attrs.get("id")
+            if node_id is not None:
+                self.ids.setdefault(node_id, []).append(node)
+            self.tags.setdefault(node.tag, []).append(node)
+            for class_name in node.classes:
+                self.class_index.setdefault(class_name, []).append(node)
+        for select in self.tags.get("select", []):
+            select.init_selection()
+        return self
+
+    @property
+    def document_element(self):
+        elements = self.elements()
+        return elements[0] if elements else None
+
+    @property
+    def title(self):
+        titles = self.tags.get("title")
+        if not titles:
+            return ""
+        return re.sub(r"\s+", " ", titles[0].string_value()).strip()
+
+    def outer_html(self, attr_hook=None):
+        return "".join(child if isinstance(child, str) else child.outer_html(attr_hook) for child in self.children)
+
+
+class _TreeBuilder(HTMLParser):
+    """html.parser alapú fa építő, egyszerű implicit lezárásokkal"""
+
+    IMPLICIT_CLOSE = {
+        "li": {"li"}, "option": {"option"}, "p": {"p"}, "tr": {"tr"},
+        "td": {"td", "th"}, "th": {"td", "th"}, "dt": {"dt", "dd"}, "dd": {"dt", "dd"},
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.document = Document()
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        closes = self.IMPLICIT_CLOSE.get(tag)
+        if closes and self.stack[-1].tag in closes:
+            self.stack.pop()
+        node = Node(tag, {name: ("" if value is None else value) for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {name: ("" if value is None else value) for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        for position in range(len(self.stack) - 1, 0, -1):
+            if self.stack[position].tag == tag:
+                del self.stack[position:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html):
+    """HTML szöveg feldolgozása indexelt Document-té"""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.document.build_index()
+
+
+# ===== LOCATOR KIÉRTÉKELÉS =====
+
+def find_all(document, by, value, context=None):
+    """
+    Locator kiértékelése
+    :param document: Document
+    :param by: By.* konstans
+    :param value: locator érték
+    :param context: Node - relatív keresés gyökere (None = teljes dokumentum)
+    :return: Node lista dokumentum sorrendben
+    """
+    scope = context if context is not None else document
+    scoped = context is not None and context is not document
+
+    if by == By.ID:
+        nodes = document.ids.get(value, [])
+        return [node for node in nodes if node.is_attached(scope) and node is not scope] if scoped else list(nodes)
+    if by == By.TAG_NAME:
+        nodes = document.tags.get(value.lower(), [])
+        return [node for node in nodes if node.is_attached(scope) and node is not scope] if scoped else list(nodes)
+    if by == By.NAME:
+        return [node for node in scope.iter_descendants() if node.attrs.get("name") == value]
+    if by == By.CLASS_NAME:
+        if not scoped:
+            return list(document.class_index.get(value, []))
+        return [node for node in scope.iter_descendants() if value in node.classes]
+    if by == By.LINK_TEXT:
+        return [node for node in scope.iter_descendants() if node.tag == "a" and node.rendered_text() == value]
+    if by == By.PARTIAL_LINK_TEXT:
+        return [node for node in scope.iter_descendants() if node.tag == "a" and value in node.rendered_text()]
+    if by == By.CSS_SELECTOR:
+        return select_css(scope, value)
+    if by == By.XPATH:
+        return select_xpath(document, value, scope)
+    raise InvalidSelectorException(f"Nem támogatott locator típus: {by}")
+
+
+# ----- CSS -----
+
+_CSS_TOKEN = re.compile(
+    r"""\s*(?P<comb>[>+~])\s*|(?P<ws>\s+)|(?P<simple>
+        \*|[A-Za-z][\w-]*|\#[\w-]+|\.[\w-]+|
+        \[\s*[\w-]+\s*(?:[~^$*|]?=\s*(?:"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]|
+        :(?:first-child|last-child|checked|disabled|enabled)
+    )""",
+    re.VERBOSE,
+)
+
+_CSS_ATTR = re.compile(r"""\[\s*([\w-]+)\s*(?:([~^$*|]?=)\s*("[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]""")
+
+
+def _parse_css(selector):
+    """CSS szelektor feldolgozása: [(kombinátor, [egyszerű szelektorok])] lista"""
+    steps, simples, combinator = [], [], " "
+    position = 0
+    selector = selector.strip()
+    while position < len(selector):
+        match = _CSS_TOKEN.match(selector, position)
+        if not match or match.end() == position:
+            raise InvalidSelectorException(f"Nem támogatott CSS szelektor: {selector}")
+        position = match.end()
+        if match.group("simple"):
+            simples.append(match.group("simple"))
+            continue
+        if simples:
+            steps.append((combinator, simples))
+            simples = []
+        combinator = match.group("comb") or " "
+    if not simples:
+        raise InvalidSelectorException(f"Hiányos CSS szelektor: {selector}")
+    steps.append((combinator, simples))
+    return steps
+
+
+def _css_simple_match(node, simple):
+    if simple == "*":
+        return True
+    if simple[0] == "#":
+        return node.attrs.get("id") == simple[1:]
+    if simple[0] == ".":
+        return simple[1:] in node.classes
+    if simple[0] == "[":
+        name, operator, expected = _CSS_ATTR.match(simple).groups()
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if operator is None:
+            return True
+        expected = expected.strip("\"'") if expected[0] in "\"'" else expected
+        return {
+            "=": actual == expected,
+            "~=": expected in actual.split(),
+            "^=": bool(expected) and actual.startswith(expected),
+            "$=": bool(expected) and actual.endswith(expected),
+            "*=": bool(expected) and expected in actual,
+            "|=": actual == expected or actual.startswith(expected + "-"),
+        }[operator]
+    if simple[0] == ":":
+        siblings = node.parent.elements() if node.parent is not None else [node]
+        return {
+            ":first-child": siblings[0] is node,
+            ":last-child": siblings[-1] is node,
+            ":checked": bool(node.get_property("checked") or (node.tag == "option" and node.get_property("selected"))),
+            ":disabled": not node.is_enabled(),
+            ":enabled": node.is_enabled(),
+        }[simple]
+    return node.tag == simple.lower()
+
+
+def _css_match(node, steps):
+    """Jobbról balra illesztés a kombinátorok mentén"""
+    combinator, simples = steps[-1]
+    if not all(_css_simple_match(node, simple) for simple in simples):
+        return False
+    if len(steps) == 1:
+        return True
+    rest = steps[:-1]
+    if combinator == ">":
+        return node.parent is not None and _css_match(node.parent, rest)
+    if combinator == " ":
+        return any(_css_match(ancestor, rest) for ancestor in node.ancestors())
+    siblings = node.parent.elements() if node.parent is not None else []
+    previous = siblings[:siblings.index(node)] if node in siblings else []
+    if combinator == "+":
+        return bool(previous) and _css_match(previous[-1], rest)
+    return any(_css_match(sibling, rest) for sibling in previous)
+
+
+def _css_candidates(document, steps):
+    """Index alapú jelöltek a jobb szélső összetett szelektorból (#id > .class > tag)"""
+    simples = steps[-1][1]
+    for simple in simples:
+        if simple[0] == "#":
+            return document.ids.get(simple[1:], [])
+    for simple in simples:
+        if simple[0] == ".":
+            return document.class_index.get(simple[1:], [])
+    for simple in simples:
+        if simple[0].isalpha():
+            return document.tags.get(simple.lower(), [])
+    return None
+
+
+def select_css(scope, selector):
+    """CSS szelektor kiértékelése a scope leszármazottain (teljes dokumentumon index alapján)"""
+    groups = [_parse_css(group) for group in _split_top_level(selector, ",")]
+    if isinstance(scope, Document):
+        found = {}
+        for steps in groups:
+            candidates = _css_candidates(scope, steps)
+            if candidates is None:
+                candidates = scope.iter_descendants()
+            for node in candidates:
+                if _css_match(node, steps):
+                    found[id(node)] = node
+        return sorted(found.values(), key=lambda node: node.index)
+    return [node for node in scope.iter_descendants() if any(_css_match(node, steps) for steps in groups)]
+
+
+def _split_top_level(text, separator):
+    """Szétválasztás zárójeleken és idézőjeleken kívül"""
+    parts, depth, quote, current = [], 0, None, []
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+# ----- XPath -----
+
+_XPATH_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<string>"[^"]*"|'[^']*')|
+        (?P<number>\d+(?:\.\d+)?)|
+        (?P<op>!=|<=|>=|//|::|[/\[\]()@,=<>|*.])|
+        (?P<name>[A-Za-z_][\w.-]*(?:\(\))?)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _tokenize_xpath(expression):
+    tokens, position = [], 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _XPATH_TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise InvalidSelectorException(f"Nem támogatott XPath: {expression}")
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _XPathParser:
+    """
+    XPath részhalmaz: abszolút/relatív location path-ok (child és descendant tengely,
+    .., .), predikátumok @attr, text(), ., pozíció, and/or, =, != és a
+    contains / starts-with / normalize-space / not / concat / string / position / last függvények
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize_xpath(expression)
+        self.position = 0
+
+    def error(self):
+        return InvalidSelectorException(f"Nem támogatott XPath: {self.expression}")
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise self.error()
+        self.position += 1
+        return token
+
+    def parse(self):
+        paths = [self.parse_path()]
+        while self.peek()[1] == "|":
+            self.take("|")
+            paths.append(self.parse_path())
+        if self.peek()[0] is not None:
+            raise self.error()
+        return paths
+
+    def parse_path(self):
+        """[(tengely, node test, predikátumok)] lista; az első elem az abszolút/relatív jelzés"""
+        steps = []
+        absolute = False
+        kind, value = self.peek()
+        if value in ("/", "//"):
+            absolute = True
+        elif value == ".":
+            self.take(".")
+            steps.append(("self", "node()", []))
+        elif value == "..":
+            raise self.error()
+        while True:
+            kind, value = self.peek()
+            if value == "//":
+                # "//" = /descendant-or-self::node()/ - a predikátumok így szülőnként értékelődnek ki
+                self.take()
+                steps.append(("descendant-or-self", "node()", []))
+                steps.append(self.parse_step("child"))
+            elif value == "/":
+                self.take()
+                steps.append(self.parse_step("child"))
+            elif not steps and not absolute and (kind == "name" or value in ("*", "@")):
+                steps.append(self.parse_step("child"))
+            else:
+                break
+        return absolute, steps
+
+    def parse_step(self, axis):
+        kind, value = self.peek()
+        if value == ".":
+            self.take()
+            if self.peek()[1] == ".":
+                self.take()
+                return ("parent", "node()", [])
+            return ("self" if axis == "child" else "descendant-or-self", "node()", [])
+        if value == "*":
+            self.take()
+            test = "*"
+        elif kind == "name":
+            self.take()
+            test = value.lower()
+        else:
+            raise self.error()
+        predicates = []
+        while self.peek()[1] == "[":
+            self.take("[")
+            predicates.append(self.parse_or())
+            self.take("]")
+        return (axis, test, predicates)
+
+    # ----- predikátum kifejezések -----
+
+    def parse_or(self):
+        node = self.parse_and()
+        while self.peek() == ("name", "or"):
+            self.take()
+            node = ("or", node, self.parse_and())
+        return node
+
+    def parse_and(self):
+        node = self.parse_compare()
+        while self.peek() == ("name", "and"):
+            self.take()
+            node = ("and", node, self.parse_compare())
+        return node
+
+    def parse_compare(self):
+        node = self.parse_value()
+        if self.peek()[1] in ("=", "!=", "<", ">", "<=", ">="):
+            operator = self.take()[1]
+            node = ("cmp", operator, node, self.parse_value())
+        return node
+
+    def parse_value(self):
+        kind, value = self.peek()
+        if kind == "string":
+            self.take()
+            return ("literal", value[1:-1])
+        if kind == "number":
+            self.take()
+            return ("number", float(value))
+        if value == "@":
+            self.take()
+            name = self.take()[1]
+            return ("attr", name)
+        if value == ".":
+            self.take()
+            return ("self",)
+        if value == "(":
+            self.take("(")
+            node = self.parse_or()
+            self.take(")")
+            return node
+        if kind == "name" and value.endswith("()"):
+            self.take()
+            return ("call", value[:-2], [])
+        if kind == "name" and self.peek(1)[1] == "(":
+            self.take()
+            self.take("(")
+            args = []
+            if self.peek()[1] != ")":
+                args.append(self.parse_or())
+                while self.peek()[1] == ",":
+                    self.take(",")
+                    args.append(self.parse_or())
+            self.take(")")
+            return ("call", value, args)
+        if kind == "name" or value in ("/", "//"):
+            absolute, steps = self.parse_path()
+            return ("path", absolute, steps)
+        raise self.error()
+
+
+def _string(value):
+    if isinstance(value, list):
+        return _string(value[0]) if value else ""
+    if isinstance(value, Node):
+        return value.string_value()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return "" if value is None else value
+
+
+def _boolean(value):
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, float):
+        return value != 0
+    return bool(value)
+
+
+def _as_strings(value):
+    """Node-set esetén az elemek string értékei, egyébként egyelemű lista"""
+    if isinstance(value, list):
+        return [_string(item) for item in value]
+    if value is None:
+        return []
+    return [_string(value)]
+
+
+class _XPathEvaluator:
+
+    def __init__(self, document, expression):
+        self.document = document
+        self.paths = _XPathParser(expression).parse()
+
+    def select(self, context):
+        found = {}
+        for absolute, steps in self.paths:
+            for node in self.evaluate_path(absolute, steps, context):
+                found[id(node)] = node
+        return sorted(found.values(), key=lambda node: node.index)
+
+    def evaluate_path(self, absolute, steps, context):
+        nodes = [self.document] if absolute else [context]
+        for axis, test, predicates in steps:
+            selected = []
+            for node in nodes:
+                candidates = self.axis_nodes(node, axis)
+                candidates = [candidate for candidate in candidates if self.node_test(candidate, test)]
+                for predicate in predicates:
+                    candidates = self.apply_predicate(candidates, predicate)
+                selected.extend(candidates)
+            seen, nodes = set(), []
+            for node in selected:
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    nodes.append(node)
+        return [node for node in nodes if isinstance(node, Node) and not isinstance(node, Document)]
+
+    @staticmethod
+    def axis_nodes(node, axis):
+        if axis == "child":
+            return node.elements()
+        if axis == "descendant":
+            return list(node.iter_descendants())
+        if axis == "descendant-or-self":
+            return [node, *node.iter_descendants()]
+        if axis == "parent":
+            return [node.parent] if node.parent is not None else []
+        return [node]
+
+    @staticmethod
+    def node_test(node, test):
+        if test in ("*", "node()"):
+            return True
+        return node.tag == test
+
+    def apply_predicate(self, candidates, predicate):
+        size = len(candidates)
+        kept = []
+        for position, node in enumerate(candidates, start=1):
+            value = self.evaluate(predicate, node, position, size)
+            if isinstance(value, float):
+                if value == position:
+                    kept.append(node)
+            elif _boolean(value):
+                kept.append(node)
+        return kept
+
+    def evaluate(self, expression, node, position, size):
+        kind = expression[0]
+        if kind == "literal":
+            return expression[1]
+        if kind == "number":
+            return expression[1]
+        if kind == "attr":
+            return node.attrs.get(expression[1])
+        if kind == "self":
+            return [node]
+        if kind == "path":
+            return self.evaluate_path(expression[1], expression[2], node)
+        if kind == "and":
+            return (_boolean(self.evaluate(expression[1], node, position, size))
+                    and _boolean(self.evaluate(expression[2], node, position, size)))
+        if kind == "or":
+            return (_boolean(self.evaluate(expression[1], node, position, size))
+                    or _boolean(self.evaluate(expression[2], node, position, size)))
+        if kind == "cmp":
+            return self.compare(expression[1],
+                                self.evaluate(expression[2], node, position, size),
+                                self.evaluate(expression[3], node, position, size))
+        if kind == "call":
+            return self.call(expression[1], expression[2], node, position, size)
+        raise InvalidSelectorException(f"Nem támogatott XPath kifejezés: {expression}")
+
+    @staticmethod
+    def compare(operator, left, right):
+        if operator in ("<", ">", "<=", ">="):
+            try:
+                left_number, right_number = float(_string(left)), float(_string(right))
+            except ValueError:
+                return False
+            return {"<": left_number < right_number, ">": left_number > right_number,
+                    "<=": left_number <= right_number, ">=": left_number >= right_number}[operator]
+        if isinstance(right, float) or isinstance(left, float):
+            number = right if isinstance(right, float) else left
+            other = left if isinstance(right, float) else right
+            values = []
+            for item in _as_strings(other):
+                try:
+                    values.append(float(item))
+                except ValueError:
+                    pass
+            matches = [value == number for value in values]
+        else:
+            lefts, rights = _as_strings(left), _as_strings(right)
+            matches = [a == b for a in lefts for b in rights]
+        return any(matches) if operator == "=" else any(not match for match in matches)
+
+    def call(self, name, args, node, position, size):
+        values = [self.evaluate(arg, node, position, size) for arg in args]
+        if name == "text":
+            return [text for text in node.text_nodes()]
+        if name == "position":
+            return float(position)
+        if name == "last":
+            return float(size)
+        if name == "normalize-space":
+            source = _string(values[0]) if values else node.string_value()
+            return re.sub(r"\s+", " ", source).strip()
+        if name == "string":
+            return _string(values[0]) if values else node.string_value()
+        if name == "contains":
+            return _string(values[1]) in _string(values[0])
+        if name == "starts-with":
+            return _string(values[0]).startswith(_string(values[1]))
+        if name == "not":
+            return not _boolean(values[0])
+        if name == "concat":
+            return "".join(_string(value) for value in values)
+        if name == "string-length":
+            return float(len(_string(values[0]) if values else node.string_value()))
+        if name == "count":
+            return float(len(values[0]))
+        raise InvalidSelectorException(f"Nem támogatott XPath függvény: {name}()")
+
+
+def select_xpath(document, expression, context=None):
+    """XPath kiértékelése (a context csak relatív útvonalaknál számít)"""
+    return _XPathEvaluator(document, expression).select(context if context is not None else document)
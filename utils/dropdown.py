@@ -0,0 +1,113 @@
+"""
+dropdown.py - Egy round-trippes <select> műveletek
+A Selenium Select osztálya minden <option>-t külön lekér, és opciónként attribútum / szöveg
+round-tripeket futtat, így a költség az opciók számával nő. Itt a kiválasztás (szöveg, érték
+vagy index alapján, input + change eseménnyel) és az összes opció kiolvasása is egyetlen
+execute_script hívás, az opciók számától függetlenül.
+"""
+
+from selenium.common.exceptions import (
+    ElementNotInteractableException, NoSuchElementException, UnexpectedTagNameException,
+)
+
+
+# arguments: select elem, "text" / "value" / "index", kulcs
+# A szöveg egyezés a Select.select_by_visible_text szerint whitespace-normalizált.
+# Multi select esetén (a Select-hez hasonlóan) szöveg / érték alapján minden egyező opció kijelölődik.
+# A tiltott (saját vagy fieldset általi) és a rejtett select-et - ahogy a felhasználó sem - nem módosítja.
+SELECT_OPTION_SCRIPT = r"""/* selectOption */
+var select = arguments[0], by = arguments[1], key = arguments[2];
+if (!select || select.tagName !== 'SELECT') {
+  return {status: 'unexpected tag', tag: select ? select.tagName.toLowerCase() : null};
+}
+if (select.matches(':disabled')) { return {status: 'select disabled'}; }
+var style = window.getComputedStyle(select);
+if (style.display === 'none' || style.visibility === 'hidden' || !select.getClientRects().length) {
+  return {status: 'not interactable'};
+}
+var options = select.options, matches = [];
+if (by === 'index') {
+  if (key >= 0 && key < options.length) { matches.push(options[key]); }
+} else {
+  for (var i = 0; i < options.length; i++) {
+    var option = options[i];
+    var found = by === 'value' ? option.value === key : option.text.replace(/\s+/g, ' ').trim() === key;
+    if (found) {
+      matches.push(option);
+      if (!select.multiple) { break; }
+    }
+  }
+}
+if (!matches.length) { return {status: 'no such option'}; }
+for (var j = 0; j < matches.length; j++) {
+  if (matches[j].disabled) { return {status: 'disabled'}; }
+}
+var changed = false;
+for (var k = 0; k < matches.length; k++) {
+  if (!matches[k].selected) { matches[k].selected = true; changed = true; }
+}
+if (changed) {
+  select.dispatchEvent(new Event('input', {bubbles: true}));
+  select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return {status: 'ok', changed: changed, selected: matches.map(function (match) { return match.index; })};
+"""
+
+# Az összes opció egy lekérésben: [szöveg, érték, kijelölt, tiltott] soronként
+READ_OPTIONS_SCRIPT = r"""/* readOptions */
+var select = arguments[0];
+if (!select || select.tagName !== 'SELECT') {
+  return {status: 'unexpected tag', tag: select ? select.tagName.toLowerCase() : null};
+}
+var options = select.options, rows = new Array(options.length);
+for (var i = 0; i < options.length; i++) {
+  var option = options[i];
+  rows[i] = [option.text.replace(/\s+/g, ' ').trim(), option.value, option.selected, option.disabled];
+}
+return {status: 'ok', multiple: select.multiple, options: rows};
+"""
+
+SELECT_BY = ("text", "value", "index")
+
+_DESCRIPTIONS = {"text": "visible text", "value": "value", "index": "index"}
+
+
+def _check(result, by=None, key=None):
+    """A szkript státusza -> ugyanazok a kivételek, mint a Selenium Select-nél"""
+    status = result["status"]
+    if status == "unexpected tag":
+        raise UnexpectedTagNameException(f"Select only works on <select> elements, not on {result['tag']}")
+    if status == "no such option":
+        raise NoSuchElementException(f"Could not locate element with {_DESCRIPTIONS[by]}: {key}")
+    if status == "disabled":
+        raise NotImplementedError("You may not select a disabled option")
+    if status == "select disabled":
+        raise NotImplementedError("Select element is disabled and may not be used.")
+    if status == "not interactable":
+        raise ElementNotInteractableException("Select element is not visible and may not be used")
+    return result
+
+
+def select_option(driver, element, by, key):
+    """
+    Opció kiválasztása egy szkript hívással
+    :param by: "text", "value" vagy "index"
+    :return: A kiválasztott opciók indexei
+    """
+    if by not in SELECT_BY:
+        raise ValueError(f"Ismeretlen kiválasztási mód: {by} (lehet: {', '.join(SELECT_BY)})")
+    if by == "index":
+        key = int(key)
+    return _check(driver.execute_script(SELECT_OPTION_SCRIPT, element, by, key), by, key)["selected"]
+
+
+def read_options(driver, element):
+    """
+    Az összes opció egy szkript hívással
+    :return: [{"index", "text", "value", "selected", "disabled"}, ...] dokumentum sorrendben
+    """
+    result = _check(driver.execute_script(READ_OPTIONS_SCRIPT, element))
+    return [
+        {"index": index, "text": text, "value": value, "selected": selected, "disabled": disabled}
+        for index, (text, value, selected, disabled) in enumerate(result["options"])
+    ]
@@ -0,0 +1,333 @@
+"""
+event_wait.py - Eseményvezérelt várakozás MutationObserver-rel a kliens oldali polling helyett
+
+A WebDriverWait alapból 500 ms-onként újra lekérdezi a feltételt (feltételenként 1-3 HTTP parancs).
+Az "event" stratégia egyetlen execute_async_script hívásban vár: a feltételt az oldalon
+egy MutationObserver értékeli ki minden DOM változásnál, és azonnal visszatér, amint teljesül
+(vagy lejár az idő). A mutáció nélküli változások (stylesheet, CSS transition, layout) miatt
+100 ms-onként és az időtúllépés előtt is lefut egy ellenőrzés. Ha közben az oldal elnavigál,
+a maradék időre polling-ra vált vissza.
+
+Használat:
+    pytest --wait-strategy=event --wait-stats
+"""
+
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from utils.command_counter import instrument_driver
+
+
+WAIT_STRATEGIES = ("poll", "event")
+CONDITIONS = ("present", "visible", "clickable", "invisible")
+
+# A script timeout ennyivel nagyobb a várakozásnál, hogy a böngésző oldali időtúllépés érvényesüljön
+SCRIPT_TIMEOUT_MARGIN = 5
+
+EVENT_WAIT_SCRIPT = """/* eventWait */
+var kind = arguments[0], selector = arguments[1], condition = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+var FALLBACK_INTERVAL = 100;
+var checks = 0, finished = false, observer = null, timer = null, fallback = null;
+function locate() {
+  if (kind === 'element') { return selector; }
+  if (kind === 'css') { return document.querySelector(selector); }
+  if (kind === 'xpath') {
+    return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  var links = document.getElementsByTagName('a');
+  for (var i = 0; i < links.length; i++) {
+    var text = (links[i].innerText || links[i].textContent || '').trim();
+    if (kind === 'link' ? text === selector : text.indexOf(selector) !== -1) { return links[i]; }
+  }
+  return null;
+}
+function visible(el) {
+  var style = window.getComputedStyle(el);
+  return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+}
+function evaluate() {
+  checks++;
+  var el = locate();
+  if (condition === 'invisible') { return (!el || !visible(el)) ? {value: true} : null; }
+  if (!el) { return null; }
+  if (condition === 'visible' && !visible(el)) { return null; }
+  if (condition === 'clickable' && (!visible(el) || el.disabled)) { return null; }
+  return {value: el};
+}
+function finish(status, result) {
+  if (finished) { return; }
+  finished = true;
+  if (observer) { observer.disconnect(); }
+  if (timer) { clearTimeout(timer); }
+  if (fallback) { clearInterval(fallback); }
+  window.removeEventListener('pagehide', onLeave);
+  done({status: status, value: result ? result.value : null, satisfied_at: Date.now(), checks: checks});
+}
+function onLeave() { finish('navigated', null); }
+function check() {
+  var result = evaluate();
+  if (result) { finish('ok', result); }
+}
+var initial = evaluate();
+if (initial) {
+  finish('ok', initial);
+} else {
+  observer = new MutationObserver(check);
+  observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+  window.addEventListener('pagehide', onLeave);
+  // Stylesheet betöltés, CSS transition, layout változás nem jár mutációval - ritka tartalék ellenőrzés
+  fallback = setInterval(check, FALLBACK_INTERVAL);
+  timer = setTimeout(function () {
+    var result = evaluate();
+    finish(result ? 'ok' : 'timeout', result);
+  }, timeout);
+}
+"""
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def script_locator(locator):
+    """
+    Selenium locator -> (kind, selector) az oldali szkripthez
+    Az ID / NAME / CLASS_NAME / TAG_NAME a Selenium-hoz hasonlóan CSS-re fordul
+    """
+    # A selenium.webdriver csomag (Chrome / Firefox modulokkal) a plugin importjakor nem töltődik be
+    from selenium.webdriver.common.by import By
+
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f"[id={_css_string(value)}]"
+    if by == By.NAME:
+        return "css", f"[name={_css_string(value)}]"
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.LINK_TEXT:
+        return "link", value
+    if by == By.PARTIAL_LINK_TEXT:
+        return "partial", value
+    raise ValueError(f"Nem támogatott locator: {by}")
+
+
+def expected_condition(condition, locator, element=None):
+    """A feltétel polling (WebDriverWait) megfelelője - element esetén a már megtalált elemen"""
+    from selenium.webdriver.support import expected_conditions as EC
+
+    if element is not None:
+        if condition == "present":
+            return lambda driver: element
+        if condition == "visible":
+            return EC.visibility_of(element)
+        if condition == "clickable":
+            return EC.element_to_be_clickable(element)
+        if condition == "invisible":
+            return EC.invisibility_of_element(element)
+    if condition == "present":
+        return EC.presence_of_element_located(locator)
+    if condition == "visible":
+        return EC.visibility_of_element_located(locator)
+    if condition == "clickable":
+        return EC.element_to_be_clickable(locator)
+    if condition == "invisible":
+        return EC.invisibility_of_element_located(locator)
+    raise ValueError(f"Ismeretlen feltétel: {condition} (ismertek: {', '.join(CONDITIONS)})")
+
+
+# ===== STATISZTIKA =====
+
+class WaitStats:
+    """
+    Várakozásonkénti parancsszám, időtartam és (event módban) a teljesülés utáni késleltetés
+    :param enabled: False esetén a record() nem tárol (nincs, aki felhasználná)
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.records = []
+
+    def record(self, strategy, condition, duration, commands, outcome, latency=None, fallback=False, locator=None):
+        if not self.enabled:
+            return
+        self.records.append({
+            "strategy": strategy,
+            "condition": condition,
+            "locator": tuple(locator) if locator is not None else None,
+            "duration": duration,
+            "commands": commands,
+            "outcome": outcome,
+            "latency": latency,
+            "fallback": fallback,
+        })
+
+    def summary(self):
+        """Stratégiánként: várakozások, átlagos parancsszám / időtartam / késleltetés"""
+        result = {}
+        for strategy in WAIT_STRATEGIES:
+            records = [record for record in self.records if record["strategy"] == strategy]
+            if not records:
+                continue
+            latencies = [record["latency"] for record in records if record["latency"] is not None]
+            result[strategy] = {
+                "waits": len(records),
+                "commands_per_wait": sum(record["commands"] for record in records) / len(records),
+                "avg_duration_ms": sum(record["duration"] for record in records) / len(records) * 1000,
+                "avg_latency_ms": sum(latencies) / len(latencies) * 1000 if latencies else None,
+                "timeouts": sum(1 for record in records if record["outcome"] == "timeout"),
+                "fallbacks": sum(1 for record in records if record["fallback"]),
+            }
+        return result
+
+    def reset(self):
+        self.records.clear()
+
+
+# Közös gyűjtő: csak --wait-stats / --profile-locators mellett rögzít (pytest_configure)
+wait_stats = WaitStats(enabled=False)
+
+_wait_strategy = "poll"
+
+
+def set_wait_strategy(strategy):
+    global _wait_strategy
+    if strategy not in WAIT_STRATEGIES:
+        raise ValueError(f"Ismeretlen wait stratégia: {strategy}")
+    _wait_strategy = strategy
+
+
+def wait_strategy():
+    return _wait_strategy
+
+
+# ===== WAIT ENGINE =====
+
+class WaitEngine:
+    """
+    BasePage várakozások közös belépési pontja
+    until("present" | "visible" | "clickable" | "invisible", locator) - a WebDriverWait.until-hoz hasonlóan
+    a WebElement-et (invisible esetén True-t) adja vissza, vagy TimeoutException-t dob
+    until(condition, locator, element) - a (cache-elt) elemen vár; elavult elemnél
+    StaleElementReferenceException, a statisztikában a locator szerepel
+    """
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.5, strategy=None, stats=None):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.strategy = strategy
+        self.stats = stats if stats is not None else wait_stats
+        self.counter = instrument_driver(driver)
+
+    def until(self, condition, locator, element=None):
+        strategy = self.strategy or _wait_strategy
+        begin = time.perf_counter()
+        commands_before = self.counter.total
+        latency, fallback, outcome = None, False, "ok"
+        try:
+            if strategy == "event":
+                result, latency, fallback = self._event_wait(condition, locator, element, begin)
+            else:
+                result = self._poll(condition, locator, element, self.timeout)
+            return result
+        except TimeoutException:
+            outcome = "timeout"
+            raise
+        finally:
+            self.stats.record(
+                strategy, condition, time.perf_counter() - begin,
+                self.counter.total - commands_before, outcome, latency, fallback, locator
+            )
+
+    def _poll(self, condition, locator, element, timeout):
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        wait = WebDriverWait(self.driver, max(timeout, 0), poll_frequency=self.poll_frequency)
+        return wait.until(expected_condition(condition, locator, element))
+
+    def _ensure_script_timeout(self):
+        """A script timeout driverenként egyszer állítódik (nem minden várakozásnál)"""
+        needed = self.timeout + SCRIPT_TIMEOUT_MARGIN
+        if getattr(self.driver, "_event_wait_script_timeout", None) != needed:
+            self.driver.set_script_timeout(needed)
+            self.driver._event_wait_script_timeout = needed
+
+    def _event_wait(self, condition, locator, element, begin):
+        kind, selector = ("element", element) if element is not None else script_locator(locator)
+        try:
+            self._ensure_script_timeout()
+            response = self.driver.execute_async_script(
+                EVENT_WAIT_SCRIPT, kind, selector, condition, int(self.timeout * 1000)
+            )
+        except TimeoutException:
+            raise TimeoutException(f"Script timeout várakozás közben: {condition} {locator}")
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException:
+            response = {"status": "navigated"}  # az oldal elnavigált a szkript alatt
+
+        status = (response or {}).get("status")
+        if status == "ok":
+            satisfied_at = response.get("satisfied_at")
+            latency = max(time.time() - satisfied_at / 1000, 0.0) if satisfied_at else None
+            return response["value"], latency, False
+        if status == "timeout":
+            raise TimeoutException(f"Feltétel nem teljesült {self.timeout}s alatt: {condition} {locator}")
+
+        # Navigáció közben a MutationObserver elveszik - a maradék időben polling
+        remaining = self.timeout - (time.perf_counter() - begin)
+        return self._poll(condition, locator, element, remaining), None, True
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--wait-strategy",
+        action="store",
+        default="poll",
+        choices=WAIT_STRATEGIES,
+        help="BasePage waits: poll (WebDriverWait) or event (in-page MutationObserver, one round-trip)"
+    )
+    parser.addoption(
+        "--wait-stats",
+        action="store_true",
+        default=False,
+        help="Report command count and latency per wait"
+    )
+
+
+class WaitStatsReporter:
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = wait_stats.summary()
+        if not summary:
+            return
+        terminalreporter.section("Wait statistics")
+        for strategy, row in summary.items():
+            latency = f"{row['avg_latency_ms']:.1f} ms" if row["avg_latency_ms"] is not None else "n/a"
+            terminalreporter.write_line(
+                f"{strategy:5s}  waits: {row['waits']:5d}  commands/wait: {row['commands_per_wait']:.2f}  "
+                f"avg duration: {row['avg_duration_ms']:.1f} ms  latency after condition: {latency}  "
+                f"timeouts: {row['timeouts']}  fallbacks: {row['fallbacks']}"
+            )
+
+
+def pytest_configure(config):
+    set_wait_strategy(config.getoption("--wait-strategy"))
+    wait_stats.enabled = config.getoption("--wait-stats") or config.getoption("--profile-locators", False)
+    if config.getoption("--wait-stats"):
+        config.pluginmanager.register(WaitStatsReporter(), "wait_stats")
+
+
+def pytest_unconfigure(config):
+    wait_stats.reset()
+    wait_stats.enabled = False
@@ -0,0 +1,528 @@
+"""
+fake_driver.py - In-process fake WebDriver backend
+A valódi Selenium WebDriver osztályt használja, csak a command executor szintjén
+helyettesíti a böngészőt: a parancsokat egy HTML parser alapú DOM és a
+FakeSite szkriptelt modellje szolgálja ki. Így a WebElement, Select és az
+expected_conditions változatlanul működik, böngésző processz nélkül.
+
+Használat:
+    pytest --backend=fake
+"""
+
+import base64
+import itertools
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utils.dom import Document, find_all, parse_html
+from utils.dropdown import READ_OPTIONS_SCRIPT, SELECT_OPTION_SCRIPT
+from utils.event_wait import EVENT_WAIT_SCRIPT
+from utils.fake_site import FakeSite
+from utils.nav_metrics import NAV_METRICS_SCRIPT
+from utils.snapshot import SNAPSHOT_SCRIPT, browser_state_attributes
+
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# 1x1 pixeles átlátszó PNG - a screenshot parancsok válasza
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+SCROLL_INTO_VIEW_SCRIPT = "arguments[0].scrollIntoView();"
+SCROLL_TO_TOP_SCRIPT = "window.scrollTo(0, 0);"
+SCROLL_TO_BOTTOM_SCRIPT = "window.scrollTo(0, document.body.scrollHeight);"
+
+# Szkript kezelők: pontos szkript szöveg vagy /* marker */ előtag -> handler(executor, *args)
+_SCRIPTS = {}
+_SCRIPT_PREFIXES = {}
+
+
+def register_script(script=None, prefix=None):
+    """
+    Dekorátor - JavaScript szkript Python megfelelőjének regisztrálása
+    :param script: A szkript pontos szövege
+    :param prefix: Vagy a szkript eleje (pl. Selenium atomok "/* getAttribute */" markere)
+    """
+    def decorator(handler):
+        if script is not None:
+            _SCRIPTS[script.strip()] = handler
+        if prefix is not None:
+            _SCRIPT_PREFIXES[prefix] = handler
+        return handler
+    return decorator
+
+
+class FakeError(Exception):
+    """W3C hibaválasz (status = W3C hiba kód, pl. "no such element")"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class FakeCommandExecutor:
+    """
+    Command executor a RemoteConnection helyén
+    A böngésző állapota: aktuális dokumentum, URL, előzmények, session (sütik)
+    """
+
+    def __init__(self, site=None):
+        self.site = site or FakeSite()
+        self.session = {}
+        self.document = parse_html("<html><head></head><body></body></html>")
+        self.url = "about:blank"
+        self.page_size = 0
+        self.history = []
+        self.history_index = -1
+        self.generation = 0
+        self.elements = {}
+        self._references = {}
+        self._ids = itertools.count(1)
+        self.closed = False
+
+    # ===== NAVIGÁCIÓ =====
+
+    def load(self, url, method="GET", form=None, record_history=True):
+        """Oldal betöltése - átirányításokat követ, új dokumentum generációt nyit"""
+        for _ in range(10):
+            scheme = urlsplit(url).scheme
+            if scheme in ("http", "https"):
+                response = self.site.handle(method, url, self.session, form)
+            else:
+                response = None
+            if response is not None and response.is_redirect:
+                url, method, form = urljoin(url, response.location), "GET", None
+                continue
+            break
+
+        html = response.html if response is not None else "<html><head></head><body></body></html>"
+        self.document = parse_html(html)
+        self.url = url
+        self.page_size = len(html)
+        self.generation += 1
+        self.elements.clear()
+        self._references.clear()
+
+        if record_history:
+            del self.history[self.history_index + 1:]
+            self.history.append(url)
+            self.history_index = len(self.history) - 1
+
+    def submit_form(self, form_node):
+        """Form elküldése a benne lévő mezők aktuális értékével"""
+        fields = {}
+        for node in form_node.iter_descendants():
+            name = node.attrs.get("name")
+            if name and node.tag in ("input", "select", "textarea"):
+                fields[name] = node.get_property("value") or ""
+        action = urljoin(self.url, form_node.attrs.get("action", self.url))
+        method = form_node.attrs.get("method", "get").upper()
+        self.load(action, method=method, form=fields)
+
+    # ===== ELEM REFERENCIÁK =====
+
+    def reference(self, node):
+        """Node -> W3C elem referencia"""
+        element_id = self._references.get(id(node))
+        if element_id is None:
+            element_id = f"fake-{self.generation}-{next(self._ids)}"
+            self.elements[element_id] = (node, self.generation)
+            self._references[id(node)] = element_id
+        return {ELEMENT_KEY: element_id}
+
+    def node(self, element_id):
+        """W3C elem azonosító -> Node (stale, ha közben navigáltunk vagy lekerült a DOM-ról)"""
+        if isinstance(element_id, dict):
+            element_id = element_id.get(ELEMENT_KEY)
+        entry = self.elements.get(element_id)
+        if entry is None or entry[1] != self.generation or not entry[0].is_attached(self.document):
+            raise FakeError("stale element reference", f"Element {element_id} is no longer attached to the DOM")
+        return entry[0]
+
+    def unwrap(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.node(value)
+        if isinstance(value, list):
+            return [self.unwrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.unwrap(item) for key, item in value.items()}
+        return value
+
+    def wrap(self, value):
+        if isinstance(value, Document):
+            value = value.document_element
+        if hasattr(value, "tag") and hasattr(value, "attrs"):
+            return self.reference(value)
+        if isinstance(value, (list, tuple)):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        return value
+
+    # ===== COMMAND EXECUTOR INTERFÉSZ =====
+
+    def execute(self, command, params):
+        """
+        Egy WebDriver parancs végrehajtása
+        :return: W3C válasz dict ({"value": ...} vagy hiba esetén status + value)
+        """
+        params = dict(params or {})
+        params.pop("sessionId", None)
+        handler = getattr(self, "_cmd_" + command, None)
+        try:
+            if handler is None:
+                raise FakeError("unknown command", f"Fake backend nem támogatja: {command}")
+            return {"value": handler(params)}
+        except FakeError as error:
+            return {"status": error.status, "value": {"error": error.status, "message": error.message}}
+
+    def close(self):
+        self.closed = True
+
+    # ----- session / ablak -----
+
+    def _cmd_newSession(self, params):
+        return {"sessionId": "fake-session", "capabilities": {"browserName": "fake", "browserVersion": "1.0"}}
+
+    def _cmd_quit(self, params):
+        self.closed = True
+
+    def _cmd_close(self, params):
+        self.closed = True
+
+    def _cmd_setTimeouts(self, params):
+        return None
+
+    def _cmd_w3cMaximizeWindow(self, params):
+        return {"x": 0, "y": 0, "width": 1920, "height": 1080}
+
+    def _cmd_setWindowRect(self, params):
+        return {"x": params.get("x") or 0, "y": params.get("y") or 0,
+                "width": params.get("width") or 1920, "height": params.get("height") or 1080}
+
+    def _cmd_getWindowRect(self, params):
+        return {"x": 0, "y": 0, "width": 1920, "height": 1080}
+
+    def _cmd_w3cGetCurrentWindowHandle(self, params):
+        return "fake-window"
+
+    def _cmd_w3cGetWindowHandles(self, params):
+        return ["fake-window"]
+
+    def _cmd_deleteAllCookies(self, params):
+        self.session.clear()
+
+    def _cmd_addCookie(self, params):
+        cookie = params["cookie"]
+        self.session[cookie["name"]] = cookie["value"]
+
+    def _cmd_getCookies(self, params):
+        return [{"name": name, "value": str(value)} for name, value in self.session.items()]
+
+    def _cmd_getLog(self, params):
+        return []
+
+    def _cmd_screenshot(self, params):
+        return base64.b64encode(BLANK_PNG).decode("ascii")
+
+    def _cmd_elementScreenshot(self, params):
+        self.node(params["id"])
+        return base64.b64encode(BLANK_PNG).decode("ascii")
+
+    # ----- navigáció -----
+
+    def _cmd_get(self, params):
+        self.load(urljoin(self.url, params["url"]))
+
+    def _cmd_refresh(self, params):
+        self.load(self.url, record_history=False)
+
+    def _cmd_goBack(self, params):
+        if self.history_index > 0:
+            self.history_index -= 1
+            self.load(self.history[self.history_index], record_history=False)
+
+    def _cmd_goForward(self, params):
+        if self.history_index < len(self.history) - 1:
+            self.history_index += 1
+            self.load(self.history[self.history_index], record_history=False)
+
+    def _cmd_getCurrentUrl(self, params):
+        return self.url
+
+    def _cmd_getTitle(self, params):
+        return self.document.title
+
+    def _cmd_getPageSource(self, params):
+        return "<!DOCTYPE html>" + self.document.outer_html()
+
+    # ----- keresés -----
+
+    def _find(self, params, context=None):
+        return find_all(self.document, params["using"], params["value"], context)
+
+    def _cmd_findElement(self, params):
+        nodes = self._find(params)
+        if not nodes:
+            raise FakeError("no such element", f"Unable to locate element: {params['using']}={params['value']}")
+        return self.reference(nodes[0])
+
+    def _cmd_findElements(self, params):
+        return [self.reference(node) for node in self._find(params)]
+
+    def _cmd_findChildElement(self, params):
+        nodes = self._find(params, self.node(params["id"]))
+        if not nodes:
+            raise FakeError("no such element", f"Unable to locate element: {params['using']}={params['value']}")
+        return self.reference(nodes[0])
+
+    def _cmd_findChildElements(self, params):
+        return [self.reference(node) for node in self._find(params, self.node(params["id"]))]
+
+    # ----- elem lekérdezések -----
+
+    def _cmd_getElementText(self, params):
+        return self.node(params["id"]).rendered_text()
+
+    def _cmd_getElementTagName(self, params):
+        return self.node(params["id"]).tag
+
+    def _cmd_getElementAttribute(self, params):
+        return self.node(params["id"]).attrs.get(params["name"])
+
+    def _cmd_getElementProperty(self, params):
+        return self.node(params["id"]).get_property(params["name"])
+
+    def _cmd_isElementSelected(self, params):
+        node = self.node(params["id"])
+        return bool(node.get_property("selected") or node.get_property("checked"))
+
+    def _cmd_isElementEnabled(self, params):
+        return self.node(params["id"]).is_enabled()
+
+    def _cmd_getElementRect(self, params):
+        self.node(params["id"])
+        return {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    def _cmd_getElementValueOfCssProperty(self, params):
+        node = self.node(params["id"])
+        name = params["propertyName"]
+        if name == "display":
+            return "block" if node.is_displayed() else "none"
+        if name == "visibility":
+            return "visible" if node.is_displayed() else "hidden"
+        if name == "opacity":
+            return "1"
+        return ""
+
+    # ----- interakciók -----
+
+    def _interactable(self, element_id):
+        node = self.node(element_id)
+        if not node.is_displayed():
+            raise FakeError("element not interactable", f"Element <{node.tag}> is not visible")
+        return node
+
+    def _cmd_clickElement(self, params):
+        node = self._interactable(params["id"])
+        if not node.is_enabled():
+            return None
+        link = node.closest("a")
+        if link is not None and link.attrs.get("href") and not link.attrs["href"].startswith("#"):
+            self.load(urljoin(self.url, link.attrs["href"]))
+            return None
+        if node.tag == "option":
+            select = node.closest("select")
+            if select is not None:
+                select.select_option(node)
+            return None
+        if node.tag == "input" and node.attrs.get("type", "").lower() in ("checkbox", "radio"):
+            node.set_property("checked", not node.get_property("checked"))
+            return None
+        button = node.closest("button")
+        submitter = button if button is not None else node
+        kind = submitter.attrs.get("type", "submit" if submitter.tag == "button" else "").lower()
+        if kind == "submit":
+            form = submitter.closest("form")
+            if form is not None:
+                self.submit_form(form)
+        return None
+
+    def _cmd_clearElement(self, params):
+        node = self._interactable(params["id"])
+        node.set_property("value", "")
+
+    def _cmd_sendKeysToElement(self, params):
+        node = self._interactable(params["id"])
+        text = params.get("text", "")
+        submit = Keys.ENTER in text or Keys.RETURN in text
+        typed = "".join(char for char in text if not "\ue000" <= char <= "\uf8ff")
+        if node.tag in ("input", "textarea"):
+            node.set_property("value", (node.get_property("value") or "") + typed)
+        if submit and node.closest("form") is not None:
+            self.submit_form(node.closest("form"))
+
+    # ----- szkriptek -----
+
+    def _run_script(self, script, args):
+        handler = _SCRIPTS.get(script.strip())
+        if handler is None:
+            handler = next((handler for prefix, handler in _SCRIPT_PREFIXES.items()
+                            if script.startswith(prefix)), None)
+        if handler is None:
+            raise FakeError("javascript error", f"Fake backend nem ismeri a szkriptet: {script[:80]!r}")
+        return self.wrap(handler(self, *self.unwrap(args)))
+
+    def _cmd_w3cExecuteScript(self, params):
+        return self._run_script(params["script"], params.get("args", []))
+
+    def _cmd_w3cExecuteScriptAsync(self, params):
+        return self._run_script(params["script"], params.get("args", []))
+
+
+# ===== BEÉPÍTETT SZKRIPTEK =====
+
+@register_script(prefix="/* getAttribute */")
+def _get_attribute(executor, node, name):
+    return node.get_attribute(name)
+
+
+@register_script(prefix="/* isDisplayed */")
+def _is_displayed(executor, node):
+    return node.is_displayed()
+
+
+@register_script(prefix="/* submitForm */")
+def _submit_form(executor, node):
+    form = node.closest("form")
+    if form is None:
+        raise FakeError("javascript error", "Unable to find containing form element")
+    executor.submit_form(form)
+
+
+@register_script(script=SNAPSHOT_SCRIPT)
+def _page_snapshot(executor):
+    root = executor.document.document_element
+    return {
+        "html": root.outer_html(browser_state_attributes),
+        "url": executor.url,
+        "title": executor.document.title,
+    }
+
+
+@register_script(script=NAV_METRICS_SCRIPT)
+def _navigation_metrics(executor):
+    """Determinisztikus timing értékek az oldal méretéből (ms), hogy a budget tesztek reprodukálhatók legyenek"""
+    size = executor.page_size
+    return {
+        "url": executor.url,
+        "metrics": {
+            "ttfb": 5.0,
+            "dom_content_loaded": 10.0 + size / 100,
+            "load": 20.0 + size / 100,
+            "first_paint": 12.0 + size / 100,
+            "first_contentful_paint": 12.0 + size / 100,
+            "resource_count": 0,
+            "transfer_size": size,
+        },
+    }
+
+
+_EVENT_WAIT_BY = {"css": By.CSS_SELECTOR, "xpath": By.XPATH, "link": By.LINK_TEXT, "partial": By.PARTIAL_LINK_TEXT}
+
+
+@register_script(script=EVENT_WAIT_SCRIPT)
+def _event_wait(executor, kind, selector, condition, timeout):
+    """A fake DOM a szkript futása alatt nem változik: egy kiértékelés, teljesülés vagy azonnali timeout"""
+    if kind == "element":
+        node = selector
+    else:
+        nodes = find_all(executor.document, _EVENT_WAIT_BY[kind], selector)
+        node = nodes[0] if nodes else None
+    if condition == "invisible":
+        satisfied, value = node is None or not node.is_displayed(), True
+    else:
+        satisfied = (node is not None
+                     and (condition == "present" or node.is_displayed())
+                     and (condition != "clickable" or node.is_enabled()))
+        value = node
+    return {
+        "status": "ok" if satisfied else "timeout",
+        "value": value if satisfied else None,
+        "satisfied_at": time.time() * 1000,
+        "checks": 1,
+    }
+
+
+def _option_text(option):
+    return re.sub(r"\s+", " ", option.string_value()).strip()
+
+
+@register_script(script=SELECT_OPTION_SCRIPT)
+def _select_option(executor, node, by, key):
+    """A szkript megfelelője a fake DOM-on (eseménykezelők nélkül - a fake oldal nem futtat JS-t)"""
+    if node.tag != "select":
+        return {"status": "unexpected tag", "tag": node.tag}
+    if not node.is_enabled():
+        return {"status": "select disabled"}
+    if not node.is_displayed():
+        return {"status": "not interactable"}
+    options = list(enumerate(node.options()))
+    if by == "index":
+        matches = options[key:key + 1] if key >= 0 else []
+    else:
+        matches = [(index, option) for index, option in options
+                   if (option.get_property("value") if by == "value" else _option_text(option)) == key]
+        if "multiple" not in node.attrs:
+            matches = matches[:1]
+    if not matches:
+        return {"status": "no such option"}
+    if any(option.get_property("disabled") for _, option in matches):
+        return {"status": "disabled"}
+    changed = False
+    for _, option in matches:
+        if not option.get_property("selected"):
+            node.select_option(option)
+            changed = True
+    return {"status": "ok", "changed": changed, "selected": [index for index, _ in matches]}
+
+
+@register_script(script=READ_OPTIONS_SCRIPT)
+def _read_options(executor, node):
+    if node.tag != "select":
+        return {"status": "unexpected tag", "tag": node.tag}
+    rows = [[_option_text(option), option.get_property("value"), bool(option.get_property("selected")),
+             bool(option.get_property("disabled"))] for option in node.options()]
+    return {"status": "ok", "multiple": "multiple" in node.attrs, "options": rows}
+
+
+@register_script(script=SCROLL_INTO_VIEW_SCRIPT)
+@register_script(script=SCROLL_TO_TOP_SCRIPT)
+@register_script(script=SCROLL_TO_BOTTOM_SCRIPT)
+def _scroll(executor, *args):
+    return None
+
+
+# ===== DRIVER =====
+
+class FakeWebDriver(WebDriver):
+    """
+    Selenium WebDriver a FakeCommandExecutor fölött
+    Ugyanaz az interfész, mint a valódi driveré (find_element, get, title, execute_script, ...)
+    """
+
+    def __init__(self, site=None):
+        super().__init__(command_executor=FakeCommandExecutor(site), options=ArgOptions())
+
+    @property
+    def fake(self):
+        """A háttér executor (teszt segédeszközöknek: DOM, session, előzmények)"""
+        return self.command_executor
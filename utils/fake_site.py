@@ -0,0 +1,363 @@
+"""
+fake_site.py - A the-internet.herokuapp.com oldalak szkriptelt modellje
+A fake WebDriver backend ebből szolgálja ki az oldalakat: login, flash üzenetek,
+secure area, dropdown és a főoldal link listája.
+A FakeSiteServer ugyanezt valódi HTTP-n szolgálja ki (helyi stand-in a HTTP szintű eszközökhöz).
+"""
+
+import itertools
+import threading
+import time
+from html import escape
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qsl, urlsplit
+
+
+VALID_USERNAME = "tomsmith"
+VALID_PASSWORD = "SuperSecretPassword!"
+
+# A főoldal példa linkjei (href, szöveg) - a valódi oldal sorrendjében
+EXAMPLE_LINKS = [
+    ("/abtest", "A/B Testing"),
+    ("/add_remove_elements/", "Add/Remove Elements"),
+    ("/basic_auth", "Basic Auth"),
+    ("/broken_images", "Broken Images"),
+    ("/challenging_dom", "Challenging DOM"),
+    ("/checkboxes", "Checkboxes"),
+    ("/context_menu", "Context Menu"),
+    ("/digest_auth", "Digest Authentication"),
+    ("/disappearing_elements", "Disappearing Elements"),
+    ("/drag_and_drop", "Drag and Drop"),
+    ("/dropdown", "Dropdown"),
+    ("/dynamic_content", "Dynamic Content"),
+    ("/dynamic_controls", "Dynamic Controls"),
+    ("/dynamic_loading", "Dynamic Loading"),
+    ("/entry_ad", "Entry Ad"),
+    ("/exit_intent", "Exit Intent"),
+    ("/download", "File Download"),
+    ("/upload", "File Upload"),
+    ("/floating_menu", "Floating Menu"),
+    ("/forgot_password", "Forgot Password"),
+    ("/login", "Form Authentication"),
+    ("/frames", "Frames"),
+    ("/geolocation", "Geolocation"),
+    ("/horizontal_slider", "Horizontal Slider"),
+    ("/hovers", "Hovers"),
+    ("/infinite_scroll", "Infinite Scroll"),
+    ("/inputs", "Inputs"),
+    ("/jqueryui/menu", "JQuery UI Menus"),
+    ("/javascript_alerts", "JavaScript Alerts"),
+    ("/javascript_error", "JavaScript onload event error"),
+    ("/key_presses", "Key Presses"),
+    ("/large", "Large & Deep DOM"),
+    ("/windows", "Multiple Windows"),
+    ("/nested_frames", "Nested Frames"),
+    ("/notification_message_rendered", "Notification Messages"),
+    ("/redirector", "Redirect Link"),
+    ("/download_secure", "Secure File Download"),
+    ("/shadowdom", "Shadow DOM"),
+    ("/shifting_content", "Shifting Content"),
+    ("/slow", "Slow Resources"),
+    ("/tables", "Sortable Data Tables"),
+    ("/status_codes", "Status Codes"),
+    ("/typos", "Typos"),
+    ("/tinymce", "WYSIWYG Editor"),
+]
+
+# A /status_codes oldal linkjei
+STATUS_CODES = (200, 301, 404, 500)
+
+
+class FakeResponse:
+    """Egy szkriptelt HTTP válasz"""
+
+    def __init__(self, status=200, html="", location=None):
+        self.status = status
+        self.html = html
+        self.location = location
+
+    @property
+    def is_redirect(self):
+        return self.location is not None
+
+
+class FakeSite:
+    """
+    A the-internet oldal viselkedésének modellje
+    A session dict a böngésző sütijeit helyettesíti (bejelentkezett user, flash üzenet)
+    """
+
+    def __init__(self, dropdown_options=None):
+        self.dropdown_options = dropdown_options or [("1", "Option 1"), ("2", "Option 2")]
+        self.routes = {
+            ("GET", "/"): self.home,
+            ("GET", "/login"): self.login,
+            ("POST", "/authenticate"): self.authenticate,
+            ("GET", "/secure"): self.secure,
+            ("GET", "/logout"): self.logout,
+            ("GET", "/dropdown"): self.dropdown,
+            ("GET", "/status_codes"): self.status_codes,
+            ("GET", "/redirect"): self.redirect,
+        }
+        for code in STATUS_CODES:
+            self.routes[("GET", f"/status_codes/{code}")] = self._status_code_page(code)
+        # A többi példa oldal általános tartalommal (a link ellenőrzéshez elég, hogy létezik)
+        for href, text in EXAMPLE_LINKS:
+            self.routes.setdefault(("GET", href), self._example_page(text))
+
+    def handle(self, method, url, session, form=None):
+        """
+        Kérés kiszolgálása
+        :param method: "GET" vagy "POST"
+        :param url: Teljes URL vagy path
+        :param session: Munkamenet állapot (dict), a handler módosíthatja
+        :param form: POST mezők (dict)
+        :return: FakeResponse
+        """
+        path = urlsplit(url).path or "/"
+        handler = self.routes.get((method.upper(), path))
+        if handler is None:
+            return FakeResponse(404, self._layout("Not Found", "<h1>Not Found</h1>", session))
+        return handler(session, form or {})
+
+    # ===== OLDALAK =====
+
+    def home(self, session, form):
+        items = "\n".join(f'    <li><a href="{href}">{escape(text)}</a></li>' for href, text in EXAMPLE_LINKS)
+        content = (
+            '<h1 class="heading">Welcome to the-internet</h1>\n'
+            '<h2>Available Examples</h2>\n'
+            f"<ul>\n{items}\n</ul>"
+        )
+        return FakeResponse(200, self._layout("The Internet", content, session))
+
+    def login(self, session, form):
+        content = """<div class="example">
+  <h2>Login Page</h2>
+  <h4 class="subheader">This is where you can log into the secure area. Enter <em>tomsmith</em> for the username and <em>SuperSecretPassword!</em> for the password. If the information is wrong you should see error messages.</h4>
+  <form name="login" method="post" id="login" action="/authenticate">
+    <div class="row">
+      <div class="large-6 small-12 columns">
+        <label for="username">Username</label>
+        <input type="text" name="username" id="username">
+      </div>
+    </div>
+    <div class="row">
+      <div class="large-6 small-12 columns">
+        <label for="password">Password</label>
+        <input type="password" name="password" id="password">
+      </div>
+    </div>
+    <button class="radius" type="submit"><i class="fa fa-2x fa-sign-in"> Login</i></button>
+  </form>
+</div>"""
+        return FakeResponse(200, self._layout("The Internet", content, session))
+
+    def authenticate(self, session, form):
+        username = form.get("username", "")
+        password = form.get("password", "")
+        if username != VALID_USERNAME:
+            session["flash"] = ("error", "Your username is invalid!")
+            return FakeResponse(303, location="/login")
+        if password != VALID_PASSWORD:
+            session["flash"] = ("error", "Your password is invalid!")
+            return FakeResponse(303, location="/login")
+        session["user"] = username
+        session["flash"] = ("success", "You logged into a secure area!")
+        return FakeResponse(303, location="/secure")
+
+    def secure(self, session, form):
+        if not session.get("user"):
+            session["flash"] = ("error", "You must login to view the secure area!")
+            return FakeResponse(303, location="/login")
+        content = """<div class="example">
+  <h2><i class="icon-lock"></i> Secure Area</h2>
+  <h4 class="subheader">Welcome to the Secure Area. When you are done click logout below.</h4>
+  <a class="button secondary radius" href="/logout"><i class="icon-2x icon-signout"> Logout</i></a>
+</div>"""
+        return FakeResponse(200, self._layout("The Internet", content, session))
+
+    def logout(self, session, form):
+        session.pop("user", None)
+        session["flash"] = ("success", "You logged out of the secure area!")
+        return FakeResponse(303, location="/login")
+
+    def dropdown(self, session, form):
+        options = "\n".join(
+            f'    <option value="{escape(value, quote=True)}">{escape(text)}</option>'
+            for value, text in self.dropdown_options
+        )
+        content = f"""<div class="example">
+  <h3>Dropdown List</h3>
+  <select id="dropdown">
+    <option value="" disabled="disabled" selected="selected">Please select an option</option>
+{options}
+  </select>
+</div>"""
+        return FakeResponse(200, self._layout("The Internet", content, session))
+
+    def status_codes(self, session, form):
+        items = "\n".join(
+            f'    <li><a href="status_codes/{code}">{code}</a></li>' for code in STATUS_CODES
+        )
+        content = f"""<div class="example">
+  <h3>Status Codes</h3>
+  <ul>
+{items}
+  </ul>
+</div>"""
+        return FakeResponse(200, self._layout("The Internet", content, session))
+
+    def _status_code_page(self, code):
+        def page(session, form):
+            if code == 301:
+                return FakeResponse(301, location="/status_codes")
+            content = f'<div class="example">\n  <h3>Status Codes</h3>\n  <p>This page returned a {code} status code.</p>\n</div>'
+            return FakeResponse(code, self._layout("The Internet", content, session))
+        return page
+
+    def redirect(self, session, form):
+        return FakeResponse(302, location="/status_codes")
+
+    def _example_page(self, title):
+        def page(session, form):
+            content = f'<div class="example">\n  <h3>{escape(title)}</h3>\n</div>'
+            return FakeResponse(200, self._layout("The Internet", content, session))
+        return page
+
+    # ===== LAYOUT =====
+
+    def _layout(self, title, content, session):
+        flash = ""
+        message = session.pop("flash", None)
+        if message:
+            kind, text = message
+            flash = (f'<div data-alert id="flash" class="flash {kind}">\n'
+                     f'            {escape(text)}\n'
+                     f'            <a href="#" class="close">×</a>\n'
+                     f'          </div>')
+        return f"""<!DOCTYPE html>
+<html class="no-js" lang="en">
+<head>
+  <title>{escape(title)}</title>
+</head>
+<body>
+  <div class="row">
+    <div id="flash-messages" class="large-12 columns">{flash}</div>
+  </div>
+  <div class="row">
+    <div id="content" class="large-12 columns">
+{content}
+    </div>
+  </div>
+  <div id="page-footer" class="row">
+    <div class="large-4 large-centered columns">
+      <hr>
+      <div style="text-align: center;">Powered by <a target="_blank" href="http://elementalselenium.com/">Elemental Selenium</a></div>
+    </div>
+  </div>
+</body>
+</html>"""
+
+
+# ===== HTTP STAND-IN =====
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # a pytest kimenet tiszta marad
+        pass
+
+    def do_GET(self):
+        self.server.stand_in.serve(self)
+
+    do_HEAD = do_POST = do_GET
+
+
+class FakeSiteServer:
+    """
+    FakeSite kiszolgálása helyi HTTP szerveren, süti alapú munkamenettel
+    :param latency: Mesterséges válaszidő kérésenként (másodperc), a párhuzamosság méréséhez
+    Számolja a kéréseket és az egyidejűleg kiszolgált kérések maximumát.
+    """
+
+    SESSION_COOKIE = "rack.session"
+
+    def __init__(self, site=None, host="127.0.0.1", port=0, latency=0.0):
+        self.site = site or FakeSite()
+        self.latency = latency
+        self.sessions = {}
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _StandInHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self._thread = None
+
+    @property
+    def origin(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="fake-site", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _session(self, handler):
+        cookie = SimpleCookie(handler.headers.get("Cookie", ""))
+        morsel = cookie.get(self.SESSION_COOKIE)
+        with self._lock:
+            if morsel is not None and morsel.value in self.sessions:
+                return morsel.value, self.sessions[morsel.value], False
+            session_id = str(next(self._session_ids))
+            session = self.sessions[session_id] = {}
+            return session_id, session, True
+
+    def serve(self, handler):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            length = int(handler.headers.get("Content-Length") or 0)
+            form = dict(parse_qsl(handler.rfile.read(length).decode())) if length else None
+            session_id, session, new_session = self._session(handler)
+            method = "GET" if handler.command == "HEAD" else handler.command
+            response = self.site.handle(method, handler.path, session, form)
+
+            body = response.html.encode()
+            handler.send_response(response.status, HTTPStatus(response.status).phrase)
+            if response.is_redirect:
+                handler.send_header("Location", response.location)
+            if new_session:
+                handler.send_header("Set-Cookie", f"{self.SESSION_COOKIE}={session_id}; Path=/")
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            if handler.command != "HEAD":
+                handler.wfile.write(body)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
@@ -0,0 +1,437 @@
+"""
+impact.py - Változás alapú teszt kiválasztás page object / locator függőségek alapján
+
+Record mód (--record-impact): teszt futás közben rögzül, mely page object osztályokat és
+locatorokat használja az egyes tesztek (BasePage / GeneralPage hívásokból), és a teszt fájl mely
+nem page object projekt modulokat importálja. A függőségek ujjlenyomatával együtt JSON-be kerül.
+
+Kiválasztás (--changed-since=<git rev>): a rev óta változott fájlokból csak azok a tesztek futnak,
+amelyek függősége ténylegesen változott (egy locator értéke, egy osztály metódusai, egy importált
+modul), valamint a változott és az új tesztek. Teljes futás, ha a conftest.py / base_page.py /
+general_page.py változott, ha a page objectekből vagy a conftest-ből (pytest_plugins) tranzitívan
+elérhető modul változott, ha ismeretlen szerepű Python fájl változott, vagy ha nincs impact map.
+
+Függőség kulcsok (pytest nodeid mintára):
+    page/login_page.py                          - modul szintű kód (osztályokon kívül)
+    page/login_page.py::LoginPage               - az osztály metódusai és nem-locator attribútumai
+    page/login_page.py::LoginPage::LOGIN_BUTTON - egy locator értéke
+    utils/link_health.py                        - teljes fájl (importált nem page object modul)
+
+Használat:
+    pytest --record-impact
+    pytest --changed-since=origin/main
+"""
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+DEFAULT_MAP_PATH = os.path.join("reports", "impact_map.json")
+MAP_VERSION = 1
+
+# Ezek változásakor minden teszt fut
+FULL_RUN_FILES = ("conftest.py", "page/base_page.py", "general_page.py", "requirements.txt")
+
+# A page object csomag - ezeket a futás közbeni rögzítés követi (locator pontossággal)
+PAGE_PACKAGE = "page"
+
+# Változásuk nem érinti a teszteket
+IGNORED_SUFFIXES = (".md", ".txt", ".jsonl", ".gitignore")
+
+
+# ===== UJJLENYOMATOK =====
+
+def _digest(node_or_text):
+    text = node_or_text if isinstance(node_or_text, str) else ast.dump(node_or_text)
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def _is_locator_assignment(statement):
+    """NAME = (By.X, "...") osztály attribútum"""
+    return (
+        isinstance(statement, ast.Assign)
+        and len(statement.targets) == 1
+        and isinstance(statement.targets[0], ast.Name)
+        and statement.targets[0].id.isupper()
+        and isinstance(statement.value, ast.Tuple)
+        and len(statement.value.elts) == 2
+    )
+
+
+def _without_docstring(body):
+    if body and isinstance(body[0], ast.Expr) and isinstance(getattr(body[0], "value", None), ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        return body[1:]
+    return body
+
+
+def file_fingerprints(rootdir, path, fine_grained=True):
+    """
+    Egy forrásfájl ujjlenyomatai: {kulcs: hash} (a kulcsok a rootdir-hez relatív útvonallal)
+    fine_grained=False esetén csak a teljes fájl (formázás független AST alapján)
+    """
+    try:
+        with open(os.path.join(rootdir, path), encoding="utf-8") as file:
+            tree = ast.parse(file.read(), filename=path)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return {}
+    key = path.replace(os.sep, "/")
+    if not fine_grained:
+        return {key: _digest(ast.Module(body=_without_docstring(tree.body), type_ignores=[]))}
+
+    module_level = []
+    fingerprints = {}
+    for statement in _without_docstring(tree.body):
+        if not isinstance(statement, ast.ClassDef):
+            module_level.append(statement)
+            continue
+        class_key = f"{key}::{statement.name}"
+        members = []
+        for member in _without_docstring(statement.body):
+            if _is_locator_assignment(member):
+                fingerprints[f"{class_key}::{member.targets[0].id}"] = _digest(member.value)
+            else:
+                members.append(member)
+        header = ast.dump(ast.Tuple(elts=statement.bases, ctx=ast.Load()))
+        fingerprints[class_key] = _digest(header + "".join(ast.dump(member) for member in members))
+    fingerprints[key] = _digest("".join(ast.dump(statement) for statement in module_level))
+    return fingerprints
+
+
+def is_page_module(path):
+    return path.replace(os.sep, "/").startswith(PAGE_PACKAGE + "/")
+
+
+def _imported_files(path, rootdir):
+    """Egy fájl által importált projekt modulok (függvényen belüli importok is)"""
+    try:
+        with open(os.path.join(rootdir, path), encoding="utf-8") as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return []
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+            names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return _module_files(names, rootdir)
+
+
+def _module_files(names, rootdir):
+    files = []
+    for name in names:
+        base = name.replace(".", "/")
+        for relative in (base + ".py", base + "/__init__.py"):
+            if os.path.isfile(os.path.join(rootdir, relative)) and relative not in files:
+                files.append(relative)
+    return files
+
+
+def project_imports(test_file, rootdir):
+    """A teszt fájl által közvetlenül importált projekt modulok (page object modulok nélkül)"""
+    return [path for path in _imported_files(test_file, rootdir) if not is_page_module(path)]
+
+
+def _plugin_modules(rootdir):
+    """A conftest.py pytest_plugins listájának modul nevei"""
+    try:
+        with open(os.path.join(rootdir, "conftest.py"), encoding="utf-8") as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return []
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == "pytest_plugins" for target in statement.targets) \
+                and isinstance(statement.value, (ast.List, ast.Tuple)):
+            return [element.value for element in statement.value.elts
+                    if isinstance(element, ast.Constant) and isinstance(element.value, str)]
+    return []
+
+
+def infrastructure_files(rootdir):
+    """
+    A page objectekből, a general_page.py-ból és a conftest-ből (pytest_plugins is) tranzitívan
+    elérhető nem page object modulok. A rögzítés ezek használatát nem látja, így változásuk teljes futás.
+    """
+    pending = ["conftest.py", "general_page.py"] + _module_files(_plugin_modules(rootdir), rootdir)
+    page_dir = os.path.join(rootdir, PAGE_PACKAGE)
+    if os.path.isdir(page_dir):
+        pending.extend(f"{PAGE_PACKAGE}/{name}" for name in sorted(os.listdir(page_dir)) if name.endswith(".py"))
+    reachable = set()
+    while pending:
+        path = pending.pop()
+        if path in reachable or not os.path.isfile(os.path.join(rootdir, path)):
+            continue
+        reachable.add(path)
+        pending.extend(_imported_files(path, rootdir))
+    return {path for path in reachable if not is_page_module(path)}
+
+
+# ===== RÖGZÍTÉS =====
+
+class ImpactRecorder:
+    """Tesztenként a használt page object osztályok és locatorok (futás közben, olcsón: set-be gyűjtve)"""
+
+    def __init__(self, rootdir):
+        self.rootdir = rootdir
+        self.current = None
+        self.usages = {}
+
+    def start_test(self, nodeid):
+        self.current = self.usages.setdefault(nodeid, set())
+
+    def record(self, page, locator=None):
+        if self.current is not None:
+            self.current.add((type(page), tuple(locator) if locator is not None else None))
+
+    def _class_key(self, cls):
+        module = sys.modules.get(cls.__module__)
+        path = getattr(module, "__file__", None)
+        if not path:
+            return None
+        relative = os.path.relpath(path, self.rootdir)
+        if relative.startswith(".."):
+            return None
+        return f"{relative.replace(os.sep, '/')}::{cls.__qualname__}"
+
+    def dependencies(self, usages):
+        """(osztály, locator) használatok -> függőség kulcsok (a teljes öröklési láncra)"""
+        keys = set()
+        for cls, locator in usages:
+            for klass in cls.__mro__[:-1]:
+                class_key = self._class_key(klass)
+                if class_key is None:
+                    continue
+                keys.add(class_key)
+                keys.add(class_key.split("::")[0])
+                if locator is None:
+                    continue
+                for name, value in vars(klass).items():
+                    if name.isupper() and value == locator:
+                        keys.add(f"{class_key}::{name}")
+        return keys
+
+    def build_map(self, previous=None):
+        """Az impact map (egy korábbi map bővítése: a most futott tesztek bejegyzései felülíródnak)"""
+        tests = dict((previous or {}).get("tests", {}))
+        for nodeid, usages in self.usages.items():
+            test_file = nodeid.split("::")[0]
+            tests[nodeid] = sorted(self.dependencies(usages) | set(project_imports(test_file, self.rootdir)))
+
+        fingerprints = {}
+        for path in sorted({key.split("::")[0] for deps in tests.values() for key in deps}):
+            fingerprints.update(file_fingerprints(self.rootdir, path, is_page_module(path)))
+        return {"version": MAP_VERSION, "git_revision": _git(self.rootdir, "rev-parse", "HEAD"),
+                "fingerprints": fingerprints, "tests": tests}
+
+
+_recorder = None
+
+
+def set_active_recorder(recorder):
+    global _recorder
+    _recorder = recorder
+
+
+def record_usage(page, locator=None):
+    """Page objectekből hívva (példányosítás, locator használat) - no-op, ha a rögzítés nincs bekapcsolva"""
+    if _recorder is not None:
+        _recorder.record(page, locator)
+
+
+# ===== KIVÁLASZTÁS =====
+
+def _git(rootdir, *args):
+    try:
+        result = subprocess.run(["git", *args], cwd=rootdir, capture_output=True, text=True, timeout=30, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip()
+
+
+def changed_files(rootdir, revision):
+    """A rev óta változott (commitolt, módosított, új) fájlok a rootdir-hez relatívan; None, ha a git nem elérhető"""
+    diff = _git(rootdir, "diff", "--name-only", "--relative", revision, "--")
+    if diff is None:
+        return None
+    untracked = _git(rootdir, "ls-files", "--others", "--exclude-standard") or ""
+    return sorted({path for path in (diff + "\n" + untracked).splitlines() if path})
+
+
+class Selection:
+
+    def __init__(self, nodeids=None, reason="", changed_keys=()):
+        self.nodeids = nodeids  # None = teljes futás
+        self.reason = reason
+        self.changed_keys = list(changed_keys)
+
+    @property
+    def full_run(self):
+        return self.nodeids is None
+
+
+def select_tests(impact_map, changed, rootdir):
+    """
+    :param changed: változott fájlok (rootdir relatív)
+    :return: Selection - a kiválasztott (ismert) tesztek; az impact mapben nem szereplők mindig futnak
+    """
+    if impact_map is None:
+        return Selection(reason="nincs impact map")
+    if changed is None:
+        return Selection(reason="a git diff nem elérhető")
+
+    recorded = impact_map["fingerprints"]
+    tests = impact_map["tests"]
+    known_files = {key.split("::")[0] for key in recorded}
+    infrastructure = infrastructure_files(rootdir)
+    selected, changed_keys = set(), set()
+
+    for path in changed:
+        if path in FULL_RUN_FILES:
+            return Selection(reason=f"{path} változott")
+        if path in infrastructure:
+            return Selection(reason=f"{path} változott (page object / plugin függőség)")
+        test_ids = [nodeid for nodeid in tests if nodeid.split("::")[0] == path]
+        if test_ids or os.path.basename(path).startswith("test_"):
+            selected.update(test_ids)
+            continue
+        if path in known_files:
+            current = file_fingerprints(rootdir, path, is_page_module(path))
+            for key, value in recorded.items():
+                if key.split("::")[0] == path and current.get(key) != value:
+                    changed_keys.add(key)
+            continue
+        if path.endswith(IGNORED_SUFFIXES) and not path.startswith("test_data"):
+            continue
+        if path.endswith(".py") and is_page_module(path):
+            continue  # egyetlen rögzített teszt sem használja (új vagy törölt page object)
+        if path.endswith(".py") or path.startswith("test_data"):
+            return Selection(reason=f"{path} nincs az impact mapben")
+
+    for nodeid, dependencies in tests.items():
+        if changed_keys.intersection(dependencies):
+            selected.add(nodeid)
+    return Selection(selected, reason=f"{len(changed)} változott fájl", changed_keys=sorted(changed_keys))
+
+
+def load_map(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as file:
+        impact_map = json.load(file)
+    return impact_map if impact_map.get("version") == MAP_VERSION else None
+
+
+def save_map(impact_map, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(impact_map, file, indent=1, sort_keys=True)
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Record page-object / locator dependencies per test into the impact map"
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="GIT_REV",
+        help="Run only tests affected by changes since GIT_REV (plus new tests)"
+    )
+    parser.addoption(
+        "--impact-map",
+        action="store",
+        default=DEFAULT_MAP_PATH,
+        help="JSON file with recorded test dependencies"
+    )
+
+
+class ImpactRecordPlugin:
+
+    def __init__(self, recorder, path):
+        self.recorder = recorder
+        self.path = path
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.recorder.start_test(item.nodeid)
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self.recorder.current = None
+
+    def pytest_sessionfinish(self, session):
+        if self.recorder.usages:
+            save_map(self.recorder.build_map(load_map(self.path)), self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.recorder.usages:
+            terminalreporter.write_line(f"impact map: {len(self.recorder.usages)} tests recorded -> {self.path}")
+
+    def pytest_unconfigure(self, config):
+        set_active_recorder(None)
+
+
+class ImpactSelectPlugin:
+
+    def __init__(self, revision, path, rootdir):
+        self.revision = revision
+        self.path = path
+        self.rootdir = rootdir
+        self.selection = None
+        self.counts = None
+
+    def pytest_collection_modifyitems(self, config, items):
+        impact_map = load_map(self.path)
+        self.selection = select_tests(impact_map, changed_files(self.rootdir, self.revision), self.rootdir)
+        if self.selection.full_run:
+            self.counts = (len(items), len(items))
+            return
+        recorded = impact_map["tests"]
+        keep, deselected = [], []
+        for item in items:
+            (keep if item.nodeid in self.selection.nodeids or item.nodeid not in recorded else deselected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = keep
+        self.counts = (len(keep), len(keep) + len(deselected))
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        if self.selection is None:
+            return None
+        selected, total = self.counts
+        mode = "full run" if self.selection.full_run else "selected"
+        return f"impact ({self.revision}): {mode} {selected}/{total} tests - {self.selection.reason}"
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.selection is not None and self.selection.changed_keys:
+            terminalreporter.section("Impact selection")
+            for key in self.selection.changed_keys:
+                terminalreporter.write_line(f"changed: {key}")
+
+
+def pytest_configure(config):
+    rootdir = str(config.rootpath)
+    path = config.getoption("--impact-map")
+    if config.getoption("--record-impact"):
+        recorder = ImpactRecorder(rootdir)
+        set_active_recorder(recorder)
+        config.pluginmanager.register(ImpactRecordPlugin(recorder, path), "impact_recorder")
+    revision = config.getoption("--changed-since")
+    if revision:
+        config.pluginmanager.register(ImpactSelectPlugin(revision, path, rootdir), "impact_selector")
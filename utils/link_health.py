@@ -0,0 +1,214 @@
+"""
+link_health.py - Párhuzamos link ellenőrzés (asyncio + poolozott HTTP kliens)
+
+A link lista egyetlen DOM olvasásból jön (HomePage.link_inventory), a célok ellenőrzése
+böngésző navigáció nélkül, párhuzamosan történik: státusz, átirányítási lánc, válaszidő,
+opcionálisan egy szinttel mélyebben (az azonos hoston lévő oldalak linkjei).
+Az egyidejű kérések száma globálisan és hostonként korlátos, hostonként kérés/mp limit is adható.
+A teljes lista így nagyjából a leglassabb kérés idejéig tart.
+
+Használat:
+    checker = LinkHealthChecker(concurrency=10, per_host=4, depth=1)
+    results = checker.run(HomePage(driver).link_inventory())
+    attach_results(results)
+    assert not broken(results)
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_CONCURRENCY = 10
+DEFAULT_PER_HOST = 4
+
+
+class _LinkParser(HTMLParser):
+    """<a href> értékek kigyűjtése egy HTML oldalból"""
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.hrefs.append(href)
+
+
+def extract_links(html, base_url):
+    """Abszolút http(s) linkek egy oldalból (fragment nélkül, sorrendtartóan, ismétlés nélkül)"""
+    parser = _LinkParser()
+    parser.feed(html)
+    links = []
+    for href in parser.hrefs:
+        url = urldefrag(urljoin(base_url, href))[0]
+        if urlsplit(url).scheme in ("http", "https") and url not in links:
+            links.append(url)
+    return links
+
+
+class _HostLimiter:
+    """Hostonkénti egyidejűség korlát és minimális időköz a kérések indítása között"""
+
+    def __init__(self, concurrency, rate=None):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.interval:
+            async with self._lock:
+                now = time.monotonic()
+                delay = self._next_start - now
+                self._next_start = max(now, self._next_start) + self.interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.semaphore.release()
+
+
+class LinkHealthChecker:
+    """
+    :param concurrency: Egyidejű kérések maximuma összesen
+    :param per_host: Egyidejű kérések maximuma hostonként
+    :param rate: Kérés / másodperc hostonként (None = korlátlan)
+    :param depth: 0 = csak a megadott linkek, 1 = az azonos hoston lévő HTML célok linkjei is
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST, rate=None,
+                 timeout=10, depth=0, session=None):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.rate = rate
+        self.timeout = timeout
+        self.depth = depth
+        self.session = session or self._pooled_session(concurrency)
+
+    @staticmethod
+    def _pooled_session(concurrency):
+        """Keep-alive kapcsolat pool, akkora, hogy a párhuzamos szálak ne nyissanak eldobható kapcsolatot"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def run(self, urls):
+        """Szinkron belépési pont"""
+        return asyncio.run(self.check(urls))
+
+    async def check(self, urls):
+        """:return: eredmény dict-ek a felfedezés sorrendjében (a megadott linkek, majd a mélyebb szint)"""
+        # A to_thread worker pool legyen legalább akkora, mint az engedélyezett párhuzamosság
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=self.concurrency))
+        self._global = asyncio.Semaphore(self.concurrency)
+        self._hosts = {}
+        self._order = {}
+        self._results = []
+        await asyncio.gather(*(self._visit(url, 0, None) for url in self._unseen(urls)))
+        return sorted(self._results, key=lambda result: self._order[result["url"]])
+
+    def _unseen(self, urls):
+        fresh = []
+        for url in urls:
+            url = urldefrag(url)[0]
+            if url not in self._order:
+                self._order[url] = len(self._order)
+                fresh.append(url)
+        return fresh
+
+    def _limiter(self, host):
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = self._hosts[host] = _HostLimiter(self.per_host, self.rate)
+        return limiter
+
+    async def _visit(self, url, level, parent):
+        host = urlsplit(url).netloc
+        # Előbb a host limiter: a rate limitre váró kérés ne foglaljon globális slotot
+        async with self._limiter(host), self._global:
+            result = await asyncio.to_thread(self._fetch, url)
+        result.update(level=level, parent=parent)
+        body = result.pop("body", None)
+        self._results.append(result)
+
+        if level < self.depth and body is not None and urlsplit(result["final_url"]).netloc == host:
+            children = [link for link in extract_links(body, result["final_url"]) if urlsplit(link).netloc == host]
+            await asyncio.gather(*(self._visit(child, level + 1, url) for child in self._unseen(children)))
+
+    def _fetch(self, url):
+        """Egy link ellenőrzése (worker szálon) - a kivételek is eredményként jönnek vissza"""
+        begin = time.perf_counter()
+        result = {"url": url, "status": None, "final_url": url, "redirects": [], "error": None}
+        try:
+            response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+        except requests.RequestException as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        else:
+            result["status"] = response.status_code
+            result["final_url"] = response.url
+            result["redirects"] = [(hop.status_code, hop.url) for hop in response.history]
+            if "html" in response.headers.get("Content-Type", ""):
+                result["body"] = response.text
+        result["elapsed_ms"] = (time.perf_counter() - begin) * 1000
+        return result
+
+
+# ===== ÉRTÉKELÉS ÉS RIPORT =====
+
+def broken(results):
+    """Hibás linkek: hálózati hiba vagy 4xx / 5xx végső státusz"""
+    return [result for result in results if result["error"] or result["status"] >= 400]
+
+
+def summarize(results, wall_seconds=None):
+    elapsed = [result["elapsed_ms"] for result in results]
+    summary = {
+        "links": len(results),
+        "broken": len(broken(results)),
+        "redirected": sum(1 for result in results if result["redirects"]),
+        "slowest_ms": max(elapsed, default=0.0),
+        "sum_ms": sum(elapsed),
+    }
+    if wall_seconds is not None:
+        summary["wall_ms"] = wall_seconds * 1000
+    return summary
+
+
+def format_results(results):
+    lines = []
+    for result in results:
+        status = result["status"] if result["status"] is not None else "ERR"
+        indent = "  " * result["level"]
+        line = f"{status!s:>4} {result['elapsed_ms']:7.1f} ms  {indent}{result['url']}"
+        if result["redirects"]:
+            hops = " -> ".join(str(code) for code, _ in result["redirects"])
+            line += f"  ({hops} -> {result['final_url']})"
+        if result["error"]:
+            line += f"  ({result['error']})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def attach_results(results, summary=None):
+    """Eredmények csatolása az aktuális Allure teszthez (olvasható tábla + JSON)"""
+    import allure
+    summary = summary or summarize(results)
+    header = ", ".join(f"{key}: {value:.0f}" if isinstance(value, float) else f"{key}: {value}"
+                       for key, value in summary.items())
+    allure.attach(f"{header}\n\n{format_results(results)}", name="Link health",
+                  attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps({"summary": summary, "links": results}, indent=2), name="Link health (JSON)",
+                  attachment_type=allure.attachment_type.JSON)
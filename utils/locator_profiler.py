@@ -0,0 +1,395 @@
+"""
+locator_profiler.py - Locator teljesítmény profilozás és CSS/ID átírási javaslatok
+
+--profile-locators módban minden findElement(s) parancs ideje és találatszáma rögzül locatoronként,
+a várakozások (WaitEngine) idejével együtt. Minden oldalon az első használatkor a locator a DOM
+pillanatképen (BasePage.snapshot formátum) is kiértékelődik: hány elemre illeszkedik, és van-e
+olcsóbb (ID / egyszerű CSS) locator, amely pontosan ugyanazokat az elemeket adja. A javaslat
+a böngészőben is ellenőrződik (ugyanazok az elemek) és lemérődik. A futás végén rangsorolt riport és reports/locator_profile.json készül.
+
+Használat:
+    pytest --profile-locators
+"""
+
+import json
+import os
+import re
+import statistics
+import time
+
+# A selenium.webdriver csomag (Chrome / Firefox modulokkal) és a DOM pillanatkép a használat helyén
+# töltődik be - a plugin importja a gyűjtést nem lassítja
+
+
+DEFAULT_PROFILE_PATH = os.path.join("reports", "locator_profile.json")
+
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+# Parancsok, amelyek után a pillanatkép elavulhat
+_DOM_CHANGING_COMMANDS = frozenset((
+    "get", "refresh", "goBack", "goForward", "clickElement", "sendKeysToElement",
+    "clearElement", "w3cExecuteScript", "w3cExecuteScriptAsync",
+))
+
+# Csak olvasó szkriptek (Selenium atomok, saját mérő szkriptek) - nem avultatják el a pillanatképet
+_READ_ONLY_SCRIPTS = ("/* getAttribute */", "/* isDisplayed */", "/* pageSnapshot */",
+                      "/* navigationMetrics */", "/* eventWait */")
+
+# Javaslat jelöltekhez használt attribútumok (elsőbbségi sorrendben)
+_CANDIDATE_ATTRIBUTES = ("href", "type", "for", "placeholder", "title", "alt", "action", "value", "src")
+
+_IDENTIFIER = re.compile(r"^-?[A-Za-z_][\w-]*$")
+_SIMPLE_CSS = re.compile(r"^[A-Za-z]*(?:[#.][\w-]+|\[[^\]]+\])*$")
+
+
+# ===== LOCATOR NORMALIZÁLÁS ÉS KÖLTSÉG =====
+
+def selenium_form(locator):
+    """Page object locator -> a Selenium által küldött (using, value) pár"""
+    from selenium.webdriver.common.by import By
+
+    by, value = locator
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return by, value
+
+
+def page_object_locator(using, value):
+    """A Selenium konverzió inverze: ('css selector', '[id="x"]') -> ('id', 'x')"""
+    from selenium.webdriver.common.by import By
+
+    if using == By.CSS_SELECTOR:
+        match = re.fullmatch(r'\[(id|name)="([^"]*)"\]', value)
+        if match:
+            return (By.ID if match.group(1) == "id" else By.NAME), match.group(2)
+        if value.startswith(".") and _IDENTIFIER.match(value[1:]):
+            return By.CLASS_NAME, value[1:]
+        if re.fullmatch(r"[A-Za-z][A-Za-z0-9]*", value):
+            return By.TAG_NAME, value.lower()
+    return using, value
+
+
+def normalize(locator):
+    """Egységes kulcs - a (By.ID, "x") és a (By.CSS_SELECTOR, '[id="x"]') ugyanaz a locator"""
+    return page_object_locator(*selenium_form(tuple(locator)))
+
+
+def locator_cost(locator):
+    """
+    Relatív feloldási költség (kisebb = gyorsabb): getElementById < egyszerű CSS < összetett CSS < XPath
+    """
+    from selenium.webdriver.common.by import By
+
+    by, value = locator
+    if by == By.ID:
+        return 0
+    if by in (By.NAME, By.CLASS_NAME, By.TAG_NAME):
+        return 1
+    if by == By.CSS_SELECTOR:
+        return 1 if _SIMPLE_CSS.match(value) else 2
+    if by == By.XPATH:
+        return 4 if ("text()" in value or "contains(" in value) else 3
+    return 3  # LINK_TEXT / PARTIAL_LINK_TEXT: minden <a> szövegének kiszámolása
+
+
+def describe(locator):
+    by, value = locator
+    return f"{by}={value}"
+
+
+# ===== JAVASLATOK =====
+
+def candidate_locators(node):
+    """Olcsóbb locator jelöltek egy elemre, költség szerint növekvő sorrendben"""
+    from selenium.webdriver.common.by import By
+
+    candidates = []
+    node_id = node.attrs.get("id")
+    if node_id:
+        candidates.append((By.ID, node_id))
+    name = node.attrs.get("name")
+    if name and '"' not in name:
+        candidates.append((By.NAME, name))
+    for attribute in _CANDIDATE_ATTRIBUTES:
+        value = node.attrs.get(attribute)
+        if value and '"' not in value:
+            candidates.append((By.CSS_SELECTOR, f'{node.tag}[{attribute}="{value}"]'))
+    classes = [cls for cls in node.classes if _IDENTIFIER.match(cls)]
+    if classes:
+        candidates.append((By.CSS_SELECTOR, node.tag + "".join(f".{cls}" for cls in classes)))
+    for ancestor in node.ancestors():
+        ancestor_id = ancestor.attrs.get("id")
+        if ancestor_id and _IDENTIFIER.match(ancestor_id):
+            candidates.append((By.CSS_SELECTOR, f"#{ancestor_id} {node.tag}"))
+            break
+    return sorted(candidates, key=locator_cost)
+
+
+def suggest(snapshot, locator):
+    """
+    Olcsóbb, ekvivalens locator keresése a pillanatképen
+    :return: (javasolt locator vagy None, az eredeti találatainak száma)
+    """
+    nodes = snapshot.nodes(locator)
+    if not nodes:
+        return None, 0
+    cost = locator_cost(locator)
+    for candidate in candidate_locators(nodes[0]):
+        if locator_cost(candidate) >= cost or normalize(candidate) == normalize(locator):
+            continue
+        try:
+            if snapshot.nodes(candidate) == nodes:
+                return candidate, len(nodes)
+        except Exception:  # a lokális CSS/XPath motor által nem támogatott jelölt
+            continue
+    return None, len(nodes)
+
+
+# ===== PROFILER =====
+
+class LocatorStats:
+
+    def __init__(self, locator):
+        self.locator = locator
+        self.durations = []
+        self.misses = 0
+        self.max_matches = None
+        self.pages = set()
+        self.suggestion = None
+        self.suggestion_timing = None  # (eredeti ms, javasolt ms) a böngészőben mérve
+
+    def as_dict(self, waits):
+        durations = self.durations
+        return {
+            "locator": describe(self.locator),
+            "finds": len(durations),
+            "misses": self.misses,
+            "total_ms": sum(durations) * 1000,
+            "avg_ms": statistics.mean(durations) * 1000 if durations else 0.0,
+            "max_ms": max(durations) * 1000 if durations else 0.0,
+            "max_matches": self.max_matches,
+            "pages": sorted(self.pages),
+            "waits": len(waits),
+            "wait_total_ms": sum(record["duration"] for record in waits) * 1000,
+            "wait_timeouts": sum(1 for record in waits if record["outcome"] == "timeout"),
+            "suggestion": describe(self.suggestion) if self.suggestion else None,
+            "suggestion_timing_ms": self.suggestion_timing,
+        }
+
+
+class LocatorProfiler:
+    """
+    driver.execute wrapper a find parancsokra
+    A saját (pillanatkép, mérés) parancsai a becsomagolt execute-ot hívják, így nem kerülnek a statisztikába
+    """
+
+    def __init__(self, measure_suggestions=True, repeat=3):
+        self.locators = {}
+        self.measure_suggestions = measure_suggestions
+        self.repeat = repeat
+        self._snapshots = {}  # id(driver) -> (url, PageSnapshot)
+        self._checked = set()
+
+    def attach(self, driver):
+        if getattr(driver, "locator_profiler", None) is self:
+            return driver
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            if driver_command not in FIND_COMMANDS:
+                if driver_command in _DOM_CHANGING_COMMANDS and not self._read_only(params):
+                    self._snapshots.pop(id(driver), None)
+                return original_execute(driver_command, params)
+
+            begin = time.perf_counter()
+            try:
+                response = original_execute(driver_command, params)
+            except Exception:
+                self._record(driver_command, params, time.perf_counter() - begin, None)
+                raise
+            self._record(driver_command, params, time.perf_counter() - begin, response)
+            if not driver_command.startswith("findChild"):
+                self._check(driver, original_execute, params)
+            return response
+
+        driver.execute = execute
+        driver.locator_profiler = self
+        return driver
+
+    @staticmethod
+    def _read_only(params):
+        script = (params or {}).get("script")
+        return isinstance(script, str) and script.startswith(_READ_ONLY_SCRIPTS)
+
+    def _stats(self, locator):
+        stats = self.locators.get(locator)
+        if stats is None:
+            stats = self.locators[locator] = LocatorStats(locator)
+        return stats
+
+    def _record(self, driver_command, params, duration, response):
+        stats = self._stats(page_object_locator(params["using"], params["value"]))
+        stats.durations.append(duration)
+        value = response.get("value") if response else None
+        if response is None or (isinstance(value, list) and not value):
+            stats.misses += 1
+
+    def _snapshot(self, driver, execute, url):
+        cached = self._snapshots.get(id(driver))
+        if cached is not None and cached[0] == url:
+            return cached[1]
+        from utils.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
+
+        result = execute("w3cExecuteScript", {"script": SNAPSHOT_SCRIPT, "args": []})["value"]
+        snapshot = PageSnapshot.from_script_result(result)
+        self._snapshots[id(driver)] = (url, snapshot)
+        return snapshot
+
+    def _check(self, driver, execute, params):
+        """Oldalanként egyszer: találatszám és olcsóbb ekvivalens keresése a pillanatképen"""
+        locator = page_object_locator(params["using"], params["value"])
+        try:
+            url = execute("getCurrentUrl", {})["value"]
+            if (url, locator) in self._checked:
+                return
+            self._checked.add((url, locator))
+            suggestion, matches = suggest(self._snapshot(driver, execute, url), locator)
+        except Exception:  # nem támogatott szelektor a lokális motorban / nem elérhető szkript
+            return
+
+        stats = self._stats(locator)
+        stats.pages.add(url)
+        stats.max_matches = max(stats.max_matches or 0, matches)
+        if suggestion is not None and stats.suggestion is None:
+            # Ellenőrzés a böngészőben is: csak akkor javaslat, ha ugyanazokat az elemeket adja
+            repeat = self.repeat if self.measure_suggestions else 1
+            original_s, original_ids = self._time_locator(execute, locator, repeat)
+            suggested_s, suggested_ids = self._time_locator(execute, suggestion, repeat)
+            if original_ids != suggested_ids:
+                return
+            stats.suggestion = suggestion
+            if self.measure_suggestions:
+                stats.suggestion_timing = (original_s * 1000, suggested_s * 1000)
+
+    @staticmethod
+    def _time_locator(execute, locator, repeat):
+        """:return: (medián idő, a böngésző által visszaadott elem azonosítók)"""
+        using, value = selenium_form(locator)
+        durations = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            response = execute("findElements", {"using": using, "value": value})
+            durations.append(time.perf_counter() - begin)
+        elements = [element.id for element in response.get("value") or []]
+        return statistics.median(durations), elements
+
+    def report(self, wait_records=()):
+        """Rangsorolt riport (feloldási + várakozási idő szerint csökkenő)"""
+        waits = {}
+        for record in wait_records:
+            if record.get("locator"):
+                waits.setdefault(normalize(record["locator"]), []).append(record)
+        keys = set(self.locators) | set(waits)
+        rows = [
+            (self.locators.get(key) or LocatorStats(key)).as_dict(waits.get(key, []))
+            for key in keys
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"] + row["wait_total_ms"], reverse=True)
+
+
+_profiler = None
+
+
+def active_profiler():
+    return _profiler
+
+
+def set_active_profiler(profiler):
+    global _profiler
+    _profiler = profiler
+
+
+def profile_driver(driver):
+    """A driver fixture-ökből hívva - no-op, ha a profilozás nincs bekapcsolva"""
+    if _profiler is not None:
+        _profiler.attach(driver)
+    return driver
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-locators",
+        action="store_true",
+        default=False,
+        help="Profile locator resolution/wait time and suggest cheaper equivalent CSS/ID locators"
+    )
+    parser.addoption(
+        "--locator-profile-file",
+        action="store",
+        default=DEFAULT_PROFILE_PATH,
+        help="JSON output of the locator profile"
+    )
+
+
+class LocatorProfilePlugin:
+
+    TOP = 20
+
+    def __init__(self, profiler, path):
+        self.profiler = profiler
+        self.path = path
+        self.rows = []
+
+    def _report(self):
+        from utils.event_wait import wait_stats
+        return self.profiler.report(wait_stats.records)
+
+    def pytest_sessionfinish(self, session):
+        self.rows = self._report()
+        if not self.rows:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(self.rows, file, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.rows:
+            return
+        terminalreporter.section("Locator profile")
+        terminalreporter.write_line(
+            f"{'total':>8} {'finds':>5} {'avg':>6} {'miss':>4} {'match':>5} {'waits':>5} {'wait':>8}  locator"
+        )
+        for row in self.rows[:self.TOP]:
+            matches = "-" if row["max_matches"] is None else str(row["max_matches"])
+            terminalreporter.write_line(
+                f"{row['total_ms']:6.1f}ms {row['finds']:5d} {row['avg_ms']:4.1f}ms {row['misses']:4d} {matches:>5} "
+                f"{row['waits']:5d} {row['wait_total_ms']:6.1f}ms  {row['locator']}"
+            )
+            if row["suggestion"]:
+                timing = row["suggestion_timing_ms"]
+                measured = f" ({timing[0]:.1f}ms -> {timing[1]:.1f}ms)" if timing else ""
+                terminalreporter.write_line(f"{'':>49}-> {row['suggestion']}{measured}")
+        terminalreporter.write_line(f"full report: {self.path}")
+
+    def pytest_unconfigure(self, config):
+        set_active_profiler(None)
+
+
+def pytest_configure(config):
+    if not config.getoption("--profile-locators"):
+        return
+    profiler = LocatorProfiler()
+    set_active_profiler(profiler)
+    config.pluginmanager.register(
+        LocatorProfilePlugin(profiler, config.getoption("--locator-profile-file")), "locator_profile"
+    )
@@ -0,0 +1,287 @@
+"""
+nav_metrics.py - Oldal betöltési metrikák minden page object navigáció után (opt-in)
+
+Navigáció (BasePage.navigate_to / refresh / go_back, GeneralPage.get / refresh_page) után
+egy execute_script hívás kiolvassa a Navigation Timing és Paint Timing adatokat és az
+erőforrás statisztikát; Chromium alatt a CDP Performance.getMetrics is bekerül.
+Az összesítő az aktuális Allure lépéshez csatolódik és a session JSON-be kerül.
+URL-enkénti költségkeret (budget) megsértése figyelmeztetést vagy teszt hibát okoz.
+
+Használat:
+    pytest --nav-metrics
+    pytest --nav-metrics --nav-budget "/login:dom_content_loaded=800,load=1500" --nav-budget-mode=fail
+    pytest --nav-metrics --nav-budget-file=test_data/nav_budgets.json
+"""
+
+import fnmatch
+import json
+import os
+import statistics
+import warnings
+from urllib.parse import urlsplit
+
+
+DEFAULT_METRICS_PATH = os.path.join("reports", "nav_metrics.json")
+
+# Összesítőben megjelenő mezők sorrendje
+METRICS = (
+    "ttfb", "dom_content_loaded", "load", "first_paint", "first_contentful_paint",
+    "resource_count", "transfer_size",
+)
+
+# Egy round-trip: navigation + paint entry-k és erőforrás összesítő
+NAV_METRICS_SCRIPT = """/* navigationMetrics */
+var nav = performance.getEntriesByType('navigation')[0];
+var result = {url: window.location.href, metrics: {}};
+if (nav) {
+  result.metrics.ttfb = nav.responseStart - nav.requestStart;
+  result.metrics.dom_content_loaded = nav.domContentLoadedEventEnd - nav.startTime;
+  result.metrics.load = nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null;
+  result.metrics.transfer_size = nav.transferSize;
+}
+performance.getEntriesByType('paint').forEach(function (entry) {
+  result.metrics[entry.name.replace(/-/g, '_')] = entry.startTime;
+});
+var resources = performance.getEntriesByType('resource');
+result.metrics.resource_count = resources.length;
+result.metrics.transfer_size = (result.metrics.transfer_size || 0) +
+  resources.reduce(function (sum, entry) { return sum + (entry.transferSize || 0); }, 0);
+return result;
+"""
+
+# CDP Performance.getMetrics-ből átvett mezők
+CDP_METRICS = ("Nodes", "JSEventListeners", "LayoutCount", "RecalcStyleCount", "ScriptDuration", "JSHeapUsedSize")
+
+
+class NavigationBudgetExceeded(AssertionError):
+    """Egy navigáció túllépte az URL-re beállított költségkeretet (--nav-budget-mode=fail)"""
+
+
+class NavigationBudgetWarning(UserWarning):
+    """Egy navigáció túllépte az URL-re beállított költségkeretet (--nav-budget-mode=warn)"""
+
+
+# ===== BUDGET =====
+
+def parse_budget(spec):
+    """
+    "/login:dom_content_loaded=800,load=1500" -> ("/login", {"dom_content_loaded": 800.0, "load": 1500.0})
+    A minta fnmatch kifejezés az URL path-ra (pl. "/secure*", "*")
+    """
+    pattern, _, limits = spec.rpartition(":")
+    if not pattern or not limits:
+        raise ValueError(f"Hibás budget: {spec!r} (formátum: PATTERN:metric=ms[,metric=ms])")
+    parsed = {}
+    for limit in limits.split(","):
+        metric, _, value = limit.partition("=")
+        metric = metric.strip()
+        if metric not in METRICS:
+            raise ValueError(f"Ismeretlen metrika a budgetben: {metric!r} (ismertek: {', '.join(METRICS)})")
+        parsed[metric] = float(value)
+    return pattern, parsed
+
+
+def load_budgets(specs=(), path=None):
+    """Budgetek az opciókból és/vagy JSON fájlból ({"/login": {"dom_content_loaded": 800}})"""
+    budgets = []
+    if path:
+        with open(path, encoding="utf-8") as file:
+            for pattern, limits in json.load(file).items():
+                budgets.append(parse_budget(f"{pattern}:" + ",".join(f"{k}={v}" for k, v in limits.items())))
+    budgets.extend(parse_budget(spec) for spec in specs)
+    return budgets
+
+
+# ===== GYŰJTŐ =====
+
+class NavigationMetricsCollector:
+    """
+    Navigációnkénti metrikák gyűjtése, budget ellenőrzés, session napló
+    :param budgets: [(path minta, {metrika: ms})]
+    :param mode: "warn" vagy "fail"
+    """
+
+    def __init__(self, budgets=(), mode="warn", use_cdp=True):
+        self.budgets = list(budgets)
+        self.mode = mode
+        self.use_cdp = use_cdp
+        self.records = []
+        self.current_test = None
+
+    def collect(self, driver, action="navigate"):
+        """Metrikák kiolvasása a driverből az éppen lezajlott navigáció után"""
+        result = driver.execute_script(NAV_METRICS_SCRIPT) or {}
+        url = result.get("url") or driver.current_url
+        metrics = {key: value for key, value in (result.get("metrics") or {}).items() if value is not None}
+        record = {
+            "test": self.current_test,
+            "action": action,
+            "url": url,
+            "path": urlsplit(url).path or "/",
+            "metrics": metrics,
+        }
+        cdp = self._cdp_metrics(driver)
+        if cdp:
+            record["cdp"] = cdp
+        record["violations"] = self.check_budgets(record["path"], metrics)
+        self.records.append(record)
+        self._attach(record)
+
+        if record["violations"]:
+            message = f"Navigációs budget túllépés ({record['path']}): " + "; ".join(record["violations"])
+            if self.mode == "fail":
+                raise NavigationBudgetExceeded(message)
+            warnings.warn(message, NavigationBudgetWarning, stacklevel=3)
+        return record
+
+    def _cdp_metrics(self, driver):
+        """Chromium: CDP Performance.getMetrics - más böngészőn (vagy ha nem elérhető) üres"""
+        if not self.use_cdp or not hasattr(driver, "execute_cdp_cmd"):
+            return {}
+        from selenium.common.exceptions import WebDriverException
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            response = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except WebDriverException:
+            self.use_cdp = False
+            return {}
+        return {item["name"]: item["value"] for item in response.get("metrics", ()) if item["name"] in CDP_METRICS}
+
+    def check_budgets(self, path, metrics):
+        violations = []
+        for pattern, limits in self.budgets:
+            if not fnmatch.fnmatchcase(path, pattern):
+                continue
+            for metric, limit in limits.items():
+                value = metrics.get(metric)
+                if value is not None and value > limit:
+                    violations.append(f"{metric} {value:.0f} > {limit:.0f}")
+        return violations
+
+    def _attach(self, record):
+        import allure
+        lines = [f"{record['action']} {record['url']}"]
+        lines += [f"{metric}: {record['metrics'][metric]:.0f}" for metric in METRICS if metric in record["metrics"]]
+        lines += [f"cdp.{name}: {value:g}" for name, value in record.get("cdp", {}).items()]
+        lines += [f"BUDGET: {violation}" for violation in record["violations"]]
+        allure.attach("\n".join(lines), name="Navigation metrics", attachment_type=allure.attachment_type.TEXT)
+
+    def summary(self):
+        """Path-onkénti medián metrikák: {path: {"count": n, metrika: medián}}"""
+        grouped = {}
+        for record in self.records:
+            grouped.setdefault(record["path"], []).append(record["metrics"])
+        result = {}
+        for path, entries in grouped.items():
+            row = {"count": len(entries)}
+            for metric in METRICS:
+                values = [entry[metric] for entry in entries if metric in entry]
+                if values:
+                    row[metric] = statistics.median(values)
+            result[path] = row
+        return result
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"navigations": self.records, "summary": self.summary()}, file, indent=2)
+
+
+_collector = None
+
+
+def active_collector():
+    """Az aktív gyűjtő (--nav-metrics), vagy None"""
+    return _collector
+
+
+def set_active_collector(collector):
+    global _collector
+    _collector = collector
+
+
+def record_navigation(driver, action="navigate"):
+    """Page objectekből hívva navigáció után - no-op, ha a gyűjtés nincs bekapcsolva"""
+    if _collector is not None:
+        _collector.collect(driver, action)
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--nav-metrics",
+        action="store_true",
+        default=False,
+        help="Collect Navigation/Paint Timing (and CDP) metrics after every page-object navigation"
+    )
+    parser.addoption(
+        "--nav-metrics-file",
+        action="store",
+        default=DEFAULT_METRICS_PATH,
+        help="Session JSON for navigation metrics"
+    )
+    parser.addoption(
+        "--nav-budget",
+        action="append",
+        default=[],
+        metavar="PATTERN:METRIC=MS[,METRIC=MS]",
+        help="Per-URL-path navigation budget, e.g. '/login:dom_content_loaded=800' (repeatable)"
+    )
+    parser.addoption(
+        "--nav-budget-file",
+        action="store",
+        default=None,
+        help="JSON file with navigation budgets: {\"/login\": {\"dom_content_loaded\": 800}}"
+    )
+    parser.addoption(
+        "--nav-budget-mode",
+        action="store",
+        default="warn",
+        choices=("warn", "fail"),
+        help="Budget violations warn (default) or fail the test"
+    )
+
+
+class NavigationMetricsPlugin:
+
+    def __init__(self, collector, path):
+        self.collector = collector
+        self.path = path
+
+    def pytest_runtest_setup(self, item):
+        self.collector.current_test = item.nodeid
+
+    def pytest_sessionfinish(self, session):
+        if self.collector.records:
+            self.collector.save(self.path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.collector.summary()
+        if not summary:
+            return
+        terminalreporter.section("Navigation metrics (median ms)")
+        terminalreporter.write_line(f"{'count':>5}  {'ttfb':>6}  {'dcl':>6}  {'load':>6}  {'fcp':>6}  path")
+        for path, row in sorted(summary.items()):
+            cells = [row.get(metric) for metric in ("ttfb", "dom_content_loaded", "load", "first_contentful_paint")]
+            formatted = "  ".join(f"{value:6.0f}" if value is not None else f"{'-':>6}" for value in cells)
+            terminalreporter.write_line(f"{row['count']:5d}  {formatted}  {path}")
+        violations = sum(1 for record in self.collector.records if record["violations"])
+        if violations:
+            terminalreporter.write_line(f"{violations} navigation(s) over budget - see {self.path}")
+
+    def pytest_unconfigure(self, config):
+        set_active_collector(None)
+
+
+def pytest_configure(config):
+    if not config.getoption("--nav-metrics"):
+        return
+    budgets = load_budgets(config.getoption("--nav-budget"), config.getoption("--nav-budget-file"))
+    collector = NavigationMetricsCollector(budgets, mode=config.getoption("--nav-budget-mode"))
+    set_active_collector(collector)
+    config.pluginmanager.register(
+        NavigationMetricsPlugin(collector, config.getoption("--nav-metrics-file")), "nav_metrics"
+    )
@@ -0,0 +1,284 @@
+"""
+pairwise.py - Kombinatorikus (pairwise / n-wise) adatvezérelt teszt generálás
+
+A teszt adat (faktorok és értékeik) folyamként olvasódik CSV, JSON tömb vagy JSON lines
+fájlból, a teljes fájl memóriába töltése nélkül. A teljes Descartes-szorzat helyett egy
+rögzített seed-ű, mohó (AETG-szerű) lefedő halmaz készül: minden faktor pár (n-wise esetén
+n-es) minden érték kombinációja legalább egy esetben szerepel, így a böngészős futások
+száma a szorzat töredéke. A terminál összegzés tesztenként mutatja a csökkenést.
+
+Adat formátum (soronként / objektumonként egy érték):
+    factor,label,value,repeat
+    username,valid,tomsmith,
+    username,long,a,256
+
+Használat:
+    @pytest.mark.pairwise("login_inputs.csv")               # test_data/ alatt, strength=2
+    def test_login(login_page, username, password, submit): ...
+
+    pytest --pairwise-strength=3 --pairwise-seed=7
+"""
+
+import csv
+import itertools
+import json
+import math
+import os
+import random
+
+import pytest
+
+
+DEFAULT_SEED = 0
+DEFAULT_CANDIDATES = 20
+CHUNK_SIZE = 64 * 1024
+
+
+# ===== FOLYAM OLVASÁS =====
+
+def iter_json_records(path, chunk_size=CHUNK_SIZE):
+    """
+    JSON objektumok egyenként, darabos olvasással (raw_decode)
+    Top-level tömb, JSON lines és egymás után fűzött objektumok is működnek
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    with open(path, "r", encoding="utf-8") as file:
+        while True:
+            # Elválasztók: whitespace, a tömb zárójelei és a vesszők
+            buffer = buffer.lstrip(" \t\r\n[],")
+            if not buffer:
+                if eof:
+                    return
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                value, end = None, None
+            # A puffer végén álló érték (pl. szám) még folytatódhat a következő darabban
+            if end is None or (end == len(buffer) and not eof):
+                chunk = file.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield value
+            buffer = buffer[end:]
+
+
+def iter_csv_records(path):
+    """CSV sorok dict-ként, soronként olvasva"""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        yield from csv.DictReader(file)
+
+
+def iter_records(path):
+    """Rekordok a kiterjesztés szerinti folyam olvasóval (.csv, .json, .jsonl)"""
+    if path.endswith(".csv"):
+        return iter_csv_records(path)
+    if path.endswith((".json", ".jsonl")):
+        return iter_json_records(path)
+    raise ValueError(f"Nem támogatott teszt adat formátum: {path} (.csv, .json, .jsonl)")
+
+
+def load_factors(path):
+    """
+    Faktorok és értékeik a rekord folyamból
+    :return: {faktor: [(címke, érték), ...]} a fájlbeli sorrendben
+    """
+    factors = {}
+    for record in iter_records(path):
+        value = record.get("value", "")
+        repeat = record.get("repeat")
+        if repeat not in (None, ""):
+            value = value * int(repeat)
+        label = record.get("label") or str(len(factors.get(record["factor"], ())))
+        factors.setdefault(record["factor"], []).append((label, value))
+    return factors
+
+
+# ===== LEFEDŐ HALMAZ =====
+
+def full_product_size(factors):
+    return math.prod(len(values) for values in factors.values())
+
+
+def _tuples(sizes, strength):
+    """Az összes lefedendő (faktor indexek, érték indexek) n-es"""
+    for combo in itertools.combinations(range(len(sizes)), strength):
+        for values in itertools.product(*(range(sizes[index]) for index in combo)):
+            yield combo, values
+
+
+def covering_cases(factors, strength=2, seed=DEFAULT_SEED, candidates=DEFAULT_CANDIDATES):
+    """
+    Mohó n-wise lefedő halmaz (AETG-szerű): esetenként több jelöltből a legtöbb
+    új n-est lefedő marad. Azonos bemenet és seed mellett mindig ugyanaz az eredmény.
+    :return: [{faktor: (címke, érték)}, ...]
+    """
+    names = list(factors)
+    sizes = [len(factors[name]) for name in names]
+    if not names or 0 in sizes:
+        return []
+    if strength >= len(names):
+        rows = itertools.product(*(range(size) for size in sizes))
+    else:
+        rows = _greedy_rows(sizes, strength, random.Random(seed), candidates)
+    return [{name: factors[name][value] for name, value in zip(names, row)} for row in rows]
+
+
+def _greedy_rows(sizes, strength, rng, candidates):
+    count = len(sizes)
+    combos = list(itertools.combinations(range(count), strength))
+    combos_of = {index: [combo for combo in combos if index in combo] for index in range(count)}
+    uncovered = set(_tuples(sizes, strength))
+    rows = []
+    while uncovered:
+        pending = sorted(uncovered)
+        best_row, best_gain = None, -1
+        for _ in range(candidates):
+            row = [None] * count
+            # Egy még le nem fedett n-es rögzítése, a többi faktor véletlen sorrendben, mohón
+            combo, values = rng.choice(pending)
+            for index, value in zip(combo, values):
+                row[index] = value
+            free = [index for index in range(count) if row[index] is None]
+            rng.shuffle(free)
+            for index in free:
+                gains = []
+                for value in range(sizes[index]):
+                    row[index] = value
+                    gains.append(sum(
+                        1 for other in combos_of[index]
+                        if all(row[member] is not None for member in other)
+                        and (other, tuple(row[member] for member in other)) in uncovered
+                    ))
+                top = max(gains)
+                row[index] = rng.choice([value for value, gain in enumerate(gains) if gain == top])
+            gain = sum(1 for combo in combos if (combo, tuple(row[member] for member in combo)) in uncovered)
+            if gain > best_gain:
+                best_row, best_gain = row, gain
+        rows.append(tuple(best_row))
+        uncovered.difference_update((combo, tuple(best_row[member] for member in combo)) for combo in combos)
+    return rows
+
+
+def uncovered_tuples(factors, cases, strength=2):
+    """Ellenőrzéshez: a lefedő halmazból hiányzó n-esek (címkékkel)"""
+    names = list(factors)
+    seen = set()
+    for case in cases:
+        labels = [case[name][0] for name in names]
+        for combo in itertools.combinations(range(len(names)), strength):
+            seen.add(tuple((names[index], labels[index]) for index in combo))
+    missing = []
+    for combo in itertools.combinations(range(len(names)), strength):
+        for labels in itertools.product(*([label for label, _ in factors[names[index]]] for index in combo)):
+            key = tuple((names[index], label) for index, label in zip(combo, labels))
+            if key not in seen:
+                missing.append(key)
+    return missing
+
+
+def reduction(factors, cases, strength=2):
+    """Eset szám csökkenés a teljes szorzathoz képest"""
+    full = full_product_size(factors)
+    return {
+        "strength": strength,
+        "factors": len(factors),
+        "full": full,
+        "cases": len(cases),
+        "reduction": 1 - len(cases) / full if full else 0.0,
+    }
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--pairwise-strength",
+        action="store",
+        type=int,
+        default=None,
+        help="Override the combination strength of @pytest.mark.pairwise tests (2 = pairwise, 3 = 3-wise, ...)"
+    )
+    parser.addoption(
+        "--pairwise-seed",
+        action="store",
+        type=int,
+        default=DEFAULT_SEED,
+        help="Seed of the covering-set generator (same seed -> same cases)"
+    )
+
+
+def _resolve(config, source):
+    if os.path.isabs(source):
+        return source
+    return os.path.join(str(config.rootpath), "test_data", source)
+
+
+class PairwisePlugin:
+    """Pytest plugin - @pytest.mark.pairwise tesztek paraméterezése és a csökkenés összegzése"""
+
+    def __init__(self):
+        self.summaries = {}
+        self._factors = {}  # fájl útvonal -> faktorok (egy fájl több tesztnél is csak egyszer olvasódik)
+
+    def _load(self, path):
+        if path not in self._factors:
+            self._factors[path] = load_factors(path)
+        return self._factors[path]
+
+    def pytest_generate_tests(self, metafunc):
+        marker = metafunc.definition.get_closest_marker("pairwise")
+        if marker is None:
+            return
+        config = metafunc.config
+        nodeid = metafunc.definition.nodeid
+        # Hibás adat fájl: gyűjtési hiba ennél a tesztnél, a session többi része fut tovább
+        try:
+            factors = self._load(_resolve(config, marker.args[0]))
+        except (OSError, ValueError, KeyError) as error:
+            pytest.fail(f"{nodeid}: a {marker.args[0]} nem olvasható: {error}", pytrace=False)
+
+        selected = marker.kwargs.get("factors") or [name for name in factors if name in metafunc.fixturenames]
+        missing = [name for name in selected if name not in factors]
+        if missing or not selected:
+            pytest.fail(
+                f"{nodeid}: a {marker.args[0]} faktorai ({', '.join(factors)}) "
+                f"nem egyeznek a teszt paramétereivel (hiányzik: {', '.join(missing) or '-'})",
+                pytrace=False,
+            )
+        factors = {name: factors[name] for name in selected}
+
+        strength = config.getoption("--pairwise-strength") or marker.kwargs.get("strength", 2)
+        cases = covering_cases(factors, strength=strength, seed=config.getoption("--pairwise-seed"))
+        self.summaries[nodeid] = reduction(factors, cases, strength)
+        metafunc.parametrize(
+            selected,
+            [tuple(case[name][1] for name in selected) for case in cases],
+            ids=["-".join(case[name][0] for name in selected) for case in cases],
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.summaries:
+            return
+        terminalreporter.section("Pairwise data")
+        for nodeid, summary in self.summaries.items():
+            terminalreporter.write_line(
+                f"{summary['cases']} cases instead of {summary['full']} ({summary['reduction']:.0%} fewer, "
+                f"{summary['strength']}-wise over {summary['factors']} factors)  {nodeid}"
+            )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "pairwise(source, strength=2, factors=None): parametrize from a test_data file with an n-wise covering set"
+    )
+    config.pluginmanager.register(PairwisePlugin(), "pairwise")
@@ -0,0 +1,309 @@
+"""
+perf_history.py - Tesztenkénti teljesítmény-történet SQLite adatbázisban
+Minden teszthez rögzíti a setup/call/teardown időket, a driver indítási idejét,
+a WebDriver parancsok számát és a git reviziót.
+
+Használat:
+    pytest --perf-db=reports/perf_history.sqlite
+    python -m utils.perf_history slowest --limit 10
+    python -m utils.perf_history trending --runs 5
+    python -m utils.perf_history outliers
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+
+
+DEFAULT_DB_PATH = os.path.join("reports", "perf_history.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_revision TEXT
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT,
+    setup_s REAL,
+    call_s REAL,
+    teardown_s REAL,
+    driver_startup_s REAL,
+    command_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_test_results_nodeid ON test_results(nodeid, run_id);
+"""
+
+# Item stash kulcsok a driver fixture mérési adataihoz
+driver_startup_key = pytest.StashKey[float]()
+command_count_key = pytest.StashKey[int]()
+
+
+# ===== STORAGE =====
+
+class PerfHistory:
+    """
+    SQLite alapú teljesítmény-történet
+    Írás futásonként egyetlen tranzakcióban
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_run(self, records, git_revision=None, started_at=None):
+        """
+        Egy teljes futás mentése egyetlen tranzakcióban
+        :param records: dict-ek listája (nodeid, outcome, setup_s, call_s, ...)
+        :return: Az új futás azonosítója
+        """
+        started_at = started_at or datetime.now().isoformat(timespec="seconds")
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, git_revision) VALUES (?, ?)",
+                (started_at, git_revision)
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO test_results (run_id, nodeid, outcome, setup_s, call_s, teardown_s, "
+                "driver_startup_s, command_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        record["nodeid"],
+                        record.get("outcome"),
+                        record.get("setup_s"),
+                        record.get("call_s"),
+                        record.get("teardown_s"),
+                        record.get("driver_startup_s"),
+                        record.get("command_count"),
+                    )
+                    for record in records
+                ]
+            )
+        return run_id
+
+    def _history(self, runs):
+        """Tesztenkénti teljes időtartamok az utolsó N futásból, időrendben"""
+        rows = self.connection.execute(
+            "SELECT nodeid, run_id, COALESCE(setup_s, 0) + COALESCE(call_s, 0) + COALESCE(teardown_s, 0) "
+            "FROM test_results WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?) "
+            "ORDER BY nodeid, run_id",
+            (runs,)
+        ).fetchall()
+        history = {}
+        for nodeid, _run_id, total in rows:
+            history.setdefault(nodeid, []).append(total)
+        return history
+
+    # ===== QUERIES =====
+
+    def slowest(self, limit=10, runs=5):
+        """
+        A leglassabb tesztek az utolsó N futás mediánja alapján
+        :return: (nodeid, medián másodperc, futások száma) lista
+        """
+        ranked = [
+            (nodeid, statistics.median(durations), len(durations))
+            for nodeid, durations in self._history(runs).items()
+        ]
+        ranked.sort(key=lambda row: row[1], reverse=True)
+        return ranked[:limit]
+
+    def trending(self, runs=5, threshold=1.2):
+        """
+        Egyre lassuló tesztek
+        Az utolsó N futás második felének mediánját veti össze az első felével
+        :return: (nodeid, arány, időtartamok) lista, arány szerint csökkenően
+        """
+        slower = []
+        for nodeid, durations in self._history(runs).items():
+            if len(durations) < 3:
+                continue
+            half = len(durations) // 2
+            before = statistics.median(durations[:half])
+            after = statistics.median(durations[-half:])
+            if before <= 0:
+                continue
+            ratio = after / before
+            if ratio >= threshold:
+                slower.append((nodeid, ratio, durations))
+        slower.sort(key=lambda row: row[1], reverse=True)
+        return slower
+
+    def outliers(self, runs=20, z_threshold=3.5):
+        """
+        A legutóbbi futás kiugró értékei (robusztus z-score, medián + MAD alapján)
+        :return: (nodeid, legutóbbi idő, medián, z-score) lista
+        """
+        found = []
+        for nodeid, durations in self._history(runs).items():
+            if len(durations) < 4:
+                continue
+            latest, previous = durations[-1], durations[:-1]
+            median = statistics.median(previous)
+            mad = statistics.median(abs(value - median) for value in previous)
+            if mad == 0:
+                continue
+            z_score = 0.6745 * (latest - median) / mad
+            if abs(z_score) >= z_threshold:
+                found.append((nodeid, latest, median, z_score))
+        found.sort(key=lambda row: abs(row[3]), reverse=True)
+        return found
+
+    def historical_durations(self, runs=5):
+        """
+        Tesztenkénti medián időtartam - ütemezők (pl. párhuzamos szétosztás) számára
+        :return: {nodeid: másodperc}
+        """
+        return {
+            nodeid: statistics.median(durations)
+            for nodeid, durations in self._history(runs).items()
+        }
+
+
+def load_historical_durations(db_path=DEFAULT_DB_PATH, runs=5):
+    """Historikus időtartamok betöltése; üres dict, ha még nincs adatbázis"""
+    if not os.path.exists(db_path):
+        return {}
+    history = PerfHistory(db_path)
+    try:
+        return history.historical_durations(runs)
+    finally:
+        history.close()
+
+
+def current_git_revision():
+    """Aktuális git revízió (None, ha nem git repóban futunk)"""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-db",
+        action="store",
+        default=DEFAULT_DB_PATH,
+        help="SQLite file for per-test performance history"
+    )
+    parser.addoption(
+        "--no-perf-history",
+        action="store_true",
+        default=False,
+        help="Disable recording of per-test performance history"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--no-perf-history") or hasattr(config, "workerinput"):
+        return
+    config.pluginmanager.register(PerfRecorder(config.getoption("--perf-db")), "perf_recorder")
+
+
+class PerfRecorder:
+    """
+    Pytest plugin - memóriában gyűjti a mérési adatokat,
+    a session végén egy tranzakcióban írja az adatbázisba
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.records = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+
+        # Újrapróbálásnál (utils.smart_retry) az utolsó próbálkozás számít
+        if report.when == "setup":
+            self.records.pop(item.nodeid, None)
+        record = self.records.setdefault(item.nodeid, {"nodeid": item.nodeid, "outcome": "passed"})
+        record[f"{report.when}_s"] = report.duration
+
+        if report.failed:
+            record["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+
+        if report.when == "teardown":
+            record["driver_startup_s"] = item.stash.get(driver_startup_key, None)
+            record["command_count"] = item.stash.get(command_count_key, None)
+
+    def pytest_sessionfinish(self, session):
+        if not self.records:
+            return
+        history = PerfHistory(self.db_path)
+        try:
+            history.record_run(list(self.records.values()), git_revision=current_git_revision())
+        finally:
+            history.close()
+
+
+# ===== CLI =====
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.perf_history", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite history file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    slowest = commands.add_parser("slowest", help="Slowest tests by median duration")
+    slowest.add_argument("--limit", type=int, default=10)
+    slowest.add_argument("--runs", type=int, default=5)
+
+    trending = commands.add_parser("trending", help="Tests getting slower over the last N runs")
+    trending.add_argument("--runs", type=int, default=5)
+    trending.add_argument("--threshold", type=float, default=1.2)
+
+    outliers = commands.add_parser("outliers", help="Outliers in the latest run")
+    outliers.add_argument("--runs", type=int, default=20)
+    outliers.add_argument("--z", type=float, default=3.5)
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"Nincs teljesítmény-történet: {args.db}", file=sys.stderr)
+        return 1
+
+    history = PerfHistory(args.db)
+    try:
+        if args.command == "slowest":
+            for nodeid, median, count in history.slowest(args.limit, args.runs):
+                print(f"{median:8.3f}s  ({count} runs)  {nodeid}")
+        elif args.command == "trending":
+            for nodeid, ratio, durations in history.trending(args.runs, args.threshold):
+                series = " -> ".join(f"{value:.2f}" for value in durations)
+                print(f"x{ratio:5.2f}  {nodeid}  [{series}]")
+        elif args.command == "outliers":
+            for nodeid, latest, median, z_score in history.outliers(args.runs, args.z):
+                print(f"z={z_score:6.2f}  {latest:.3f}s (median {median:.3f}s)  {nodeid}")
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
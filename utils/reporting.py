@@ -0,0 +1,275 @@
+"""
+reporting.py - Allure riport részletesség (--report-level) és overhead mérés
+
+Szintek:
+    full    - minden page object lépés allure step, tesztenként környezeti paraméterek és csatolmányok
+    normal  - minden lépés allure step, a környezeti adatok egyszer, az environment.properties-be kerülnek
+    minimal - csak a legkülső page object lépés kerül a riportba; a beágyazott lépések memóriában
+              gyűlnek, és csak sikertelen teszt esetén íródnak ki (szöveges csatolmányként)
+
+Használat:
+    pytest --alluredir=reports/allure-results --report-level=minimal
+"""
+
+import functools
+import inspect
+import os
+import platform
+import threading
+import time
+from collections import deque
+
+import allure
+import allure_commons
+import pytest
+
+
+REPORT_LEVELS = ("minimal", "normal", "full")
+DEFAULT_REPORT_LEVEL = "full"
+
+# Egy tesztben legfeljebb ennyi beágyazott lépés marad meg (a legrégebbiek esnek ki)
+MAX_BUFFERED_STEPS = 2000
+
+_report_level = DEFAULT_REPORT_LEVEL
+
+
+def set_report_level(level):
+    global _report_level
+    if level not in REPORT_LEVELS:
+        raise ValueError(f"Ismeretlen report level: {level}")
+    _report_level = level
+
+
+def report_level():
+    return _report_level
+
+
+def per_test_metadata():
+    """Tesztenként csatoljuk-e a környezeti adatokat (csak full szinten)"""
+    return _report_level == "full"
+
+
+# ===== LÉPÉSEK =====
+
+class BufferedStep:
+    """Egy memóriában tartott beágyazott lépés - a cím csak kiíráskor formázódik"""
+
+    __slots__ = ("title", "func", "args", "kwargs", "depth", "duration", "error")
+
+    def __init__(self, title, func, args, kwargs, depth):
+        self.title = title
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.depth = depth
+        self.duration = 0.0
+        self.error = None
+
+    def format_title(self):
+        try:
+            bound = inspect.signature(self.func).bind(*self.args, **self.kwargs)
+            bound.apply_defaults()
+            return self.title.format(**bound.arguments)
+        except (TypeError, KeyError, IndexError, ValueError):
+            return self.title
+
+    def format(self):
+        status = f"FAILED ({self.error})" if self.error else "ok"
+        return f"{'  ' * (self.depth - 1)}{self.duration * 1000:7.1f}ms  {self.format_title()}  [{status}]"
+
+
+class _StepState(threading.local):
+
+    def __init__(self):
+        self.depth = 0
+        self.buffer = deque(maxlen=MAX_BUFFERED_STEPS)
+
+
+_state = _StepState()
+
+
+def reset_step_buffer():
+    _state.depth = 0
+    _state.buffer.clear()
+
+
+def buffered_steps():
+    return list(_state.buffer)
+
+
+def step(title):
+    """
+    allure.step megfelelője page objectekhez, a --report-level szerint
+    minimal szinten a beágyazott hívások nem mennek az allure-ba (formázás és I/O nélkül)
+    """
+    def decorator(func):
+        allure_step = allure.step(title)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            __tracebackhide__ = True
+            if _report_level != "minimal":
+                return allure_step(*args, **kwargs)
+
+            if _state.depth == 0:
+                _state.depth = 1
+                try:
+                    return allure_step(*args, **kwargs)
+                finally:
+                    _state.depth = 0
+
+            entry = BufferedStep(title, func, args, kwargs, _state.depth)
+            _state.buffer.append(entry)
+            _state.depth += 1
+            begin = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except BaseException as error:
+                entry.error = type(error).__name__
+                raise
+            finally:
+                entry.duration = time.perf_counter() - begin
+                _state.depth -= 1
+
+        return wrapper
+    return decorator
+
+
+# ===== KÖRNYEZET =====
+
+def environment_properties(config):
+    """Session szintű környezeti adatok (allure environment.properties)"""
+    import selenium
+    return {
+        "Browser": config.getoption("--browser"),
+        "Headless": config.getoption("--headless"),
+        "Backend": config.getoption("--backend"),
+        "Base.URL": config.getoption("--base-url"),
+        "Report.Level": _report_level,
+        "Python": platform.python_version(),
+        "Selenium": selenium.__version__,
+        "Platform": platform.platform(),
+    }
+
+
+def write_environment(report_dir, properties):
+    os.makedirs(report_dir, exist_ok=True)
+    lines = []
+    for key, value in properties.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"{key}={value}")
+    path = os.path.join(report_dir, "environment.properties")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return path
+
+
+# ===== OVERHEAD MÉRÉS =====
+
+class ReporterTimer:
+    """
+    allure_commons plugin - az allure hookokban (lépések, csatolmányok, eredmény írás) töltött idő
+    Egymásba ágyazott hook hívásokat csak egyszer számol
+    """
+
+    HOOKS = (
+        "start_step", "stop_step", "attach_data", "attach_file", "add_parameter",
+        "start_fixture", "stop_fixture", "start_test", "stop_test",
+        "report_result", "report_container", "report_attached_file", "report_attached_data",
+    )
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self._depth = 0
+
+
+def _timed_hook():
+    @allure_commons.hookimpl(hookwrapper=True)
+    def hook(self):
+        self._depth += 1
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.seconds += time.perf_counter() - begin
+                self.calls += 1
+    return hook
+
+
+for _hook_name in ReporterTimer.HOOKS:
+    setattr(ReporterTimer, _hook_name, _timed_hook())
+
+
+def _count_files(directory):
+    if not directory or not os.path.isdir(directory):
+        return 0
+    return sum(len(files) for _, _, files in os.walk(directory))
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--report-level",
+        action="store",
+        default=DEFAULT_REPORT_LEVEL,
+        choices=REPORT_LEVELS,
+        help="Allure detail: minimal (top-level steps, nested ones only on failure), normal, full"
+    )
+
+
+class ReportingPlugin:
+    """Környezeti adatok kiírása, beágyazott lépések ürítése hibánál, overhead összesítő"""
+
+    def __init__(self, config):
+        self.config = config
+        self.report_dir = getattr(config.option, "allure_report_dir", None)
+        self.timer = ReporterTimer()
+        self.files_before = 0
+        self.session = None
+
+    def pytest_sessionstart(self, session):
+        self.session = session
+        if not self.report_dir or self.config.option.collectonly:
+            return
+        allure_commons.plugin_manager.register(self.timer, "reporter_timer")
+        self.files_before = _count_files(self.report_dir)
+        write_environment(self.report_dir, environment_properties(self.config))
+
+    def pytest_runtest_setup(self, item):
+        reset_step_buffer()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed and _state.buffer:
+            allure.attach(
+                "\n".join(entry.format() for entry in _state.buffer),
+                name="Buffered steps",
+                attachment_type=allure.attachment_type.TEXT
+            )
+            _state.buffer.clear()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.report_dir or self.config.option.collectonly:
+            return
+        tests = max(self.session.testscollected, 1)
+        files = _count_files(self.report_dir) - self.files_before
+        terminalreporter.section("Allure reporter")
+        terminalreporter.write_line(
+            f"level={_report_level}  result files: {files} ({files / tests:.1f} per test)  "
+            f"reporter time: {self.timer.seconds * 1000:.1f} ms in {self.timer.calls} hook calls"
+        )
+
+    def pytest_unconfigure(self, config):
+        if allure_commons.plugin_manager.is_registered(self.timer):
+            allure_commons.plugin_manager.unregister(self.timer)
+
+
+def pytest_configure(config):
+    set_report_level(config.getoption("--report-level"))
+    config.pluginmanager.register(ReportingPlugin(config), "reporting")
@@ -0,0 +1,561 @@
+"""
+site_proxy.py - Beágyazott, cache-elő HTTP proxy a tesztelt oldal forgalmához
+
+Minden friss böngésző újra letölti az oldalakat és a statikus erőforrásokat. A session fixture
+egy helyi proxyt indít, amelyet a Chrome / Firefox setup beállít; a válaszok egy lemezen tárolt,
+tartalom-címzett (sha256) cache-be kerülnek méret korláttal és LRU kiürítéssel.
+
+Módok:
+    cache   - találat a cache-ből, hiány esetén továbbítás és (cache-elhető válasznál) tárolás
+    record  - minden kérés továbbítódik és tárolódik (a cache felépítése, POST-okkal együtt)
+    offline - csak a cache-ből szolgál ki, hiány esetén 504 (hálózat nélküli, ismételhető futás)
+
+HTTPS forgalom forward proxyn csak CONNECT tunnelként megy át (TLS bontás nélkül nem cache-elhető).
+A --site-proxy-gateway a --base-url originjét a proxy sima HTTP címére irányítja át
+(a driver navigációs URL-jei és a redirect Location fejlécek átíródnak), így az is cache-elődik.
+
+Használat:
+    pytest --site-proxy=record --site-proxy-gateway
+    pytest --site-proxy=offline --site-proxy-gateway
+    pytest --site-proxy=cache --site-cache-size=100
+"""
+
+import functools
+import hashlib
+import http.client
+import json
+import os
+import select
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+
+PROXY_MODES = ("off", "cache", "record", "offline")
+DEFAULT_CACHE_DIR = os.path.join(".cache", "site_proxy")
+DEFAULT_CACHE_SIZE_MB = 200
+
+# Válasz státuszok, amelyek cache módban tárolhatók (RFC 9111 alapértelmezetten cache-elhetők)
+CACHEABLE_STATUSES = frozenset((200, 203, 204, 300, 301, 308, 404, 410))
+
+# Hop-by-hop fejlécek - nem továbbítódnak és nem tárolódnak
+HOP_BY_HOP = frozenset((
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailer", "transfer-encoding", "upgrade", "content-length",
+))
+
+# Lezárt keep-alive kapcsolat esetén csak ezek küldhetők újra (RFC 9110 9.2.2) - egy POST nem ismétlődhet
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_used ON entries(last_used);
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+"""
+
+
+# ===== CACHE =====
+
+class CachedResponse:
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+
+class ContentCache:
+    """
+    Lemezen tárolt, tartalom-címzett válasz cache
+    Az index (kérés kulcs -> státusz, fejlécek, tartalom hash) SQLite-ban, a tartalmak
+    objects/<hash[:2]>/<hash> fájlokban; azonos tartalom csak egyszer tárolódik.
+    A méret korlát az egyedi tartalmakra vonatkozik, túllépéskor a legrégebben használt bejegyzések törlődnek.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(directory, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        import sqlite3  # a plugin betöltése (gyűjtés) ne húzza be
+        self.connection = sqlite3.connect(os.path.join(directory, "index.sqlite"), check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    @staticmethod
+    def key(method, url, body=b""):
+        """Kérés kulcs: metódus + URL (+ a törzs hash-e); a HEAD a GET bejegyzést használja"""
+        method = "GET" if method == "HEAD" else method
+        body_digest = hashlib.sha256(body).hexdigest() if body else ""
+        return hashlib.sha256(f"{method}\n{url}\n{body_digest}".encode()).hexdigest()
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def get(self, key):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT status, reason, headers, digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            status, reason, headers, digest = row
+            try:
+                with open(self._object_path(digest), "rb") as file:
+                    body = file.read()
+            except FileNotFoundError:  # kézzel törölt objektum - a bejegyzés is érvénytelen
+                with self.connection:
+                    self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            with self.connection:
+                self.connection.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(status, reason, [tuple(pair) for pair in json.loads(headers)], body)
+
+    def put(self, key, method, url, status, reason, headers, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f"{path}.{threading.get_ident()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(body)
+            os.replace(temporary, path)
+        now = time.time()
+        with self._lock:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, method, url, status, reason, headers, digest, size, "
+                    "stored_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, method, url, status, reason, json.dumps(headers), digest, len(body), now, now)
+                )
+                self._evict()
+
+    def _total_bytes(self):
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()[0]
+
+    def _evict(self):
+        """LRU kiürítés, amíg az egyedi tartalmak mérete a korlát fölött van (a zárat a hívó tartja)"""
+        total = self._total_bytes()
+        while total > self.max_bytes:
+            row = self.connection.execute(
+                "SELECT key, digest, size FROM entries ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            key, digest, size = row
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            still_used = self.connection.execute(
+                "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if still_used is None:
+                try:
+                    os.remove(self._object_path(digest))
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def stats(self):
+        with self._lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            return {"entries": entries, "bytes": self._total_bytes(), "max_bytes": self.max_bytes}
+
+
+# ===== STATISZTIKA =====
+
+class ProxyStats:
+    """Session szintű számlálók (a proxy leállítása után is olvashatók a terminál összesítőhöz)"""
+
+    FIELDS = ("hits", "misses", "stored", "bypassed", "offline_misses", "tunnels", "errors")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+        self.bytes_from_cache = 0
+        self.upstream_seconds = 0.0
+
+    def add(self, field, amount=1):
+        with self._lock:
+            self.counts[field] += amount
+
+    def served_from_cache(self, size):
+        with self._lock:
+            self.counts["hits"] += 1
+            self.bytes_from_cache += size
+
+    def upstream(self, seconds):
+        with self._lock:
+            self.upstream_seconds += seconds
+
+    @property
+    def hit_ratio(self):
+        lookups = self.counts["hits"] + self.counts["misses"] + self.counts["offline_misses"]
+        return self.counts["hits"] / lookups if lookups else 0.0
+
+
+# ===== PROXY =====
+
+@functools.cache
+def _proxy_handler():
+    """A http.server csak az első proxy indításakor töltődik be, a plugin importjakor nem"""
+    from http.server import BaseHTTPRequestHandler
+
+    class _ProxyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # a pytest kimenet tiszta marad
+            pass
+
+        def do_CONNECT(self):
+            self.server.proxy.tunnel(self)
+
+        def do_GET(self):
+            self.server.proxy.handle(self)
+
+        do_HEAD = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = do_GET
+
+    return _ProxyHandler
+
+
+class CachingProxy:
+    """
+    Forward proxy (abszolút URL-es kérések, CONNECT tunnel) és opcionálisan gateway
+    a megadott upstream originhez (relatív útvonalú kérések -> upstream + útvonal)
+    """
+
+    def __init__(self, cache, mode="cache", upstream=None, host="127.0.0.1", port=0, timeout=30, stats=None):
+        if mode not in PROXY_MODES[1:]:
+            raise ValueError(f"Ismeretlen proxy mód: {mode}")
+        self.cache = cache
+        self.mode = mode
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.timeout = timeout
+        self.stats = stats if stats is not None else ProxyStats()
+        from http.server import ThreadingHTTPServer
+        self._server = ThreadingHTTPServer((host, port), _proxy_handler())
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self._thread = None
+        self._connections = threading.local()
+
+    @property
+    def address(self):
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def origin(self):
+        return f"http://{self.address}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, name="site-proxy", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    # ----- kérés kezelés -----
+
+    def _target(self, path):
+        if path.startswith(("http://", "https://")):
+            return path
+        if self.upstream is None:
+            return None
+        return self.upstream + path
+
+    def _storable(self, method, request_headers, status, headers):
+        """Cache módban csak a megosztható GET/HEAD válaszok tárolódnak; record módban minden"""
+        if self.mode == "record":
+            return True
+        if method not in ("GET", "HEAD") or status not in CACHEABLE_STATUSES:
+            return False
+        if "authorization" in request_headers:
+            return False
+        names = {name.lower(): value for name, value in headers}
+        cache_control = names.get("cache-control", "").lower()
+        return "set-cookie" not in names and "no-store" not in cache_control and "private" not in cache_control
+
+    def handle(self, handler):
+        method = handler.command
+        url = self._target(handler.path)
+        if url is None:
+            self._respond(handler, 400, "Bad Request", [], b"Abszolut URL vagy gateway upstream szukseges")
+            return
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        request_headers = {name.lower(): value for name, value in handler.headers.items()}
+        key = self.cache.key(method, url, body)
+
+        lookup = self.mode == "offline" or (self.mode == "cache" and method in ("GET", "HEAD"))
+        if lookup:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.served_from_cache(len(cached.body))
+                self._respond(handler, cached.status, cached.reason, cached.headers, cached.body)
+                return
+            if self.mode == "offline":
+                self.stats.add("offline_misses")
+                self._respond(handler, 504, "Gateway Timeout", [], f"Offline: nincs a cache-ben: {method} {url}".encode())
+                return
+            self.stats.add("misses")
+        else:
+            self.stats.add("bypassed" if self.mode == "cache" else "misses")
+
+        # A HEAD a GET bejegyzését használja: a hiány GET-ként megy tovább, hogy a valódi törzs tárolódjon
+        # (a kliens HEAD válaszként csak a fejléceket kapja meg)
+        upstream_method = "GET" if method == "HEAD" else method
+        try:
+            status, reason, headers, response_body = self._forward(upstream_method, url, handler.headers, body)
+        except (OSError, http.client.HTTPException) as error:
+            self.stats.add("errors")
+            self._respond(handler, 502, "Bad Gateway", [], f"Upstream hiba: {error}".encode())
+            return
+        if self._storable(method, request_headers, status, headers):
+            self.cache.put(key, upstream_method, url, status, reason, headers, response_body)
+            self.stats.add("stored")
+        self._respond(handler, status, reason, headers, response_body)
+
+    def _connection(self, scheme, netloc):
+        """Szálanként és originenként egy újrahasznosított upstream kapcsolat"""
+        pool = getattr(self._connections, "pool", None)
+        if pool is None:
+            pool = self._connections.pool = {}
+        connection = pool.get((scheme, netloc))
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = pool[(scheme, netloc)] = factory(netloc, timeout=self.timeout)
+        return connection
+
+    def _forward(self, method, url, request_headers, body):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {
+            name: value for name, value in request_headers.items()
+            if name.lower() not in HOP_BY_HOP and name.lower() != "host"
+        }
+        headers["Host"] = parts.netloc
+        if body:
+            headers["Content-Length"] = str(len(body))
+
+        begin = time.perf_counter()
+        for attempt in (1, 2):
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request(method, path, body=body or None, headers=headers)
+                response = connection.getresponse()
+                response_body = response.read()
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                connection.close()  # lezárt keep-alive kapcsolat - egy újrapróbálás friss kapcsolattal
+                if attempt == 2 or method not in IDEMPOTENT_METHODS:
+                    raise
+        self.stats.upstream(time.perf_counter() - begin)
+
+        response_headers = [
+            (name, value) for name, value in response.getheaders() if name.lower() not in HOP_BY_HOP
+        ]
+        return response.status, response.reason, response_headers, response_body
+
+    def _rewrite_location(self, value):
+        """Gateway módban az upstream originre mutató redirect a proxyn marad"""
+        if self.upstream and value.startswith(self.upstream):
+            return self.origin + value[len(self.upstream):]
+        return value
+
+    def _respond(self, handler, status, reason, headers, body):
+        """A cache az upstream fejléceit tárolja - a Location átírás a mindenkori originre itt történik"""
+        handler.send_response(status, reason)
+        for name, value in headers:
+            if name.lower() == "location":
+                value = self._rewrite_location(value)
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(body)
+
+    def tunnel(self, handler):
+        """HTTPS CONNECT: bájt szintű továbbítás (cache nélkül); offline módban elutasítva"""
+        if self.mode == "offline":
+            self.stats.add("offline_misses")
+            self._respond(handler, 502, "Offline", [], b"Offline: HTTPS tunnel nem engedelyezett")
+            return
+        host, _, port = handler.path.rpartition(":")
+        try:
+            upstream = socket.create_connection((host, int(port or 443)), timeout=self.timeout)
+        except OSError as error:
+            self.stats.add("errors")
+            self._respond(handler, 502, "Bad Gateway", [], f"Tunnel hiba: {error}".encode())
+            return
+        self.stats.add("tunnels")
+        handler.send_response(200, "Connection Established")
+        handler.end_headers()
+        client = handler.connection
+        sockets = [client, upstream]
+        try:
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, self.timeout)
+                if errored or not readable:
+                    break
+                for source in readable:
+                    data = source.recv(65536)
+                    if not data:
+                        return
+                    (upstream if source is client else client).sendall(data)
+        except OSError:
+            pass
+        finally:
+            upstream.close()
+            handler.close_connection = True
+
+    # ----- böngésző beállítás -----
+
+    # A böngészők a loopback címet proxy nélkül érik el, így gateway módban a proxy origin
+    # közvetlenül, minden más (pl. külső statikus erőforrás) forward proxyként megy át rajta
+
+    def configure_chrome(self, options):
+        options.add_argument(f"--proxy-server=http://{self.address}")
+        return options
+
+    def configure_firefox(self, options):
+        host, port = self.address.rsplit(":", 1)
+        options.set_preference("network.proxy.type", 1)
+        for scheme in ("http", "ssl"):
+            options.set_preference(f"network.proxy.{scheme}", host)
+            options.set_preference(f"network.proxy.{scheme}_port", int(port))
+        return options
+
+    def route(self, driver):
+        """
+        Gateway módban a driver navigációi az upstream helyett a proxyra mennek,
+        a getCurrentUrl pedig az upstream URL-t adja vissza (a tesztek URL ellenőrzései változatlanok)
+        """
+        if self.upstream is None:
+            return driver
+        original_execute = driver.execute
+        upstream, origin = self.upstream, self.origin
+
+        def execute(driver_command, params=None):
+            if driver_command == "get" and params and params.get("url", "").startswith(upstream):
+                params = dict(params, url=origin + params["url"][len(upstream):])
+            response = original_execute(driver_command, params)
+            if driver_command == "getCurrentUrl" and response and isinstance(response.get("value"), str):
+                value = response["value"]
+                if value.startswith(origin):
+                    response["value"] = upstream + value[len(origin):]
+            return response
+
+        driver.execute = execute
+        return driver
+
+
+# ===== PYTEST PLUGIN =====
+
+proxy_stats_key = pytest.StashKey[ProxyStats]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--site-proxy",
+        action="store",
+        default="off",
+        choices=PROXY_MODES,
+        help="Caching HTTP proxy for site traffic: cache, record (build the cache) or offline (cache only)"
+    )
+    parser.addoption(
+        "--site-proxy-gateway",
+        action="store_true",
+        default=False,
+        help="Route the --base-url origin through the proxy as plain HTTP so HTTPS pages are cached too"
+    )
+    parser.addoption(
+        "--site-cache-dir",
+        action="store",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of the content-addressed response cache"
+    )
+    parser.addoption(
+        "--site-cache-size",
+        action="store",
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        help="Response cache size cap in MB (least recently used entries are evicted)"
+    )
+
+
+def start_session_proxy(config):
+    """A site_proxy session fixture-ből hívva - None, ha a proxy nincs bekapcsolva"""
+    mode = config.getoption("--site-proxy")
+    if mode == "off":
+        return None
+    cache = ContentCache(config.getoption("--site-cache-dir"), config.getoption("--site-cache-size") * 1024 * 1024)
+    upstream = config.getoption("--base-url") if config.getoption("--site-proxy-gateway") else None
+    return CachingProxy(cache, mode=mode, upstream=upstream, stats=config.stash[proxy_stats_key]).start()
+
+
+def stop_session_proxy(proxy):
+    proxy.stop()
+    proxy.cache.close()
+
+
+class SiteProxyReporter:
+
+    def __init__(self, stats, mode, cache_dir):
+        self.stats = stats
+        self.mode = mode
+        self.cache_dir = cache_dir
+
+    def pytest_terminal_summary(self, terminalreporter):
+        counts = self.stats.counts
+        if not any(counts.values()):
+            return
+        terminalreporter.section(f"Site proxy ({self.mode})")
+        terminalreporter.write_line(
+            f"hits: {counts['hits']}  misses: {counts['misses']}  offline misses: {counts['offline_misses']}  "
+            f"hit ratio: {self.stats.hit_ratio:.0%}  stored: {counts['stored']}  "
+            f"uncacheable: {counts['bypassed']}  https tunnels: {counts['tunnels']}  errors: {counts['errors']}"
+        )
+        terminalreporter.write_line(
+            f"served from cache: {self.stats.bytes_from_cache / 1024:.1f} KiB  "
+            f"upstream time: {self.stats.upstream_seconds:.2f}s  cache: {self.cache_dir}"
+        )
+        if counts["tunnels"] and not counts["hits"] + counts["misses"]:
+            terminalreporter.write_line("HTTPS traffic is tunnelled uncached - use --site-proxy-gateway to cache it")
+
+
+def pytest_configure(config):
+    mode = config.getoption("--site-proxy")
+    if mode == "off":
+        return
+    stats = config.stash[proxy_stats_key] = ProxyStats()
+    config.pluginmanager.register(
+        SiteProxyReporter(stats, mode, config.getoption("--site-cache-dir")), "site_proxy_reporter"
+    )
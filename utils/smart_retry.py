@@ -0,0 +1,307 @@
+"""
+smart_retry.py - Átmeneti (timing / kapcsolat) hibák újrapróbálása böngésző újraindítás nélkül
+
+Csak az átmenetinek minősített hibák (TimeoutException, StaleElementReferenceException,
+WebDriver kapcsolat hibák) próbálódnak újra, tesztenként legfeljebb --retries alkalommal.
+A session szintű --retry-budget (darab vagy a tesztek %-a) korlátozza az összes újrapróbálást,
+így egy elrontott build nem duplázza meg a futási időt.
+
+Újrapróbálás előtt a driver fixture nem zárja be a böngészőt: a következő próbálkozás
+ugyanazt kapja vissza alaphelyzetbe állítva (sütik törlése, about:blank); ha ez nem sikerül,
+új böngésző indul. Allure-ban egyetlen eredmény látszik, a korábbi próbálkozások lépésekként,
+sikeres újrapróbálás után "flaky" jelöléssel. Tesztenkénti statisztika: reports/retry_stats.json.
+
+Használat:
+    pytest --retries=2
+    pytest --retries=2 --retry-budget=5
+    pytest --retries=1 --retry-budget=20%
+"""
+
+import json
+import os
+import re
+import time
+
+import pytest
+from _pytest.runner import runtestprotocol
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from urllib3.exceptions import MaxRetryError, ProtocolError
+
+
+DEFAULT_STATS_PATH = os.path.join("reports", "retry_stats.json")
+DEFAULT_BUDGET = "10%"
+
+TRANSIENT_EXCEPTIONS = (
+    TimeoutException,
+    StaleElementReferenceException,
+    ConnectionError,
+    ProtocolError,
+    MaxRetryError,
+)
+
+# WebDriverException üzenetek, amelyek a böngésző / driver kapcsolat elvesztését jelzik
+_CONNECTION_LOST = re.compile(r"disconnected|not reachable|connection refused|session deleted|invalid session id", re.IGNORECASE)
+
+# Item stash kulcsok
+attempts_key = pytest.StashKey[list]()
+retry_pending_key = pytest.StashKey[bool]()
+_exception_key = pytest.StashKey[str]()
+
+
+def is_transient(exception):
+    """Átmeneti-e a hiba (a kivétel láncot is végignézi: __cause__ / __context__)"""
+    seen = set()
+    while exception is not None and id(exception) not in seen:
+        seen.add(id(exception))
+        if isinstance(exception, TRANSIENT_EXCEPTIONS):
+            return True
+        if isinstance(exception, WebDriverException) and _CONNECTION_LOST.search(exception.msg or ""):
+            return True
+        exception = exception.__cause__ or exception.__context__
+    return False
+
+
+def parse_budget(value, test_count):
+    """"5" -> 5, "10%" -> a tesztek 10%-a (legalább 1)"""
+    value = str(value).strip()
+    if value.endswith("%"):
+        return max(1, int(test_count * float(value[:-1]) / 100))
+    return int(value)
+
+
+def reset_driver(driver):
+    """A böngésző alaphelyzetbe állítása a következő próbálkozáshoz"""
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+    return driver
+
+
+# ===== BÖNGÉSZŐ ÚJRAHASZNOSÍTÁS (a driver fixture-ből hívva) =====
+
+_plugin = None
+
+
+def park_driver(request, driver):
+    """
+    Driver fixture teardown: ha a teszt újra fog futni, a böngésző megmarad
+    :return: True, ha a drivert nem kell bezárni
+    """
+    if _plugin is None or not request.node.stash.get(retry_pending_key, False):
+        return False
+    if request.config.getoption("--cassette-mode", "off") != "off":
+        return False  # a cassette executor csere miatt a felvétel tesztenként friss driverrel megy
+    _plugin.parked[request.node.nodeid] = driver
+    return True
+
+
+def reuse_driver(request):
+    """Driver fixture setup: az előző próbálkozás böngészője alaphelyzetben, vagy None"""
+    if _plugin is None:
+        return None
+    driver = _plugin.parked.pop(request.node.nodeid, None)
+    if driver is None:
+        return None
+    try:
+        reset_driver(driver)
+    except (WebDriverException, *TRANSIENT_EXCEPTIONS):
+        _quit_quietly(driver)
+        return None
+    _plugin.reused += 1
+    return driver
+
+
+def _quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception:  # a böngésző már nem elérhető
+        pass
+
+
+# ===== ALLURE =====
+
+def _allure_result(config):
+    listener = config.pluginmanager.get_plugin("allure_listener")
+    return listener.allure_logger.get_test(None) if listener is not None else None
+
+
+def _fold_attempt(config, item, attempt, exception_name):
+    """Az eddigi (sikertelen) próbálkozás lépései és csatolmányai egy "Attempt N" lépésbe kerülnek"""
+    result = _allure_result(config)
+    if result is None:
+        return
+    from allure_commons.model2 import TestStepResult
+
+    folded_steps, folded_attachments = item.stash.get(_folded_key, (0, 0))
+    step = TestStepResult(
+        name=f"Attempt {attempt}: {exception_name}",
+        status=result.status,
+        statusDetails=result.statusDetails,
+        steps=result.steps[folded_steps:],
+        attachments=result.attachments[folded_attachments:],
+        start=result.start,
+        stop=result.stop,
+    )
+    result.steps = result.steps[:folded_steps] + [step]
+    result.attachments = result.attachments[:folded_attachments]
+    item.stash[_folded_key] = (len(result.steps), len(result.attachments))
+
+
+def _finish_allure(config, attempts):
+    """Egy eredmény: ismétlődő címkék / linkek / paraméterek nélkül, a próbálkozások számával"""
+    result = _allure_result(config)
+    if result is None or len(attempts) < 2:
+        return
+    from allure_commons.model2 import Parameter, StatusDetails
+
+    def unique(items, key):
+        seen = set()
+        return [entry for entry in items if not (key(entry) in seen or seen.add(key(entry)))]
+
+    result.labels = unique(result.labels, lambda label: (label.name, label.value))
+    result.links = unique(result.links, lambda link: (link.type, link.url))
+    result.parameters = unique(result.parameters, lambda parameter: parameter.name)
+    # A historyId a teardown-ban már kiszámolódott - az excluded paraméter nem is számítana bele
+    result.parameters.append(Parameter(name="Attempts", value=str(len(attempts)), excluded=True))
+    if attempts[-1]["outcome"] == "passed":
+        result.statusDetails = StatusDetails(
+            flaky=True, message=f"Passed after {len(attempts)} attempts ({attempts[0]['exception']})"
+        )
+
+
+_folded_key = pytest.StashKey[tuple]()
+
+
+# ===== PYTEST PLUGIN =====
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--retries",
+        action="store",
+        type=int,
+        default=0,
+        help="Retry tests failing with transient errors (timeouts, stale elements, lost connection) up to N times"
+    )
+    parser.addoption(
+        "--retry-budget",
+        action="store",
+        default=DEFAULT_BUDGET,
+        help="Max retries per session: a count or a percentage of collected tests (default 10%%)"
+    )
+    parser.addoption(
+        "--retry-stats-file",
+        action="store",
+        default=DEFAULT_STATS_PATH,
+        help="JSON file with per-test attempt statistics"
+    )
+
+
+class SmartRetryPlugin:
+
+    def __init__(self, max_retries, budget_spec, stats_path):
+        self.max_retries = max_retries
+        self.budget_spec = budget_spec
+        self.stats_path = stats_path
+        self.budget = None
+        self.used = 0
+        self.denied = 0
+        self.reused = 0
+        self.parked = {}
+        self.stats = {}
+
+    def pytest_collection_finish(self, session):
+        self.budget = parse_budget(self.budget_spec, len(session.items))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        report = (yield).get_result()
+        if call.when not in ("setup", "call") or not report.failed or item.stash.get(retry_pending_key, False):
+            return
+        exception = call.excinfo.value if call.excinfo else None
+        item.stash[_exception_key] = call.excinfo.typename if call.excinfo else "failed"
+        if not is_transient(exception) or len(item.stash.get(attempts_key, [])) >= self.max_retries:
+            return
+        if self.budget is not None and self.used >= self.budget:
+            self.denied += 1
+            return
+        self.used += 1
+        item.stash[retry_pending_key] = True
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        attempts = item.stash[attempts_key] = []
+        while True:
+            item.stash[retry_pending_key] = False
+            begin = time.perf_counter()
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            failed = any(report.failed for report in reports)
+            skipped = not failed and any(report.skipped for report in reports)
+            attempts.append({
+                "attempt": len(attempts) + 1,
+                "outcome": "failed" if failed else ("skipped" if skipped else "passed"),
+                "exception": item.stash.get(_exception_key, None) if failed else None,
+                "duration_s": round(time.perf_counter() - begin, 3),
+            })
+            item.stash[_exception_key] = None
+            if not item.stash[retry_pending_key]:
+                break
+            _fold_attempt(item.config, item, len(attempts), attempts[-1]["exception"])
+            for report in reports:
+                if report.failed:
+                    report.outcome = "rerun"
+                item.ihook.pytest_runtest_logreport(report=report)
+            item._initrequest()  # friss fixture kérés a következő próbálkozáshoz
+
+        self.stats[item.nodeid] = attempts
+        _finish_allure(item.config, attempts)
+        for report in reports:
+            if len(attempts) > 1:
+                report.user_properties.append(("attempts", len(attempts)))
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_sessionfinish(self, session):
+        for driver in self.parked.values():
+            _quit_quietly(driver)
+        self.parked.clear()
+        if not self.stats:
+            return
+        directory = os.path.dirname(self.stats_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.stats_path, "w", encoding="utf-8") as file:
+            json.dump({"budget": self.budget, "used": self.used, "denied": self.denied,
+                       "reused_browsers": self.reused, "tests": self.stats}, file, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        retried = {nodeid: attempts for nodeid, attempts in self.stats.items() if len(attempts) > 1}
+        if not retried and not self.denied:
+            return
+        terminalreporter.section("Smart retry")
+        recovered = sum(1 for attempts in retried.values() if attempts[-1]["outcome"] == "passed")
+        terminalreporter.write_line(
+            f"retried: {len(retried)}  recovered: {recovered}  budget used: {self.used}/{self.budget}  "
+            f"denied by budget: {self.denied}  browsers reused: {self.reused}"
+        )
+        for nodeid, attempts in retried.items():
+            history = " -> ".join(attempt["exception"] or attempt["outcome"] for attempt in attempts)
+            terminalreporter.write_line(f"{len(attempts)} attempts  {history}  {nodeid}")
+
+    def pytest_unconfigure(self, config):
+        global _plugin
+        _plugin = None
+
+
+def pytest_configure(config):
+    global _plugin
+    retries = config.getoption("--retries")
+    if retries <= 0:
+        return
+    _plugin = SmartRetryPlugin(retries, config.getoption("--retry-budget"), config.getoption("--retry-stats-file"))
+    config.pluginmanager.register(_plugin, "smart_retry")
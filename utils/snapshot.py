@@ -0,0 +1,175 @@
+"""
+snapshot.py - Egy lekérésből készült, lokálisan kiértékelt oldal pillanatkép
+Egyetlen execute_script hívás visszaadja az outerHTML-t, elemenként a böngésző
+által számolt láthatósággal és form állapottal. A pillanatképen futó
+ellenőrzések (jelenlét, láthatóság, szöveg, attribútum) már nem járnak round-trippel.
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+
+from utils.dom import find_all, parse_html
+
+
+VISIBLE_ATTR = "data-snapshot-visible"
+VALUE_ATTR = "data-snapshot-value"
+CHECKED_ATTR = "data-snapshot-checked"
+
+# A documentElement klónja, elemenként kiegészítve a számolt állapottal.
+# Az eredeti DOM-hoz nem nyúl; a klón querySelectorAll sorrendje megegyezik az eredetiével.
+SNAPSHOT_SCRIPT = """/* pageSnapshot */
+var root = document.documentElement;
+var clone = root.cloneNode(true);
+var originals = [root].concat(Array.prototype.slice.call(root.querySelectorAll('*')));
+var copies = [clone].concat(Array.prototype.slice.call(clone.querySelectorAll('*')));
+for (var i = 0; i < originals.length; i++) {
+  var el = originals[i], copy = copies[i];
+  var style = window.getComputedStyle(el);
+  var visible = style.display !== 'none' && style.visibility !== 'hidden' &&
+                style.opacity !== '0' && el.getClientRects().length > 0;
+  copy.setAttribute('data-snapshot-visible', visible ? '1' : '0');
+  if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA' || el.tagName === 'SELECT') {
+    copy.setAttribute('data-snapshot-value', el.value);
+  }
+  if (el.tagName === 'INPUT') {
+    copy.setAttribute('data-snapshot-checked', el.checked ? '1' : '0');
+  }
+  if (el.tagName === 'OPTION') {
+    if (el.selected) { copy.setAttribute('selected', 'selected'); } else { copy.removeAttribute('selected'); }
+  }
+}
+return {html: clone.outerHTML, url: window.location.href, title: document.title};
+"""
+
+
+class SnapshotElement:
+    """Csak olvasható elem nézet a pillanatképben (WebElement-szerű getterek)"""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        object.__setattr__(self, "_node", node)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SnapshotElement csak olvasható")
+
+    def __repr__(self):
+        return f"<SnapshotElement {self._node.tag} {self._node.attrs}>"
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return self._node.rendered_text()
+
+    def get_attribute(self, name):
+        return self._node.get_attribute(name)
+
+    def get_property(self, name):
+        return self._node.get_property(name)
+
+    def is_displayed(self):
+        return self._node.is_displayed()
+
+    def is_enabled(self):
+        return self._node.is_enabled()
+
+    def is_selected(self):
+        return bool(self._node.get_property("selected") or self._node.get_property("checked"))
+
+
+class PageSnapshot:
+    """
+    Megváltoztathatatlan oldal pillanatkép
+    Ugyanazokat a locator tuple-öket fogadja, mint a BasePage (By.ID, By.CSS_SELECTOR, By.XPATH, By.TAG_NAME, ...)
+    """
+
+    __slots__ = ("url", "title", "_document", "_results")
+
+    def __init__(self, html, url="", title=""):
+        document = parse_html(html)
+        for node in document.iter_descendants():
+            _apply_browser_state(node)
+        object.__setattr__(self, "url", url)
+        object.__setattr__(self, "title", title)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_results", {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PageSnapshot csak olvasható")
+
+    @classmethod
+    def from_script_result(cls, result):
+        """A SNAPSHOT_SCRIPT visszatérési értékéből"""
+        return cls(result["html"], result.get("url", ""), result.get("title", ""))
+
+    def _nodes(self, locator):
+        """Locator kiértékelése - az eredmény gyorsítótárazva, mert a pillanatkép nem változik"""
+        key = tuple(locator)
+        nodes = self._results.get(key)
+        if nodes is None:
+            nodes = find_all(self._document, *locator)
+            self._results[key] = nodes
+        return nodes
+
+    # ===== ELEM KERESÉS =====
+
+    def nodes(self, locator):
+        """Illeszkedő DOM node-ok (eszközökhöz, pl. locator összehasonlítás)"""
+        return list(self._nodes(locator))
+
+    def find_elements(self, locator):
+        return [SnapshotElement(node) for node in self._nodes(locator)]
+
+    def find_element(self, locator):
+        nodes = self._nodes(locator)
+        if not nodes:
+            raise NoSuchElementException(f"Element {locator} nem található a pillanatképben")
+        return SnapshotElement(nodes[0])
+
+    # ===== ELLENŐRZÉSEK (a BasePage metódusok lokális megfelelői) =====
+
+    def is_element_present(self, locator):
+        return bool(self._nodes(locator))
+
+    def is_element_visible(self, locator):
+        nodes = self._nodes(locator)
+        return bool(nodes) and nodes[0].is_displayed()
+
+    def get_text(self, locator):
+        return self.find_element(locator).text
+
+    def get_attribute(self, locator, attribute):
+        return self.find_element(locator).get_attribute(attribute)
+
+    def count(self, locator):
+        return len(self._nodes(locator))
+
+
+def _apply_browser_state(node):
+    """data-snapshot-* attribútumok -> DOM property-k (az attribútumok eltávolításával)"""
+    visible = node.attrs.pop(VISIBLE_ATTR, None)
+    if visible is not None:
+        node.set_property("displayed", visible == "1")
+    value = node.attrs.pop(VALUE_ATTR, None)
+    if value is not None:
+        node.set_property("value", value)
+    checked = node.attrs.pop(CHECKED_ATTR, None)
+    if checked is not None:
+        node.set_property("checked", checked == "1")
+
+
+def browser_state_attributes(node):
+    """
+    A SNAPSHOT_SCRIPT által hozzáadott attribútumok egy Node aktuális állapotából
+    (a fake backend ugyanazt a formátumot állítja elő)
+    """
+    attrs = {VISIBLE_ATTR: "1" if node.is_displayed() else "0"}
+    if node.tag in ("input", "textarea", "select"):
+        attrs[VALUE_ATTR] = node.get_property("value") or ""
+    if node.tag == "input":
+        attrs[CHECKED_ATTR] = "1" if node.get_property("checked") else "0"
+    if node.tag == "option":
+        attrs["selected"] = "selected" if node.get_property("selected") else None
+    return attrs